@@ -3,18 +3,23 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func, case, text
 from typing import List, Optional
 from datetime import datetime, timedelta
+import pandas as pd
 
 from core.database import get_db
-from models.models import Game, Ranking, Team, Prediction, Odds
+from core.cache import cache_response, ttl_for_season
+from models.models import Game, Ranking, Team, Prediction, Odds, TeamSeasonRecord
 from core.config import settings
+from services.records import season_records, head_to_head_records
+from services.betting_edges import load_lines, best_edges
 
 router = APIRouter()
 
 
 @router.get("/power-rankings")
+@cache_response("analytics:power-rankings", ttl=ttl_for_season)
 def get_power_rankings(
     season: int = Query(..., description="Season year"),
-    week: Optional[int] = Query(None, description="Week number"),
+    week: Optional[int] = Query(None, description="Only count games through this week"),
     limit: int = Query(25, le=100),
     db: Session = Depends(get_db)
 ):
@@ -22,39 +27,17 @@ def get_power_rankings(
     # For now, calculate simple win percentage rankings
     # TODO: Add more sophisticated ranking algorithm
 
-    # Subquery to get wins
-    wins_subq = db.query(
-        case(
-            (Game.home_team_id == Team.id, Game.home_team_id),
-            (Game.away_team_id == Team.id, Game.away_team_id)
-        ).label('team_id'),
-        func.count(Game.id).label('wins')
-    ).filter(
-        and_(
-            Game.season_year == season,
-            Game.event_status_completed == 1,
-            or_(
-                and_(Game.home_team_id == Team.id, Game.home_team_winner == 1),
-                and_(Game.away_team_id == Team.id, Game.away_team_winner == 1)
-            )
-        )
-    ).group_by('team_id').subquery()
-
-    # Subquery to get total games
-    games_subq = db.query(
-        case(
-            (Game.home_team_id == Team.id, Game.home_team_id),
-            (Game.away_team_id == Team.id, Game.away_team_id)
-        ).label('team_id'),
-        func.count(Game.id).label('total_games')
-    ).filter(
-        and_(
-            Game.season_year == season,
-            Game.event_status_completed == 1
-        )
-    ).group_by('team_id').subquery()
+    if week is None:
+        # Current records are precomputed by the ingest pipeline (data/team_records.py)
+        records = {
+            r.team_id: r for r in db.query(TeamSeasonRecord).filter(
+                TeamSeasonRecord.season == season
+            ).all()
+        }
+    else:
+        # As-of-week records need one grouped pass over games
+        records = {r.team_id: r for r in season_records(db, season, week)}
 
-    # Get teams with their records
     teams = db.query(
         Team.id,
         Team.displayName,
@@ -65,31 +48,21 @@ def get_power_rankings(
 
     rankings = []
     for team in teams:
-        wins = db.execute(
-            text(f"SELECT COUNT(*) FROM games WHERE season_year = {season} "
-            f"AND event_status_completed = 1 "
-            f"AND ((home_team_id = '{team.id}' AND home_team_winner = 1) "
-            f"OR (away_team_id = '{team.id}' AND away_team_winner = 1))")
-        ).scalar()
-
-        total = db.execute(
-            text(f"SELECT COUNT(*) FROM games WHERE season_year = {season} "
-            f"AND event_status_completed = 1 "
-            f"AND (home_team_id = '{team.id}' OR away_team_id = '{team.id}')")
-        ).scalar()
+        record = records.get(team.id)
+        if record is None or record.games == 0:
+            continue
 
-        if total > 0:
-            win_pct = wins / total
-            rankings.append({
-                "team_id": team.id,
-                "team_name": team.displayName,
-                "abbreviation": team.abbreviation,
-                "wins": wins,
-                "losses": total - wins,
-                "win_percentage": round(win_pct, 3),
-                "color": team.color,
-                "alternateColor": team.alternateColor
-            })
+        win_pct = record.wins / record.games
+        rankings.append({
+            "team_id": team.id,
+            "team_name": team.displayName,
+            "abbreviation": team.abbreviation,
+            "wins": record.wins,
+            "losses": record.games - record.wins,
+            "win_percentage": round(win_pct, 3),
+            "color": team.color,
+            "alternateColor": team.alternateColor
+        })
 
     # Sort by win percentage
     rankings.sort(key=lambda x: x['win_percentage'], reverse=True)
@@ -102,6 +75,7 @@ def get_power_rankings(
 
 
 @router.get("/ap-poll")
+@cache_response("analytics:ap-poll", ttl=ttl_for_season)
 def get_ap_poll(
     season: int = Query(..., description="Season year"),
     week: Optional[int] = Query(None, description="Week number"),
@@ -149,153 +123,113 @@ def get_ap_poll(
 
 
 @router.get("/conference-standings")
+@cache_response("analytics:conference-standings", ttl=ttl_for_season)
 def get_conference_standings(
-    conference: str = Query(..., description="Conference slug"),
+    conference: str = Query(..., description="Conference slug, or 'all' for every conference"),
     season: int = Query(..., description="Season year"),
     db: Session = Depends(get_db)
 ):
-    """Get conference standings"""
-    # Get all teams in the conference
-    teams_in_conf = db.query(Game.home_team_id).filter(
-        and_(
-            Game.season_year == season,
-            Game.home_team_conference_slug == conference
-        )
-    ).distinct().all()
-
-    team_ids = [t[0] for t in teams_in_conf]
+    """
+    Get conference standings.
+
+    Ranked by conference win percentage, then conference point
+    differential. Each team also carries its head-to-head record against
+    every conference opponent so clients can apply their own tiebreakers.
+    With conference=all every conference is returned in one response,
+    ranked within its conference.
+    """
+    conference_slug = None if conference == "all" else conference
+
+    # One indexed range scan over precomputed records (data/team_records.py)
+    query = db.query(TeamSeasonRecord, Team).join(
+        Team, TeamSeasonRecord.team_id == Team.id
+    ).filter(TeamSeasonRecord.season == season)
+    if conference_slug is not None:
+        query = query.filter(TeamSeasonRecord.conference_slug == conference_slug)
+    records = query.all()
+
+    # One grouped query for every conference matchup
+    head_to_head = {}
+    for row in head_to_head_records(db, season, conference_slug):
+        head_to_head.setdefault(row.team_id, {})[row.opponent_id] = row
 
     standings = []
-    for team_id in team_ids:
-        # Get team info
-        team = db.query(Team).filter(Team.id == team_id).first()
-        if not team:
+    for record, team in records:
+        if record.conference_slug is None:
             continue
 
-        # Calculate conference record
-        conf_games = db.query(Game).filter(
-            and_(
-                Game.season_year == season,
-                Game.event_status_completed == 1,
-                Game.is_conference_competition == 1,
-                or_(Game.home_team_id == team_id, Game.away_team_id == team_id)
-            )
-        ).all()
-
-        conf_wins = 0
-        conf_losses = 0
-        for game in conf_games:
-            if game.home_team_id == team_id:
-                if game.home_team_winner == 1:
-                    conf_wins += 1
-                else:
-                    conf_losses += 1
-            else:
-                if game.away_team_winner == 1:
-                    conf_wins += 1
-                else:
-                    conf_losses += 1
-
-        # Calculate overall record
-        all_games = db.query(Game).filter(
-            and_(
-                Game.season_year == season,
-                Game.event_status_completed == 1,
-                or_(Game.home_team_id == team_id, Game.away_team_id == team_id)
-            )
-        ).all()
-
-        overall_wins = 0
-        overall_losses = 0
-        for game in all_games:
-            if game.home_team_id == team_id:
-                if game.home_team_winner == 1:
-                    overall_wins += 1
-                else:
-                    overall_losses += 1
-            else:
-                if game.away_team_winner == 1:
-                    overall_wins += 1
-                else:
-                    overall_losses += 1
-
-        conf_win_pct = conf_wins / (conf_wins + conf_losses) if (conf_wins + conf_losses) > 0 else 0
+        conf_games = record.conference_wins + record.conference_losses
+        conf_win_pct = record.conference_wins / conf_games if conf_games > 0 else 0
+        matchups = head_to_head.get(team.id, {})
 
         standings.append({
             "team_id": team.id,
             "team_name": team.displayName,
             "abbreviation": team.abbreviation,
-            "conference_wins": conf_wins,
-            "conference_losses": conf_losses,
+            "conference": record.conference_slug,
+            "conference_wins": record.conference_wins,
+            "conference_losses": record.conference_losses,
             "conference_win_pct": round(conf_win_pct, 3),
-            "overall_wins": overall_wins,
-            "overall_losses": overall_losses
+            "conference_point_differential": sum(
+                m.points_for - m.points_against for m in matchups.values()
+            ),
+            "overall_wins": record.wins,
+            "overall_losses": record.losses,
+            "point_differential": record.points_for - record.points_against,
+            "head_to_head": {
+                opponent_id: {"wins": m.wins, "losses": m.games - m.wins}
+                for opponent_id, m in matchups.items()
+            }
         })
 
-    # Sort by conference win percentage
-    standings.sort(key=lambda x: x['conference_win_pct'], reverse=True)
+    # Sort by conference, then win percentage with point differential as tiebreak
+    standings.sort(key=lambda x: (
+        x['conference'], -x['conference_win_pct'], -x['conference_point_differential']
+    ))
 
-    # Add rank
+    # Add rank within each conference
+    rank = 0
     for i, team in enumerate(standings):
-        team['rank'] = i + 1
+        if i == 0 or team['conference'] != standings[i - 1]['conference']:
+            rank = 0
+        rank += 1
+        team['rank'] = rank
 
     return standings
 
 
 @router.get("/betting-edges")
+@cache_response("analytics:betting-edges", ttl=settings.CACHE_TTL_GAMES_TODAY)
 def get_betting_edges(
     date: Optional[str] = Query(None, description="Date filter (YYYY-MM-DD)"),
     min_edge: float = Query(5.0, description="Minimum edge percentage"),
     db: Session = Depends(get_db)
 ):
-    """Find games where prediction disagrees with betting line"""
-    query = db.query(Game, Prediction, Odds).join(
-        Prediction, Game.id == Prediction.event_id
-    ).join(
-        Odds, Game.id == Odds.event_id
-    ).filter(
-        Game.event_status_completed == 0
-    )
-
-    if date:
-        query = query.filter(Game.date.like(f"{date}%"))
-    else:
-        # Default to upcoming games
-        today = datetime.now().strftime("%Y-%m-%d")
-        query = query.filter(Game.date >= today)
-
-    results = query.all()
-
-    edges = []
-    for game, prediction, odds in results:
-        # Calculate implied probability from moneyline
-        if odds.home_team_moneyline and odds.away_team_moneyline:
-            home_implied = (
-                abs(odds.home_team_moneyline) / (abs(odds.home_team_moneyline) + 100) * 100
-                if odds.home_team_moneyline < 0
-                else 100 / (odds.home_team_moneyline + 100) * 100
-            )
-
-            # Compare with prediction
-            if prediction.homeTeam_gameProjection:
-                pred_home_pct = prediction.homeTeam_gameProjection * 100
-                edge = abs(pred_home_pct - home_implied)
-
-                if edge >= min_edge:
-                    edges.append({
-                        "game_id": game.id,
-                        "date": game.date,
-                        "home_team": game.home_team_displayName,
-                        "away_team": game.away_team_displayName,
-                        "prediction_home_win_pct": round(pred_home_pct, 1),
-                        "implied_home_win_pct": round(home_implied, 1),
-                        "edge": round(edge, 1),
-                        "recommended_bet": "home" if pred_home_pct > home_implied else "away",
-                        "home_moneyline": odds.home_team_moneyline,
-                        "away_moneyline": odds.away_team_moneyline
-                    })
-
-    # Sort by edge
-    edges.sort(key=lambda x: x['edge'], reverse=True)
-
-    return edges
+    """
+    Best bet per game where the prediction disagrees with the market.
+
+    Every provider's moneyline, spread and total is de-vigged and compared
+    with the prediction; edge is the gap in percentage points for the best
+    side, and provider is the one whose line gives that side the largest
+    de-vigged edge.
+    """
+    today = datetime.now().strftime("%Y-%m-%d")
+    edges = best_edges(load_lines(db, date=date, today=today), min_edge=min_edge)
+
+    return [
+        {
+            "game_id": row.game_id,
+            "date": row.date,
+            "home_team": row.home_team,
+            "away_team": row.away_team,
+            "market": row.market,
+            "side": row.side,
+            "line": None if pd.isna(row.line) else float(row.line),
+            "price": int(row.price),
+            "provider": row.provider,
+            "model_pct": round(row.model_prob * 100, 1),
+            "market_pct": round(row.market_prob * 100, 1),
+            "edge": round(row.edge * 100, 1)
+        }
+        for row in edges.itertuples()
+    ]
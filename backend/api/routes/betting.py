@@ -4,14 +4,18 @@ from sqlalchemy import and_, or_, desc
 from typing import List, Optional
 from datetime import datetime
 
-from core.database import get_db
+from core.database import get_db, starts_with
+from core.cache import cache_response
+from core.config import settings
 from models.models import Odds, Game
 from schemas.game import OddsResponse
+from services.line_movement import LINE_COLUMNS, line_changes
 
 router = APIRouter()
 
 
 @router.get("/lines")
+@cache_response("betting:lines", ttl=settings.CACHE_TTL_GAMES_TODAY)
 def get_betting_lines(
     date: Optional[str] = Query(None, description="Date filter (YYYY-MM-DD)"),
     provider: Optional[str] = Query(None, description="Sportsbook provider name"),
@@ -23,11 +27,11 @@ def get_betting_lines(
     )
 
     if date:
-        query = query.filter(Game.date.like(f"{date}%"))
+        query = query.filter(starts_with(Game.date, date))
     else:
         # Default to today
         today = datetime.now().strftime("%Y-%m-%d")
-        query = query.filter(Game.date.like(f"{today}%"))
+        query = query.filter(starts_with(Game.date, today))
 
     if provider:
         query = query.filter(Odds.provider_name.like(f"%{provider}%"))
@@ -59,21 +63,68 @@ def get_betting_lines(
 
 
 @router.get("/movers")
+@cache_response("betting:movers", ttl=settings.CACHE_TTL_GAMES_TODAY)
 def get_line_movers(
-    hours: int = Query(24, description="Time window in hours"),
-    min_movement: float = Query(2.0, description="Minimum line movement"),
+    hours: int = Query(24, ge=1, le=24 * 30, description="Time window in hours"),
+    min_movement: float = Query(2.0, description="Minimum spread or total movement (points)"),
+    min_moneyline_movement: int = Query(20, description="Minimum moneyline movement"),
     db: Session = Depends(get_db)
 ):
-    """Get games with significant line movement"""
-    # This is a placeholder - would need historical odds data to implement properly
-    # For now, return empty list
+    """Get games whose spread, total or moneyline moved within the window"""
+    moved = []
+    for line in line_changes(db, hours):
+        movement = {}
+        for column in LINE_COLUMNS:
+            opening = getattr(line, f"{column}_open")
+            current = getattr(line, f"{column}_current")
+            movement[column] = {
+                "open": opening,
+                "current": current,
+                "movement": round(current - opening, 2) if opening is not None and current is not None else 0
+            }
+        points = max(abs(movement["spread"]["movement"]), abs(movement["over_under"]["movement"]))
+        moneyline = max(abs(movement["home_moneyline"]["movement"]), abs(movement["away_moneyline"]["movement"]))
+        if points >= min_movement or moneyline >= min_moneyline_movement:
+            moved.append((line, movement, points, moneyline))
+
+    event_ids = {line.event_id for line, *_ in moved}
+    games = {
+        game.id: game
+        for game in db.query(Game).filter(Game.id.in_(event_ids))
+    } if event_ids else {}
+    providers = {
+        (odds.event_id, str(odds.provider_id)): odds.provider_name
+        for odds in db.query(Odds.event_id, Odds.provider_id, Odds.provider_name).filter(Odds.event_id.in_(event_ids))
+    } if event_ids else {}
+
+    # Biggest point moves first, then moneyline moves
+    moved.sort(key=lambda mover: (mover[2], mover[3]), reverse=True)
+
+    movers = []
+    for line, movement, _, _ in moved:
+        game = games.get(line.event_id)
+        if not game:
+            continue
+        movers.append({
+            "event_id": game.id,
+            "date": game.date,
+            "home_team": game.home_team_displayName,
+            "away_team": game.away_team_displayName,
+            "provider_id": line.provider_id,
+            "provider": providers.get((line.event_id, line.provider_id)),
+            **movement
+        })
+
     return {
-        "message": "Line movement tracking requires historical odds data",
-        "movers": []
+        "hours": hours,
+        "min_movement": min_movement,
+        "min_moneyline_movement": min_moneyline_movement,
+        "movers": movers
     }
 
 
 @router.get("/providers")
+@cache_response("betting:providers", ttl=settings.CACHE_TTL_HISTORICAL)
 def get_sportsbook_providers(
     db: Session = Depends(get_db)
 ):
@@ -90,6 +141,7 @@ def get_sportsbook_providers(
 
 
 @router.get("/compare/{game_id}")
+@cache_response("betting:compare", ttl=settings.CACHE_TTL_GAMES_TODAY)
 def compare_sportsbooks(
     game_id: str,
     db: Session = Depends(get_db)
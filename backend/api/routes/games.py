@@ -3,9 +3,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc
 from typing import List, Optional
 from datetime import datetime
-import json
 
-from core.database import get_db
+from core.database import get_db, starts_with
+from core.cache import cache_response, ttl_for_date
 from models.models import Game, TeamBoxscore, PlayerBoxscore, Prediction, Odds
 from schemas.game import (
     GameSummary, GameDetail, GameBoxscore,
@@ -13,11 +13,16 @@ from schemas.game import (
     PredictionResponse, OddsResponse
 )
 from core.config import settings
+from core.pagination import Page, paginate
 
 router = APIRouter()
 
+# Only the columns GameSummary needs, so list queries skip the JSON blobs
+SUMMARY_COLUMNS = [getattr(Game, name) for name in GameSummary.model_fields]
 
-@router.get("/", response_model=List[GameSummary])
+
+@router.get("/", response_model=Page[GameSummary])
+@cache_response("games:list", ttl=ttl_for_date, model=Page[GameSummary])
 def get_games(
     db: Session = Depends(get_db),
     date: Optional[str] = Query(None, description="Date filter (YYYY-MM-DD)"),
@@ -25,15 +30,15 @@ def get_games(
     team_id: Optional[str] = Query(None, description="Team ID"),
     conference: Optional[str] = Query(None, description="Conference slug"),
     completed: Optional[bool] = Query(None, description="Filter by completion status"),
-    limit: int = Query(50, le=settings.MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0)
+    limit: int = Query(50, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
 ):
-    """Get games with optional filters"""
-    query = db.query(Game)
+    """Get games with optional filters, most recent first"""
+    query = db.query(*SUMMARY_COLUMNS)
 
     # Apply filters
     if date:
-        query = query.filter(Game.date.like(f"{date}%"))
+        query = query.filter(starts_with(Game.date, date))
 
     if season:
         query = query.filter(Game.season_year == season)
@@ -54,43 +59,12 @@ def get_games(
     if completed is not None:
         query = query.filter(Game.event_status_completed == (1 if completed else 0))
 
-    # Order by date descending (most recent first)
-    query = query.order_by(desc(Game.date))
-
-    # Pagination
-    games = query.offset(offset).limit(limit).all()
-
-    # Parse logos for each game
-    result = []
-    for game in games:
-        game_dict = game.__dict__.copy()
-
-        # Parse home team logo
-        if game.home_team_logos:
-            try:
-                logos = json.loads(game.home_team_logos)
-                game_dict['home_team_logo'] = logos[0]['href'] if logos else None
-            except:
-                game_dict['home_team_logo'] = None
-        else:
-            game_dict['home_team_logo'] = None
-
-        # Parse away team logo
-        if game.away_team_logos:
-            try:
-                logos = json.loads(game.away_team_logos)
-                game_dict['away_team_logo'] = logos[0]['href'] if logos else None
-            except:
-                game_dict['away_team_logo'] = None
-        else:
-            game_dict['away_team_logo'] = None
-
-        result.append(GameSummary(**game_dict))
-
-    return result
+    # Most recent first; id breaks ties between games at the same time
+    return paginate(query, [Game.date, Game.id], limit, cursor, descending=True)
 
 
 @router.get("/today", response_model=List[GameSummary])
+@cache_response("games:today", ttl=settings.CACHE_TTL_GAMES_TODAY, model=List[GameSummary])
 def get_today_games(
     db: Session = Depends(get_db)
 ):
@@ -98,42 +72,14 @@ def get_today_games(
     today = datetime.now().strftime("%Y-%m-%d")
 
     # Query today's games directly
-    query = db.query(Game)
-    query = query.filter(Game.date.like(f"{today}%"))
+    query = db.query(*SUMMARY_COLUMNS)
+    query = query.filter(starts_with(Game.date, today))
     query = query.order_by(desc(Game.date))
-    games = query.limit(50).all()
-
-    # Parse logos for each game
-    result = []
-    for game in games:
-        game_dict = game.__dict__.copy()
-
-        # Parse home team logo
-        if game.home_team_logos:
-            try:
-                logos = json.loads(game.home_team_logos)
-                game_dict['home_team_logo'] = logos[0]['href'] if logos else None
-            except:
-                game_dict['home_team_logo'] = None
-        else:
-            game_dict['home_team_logo'] = None
-
-        # Parse away team logo
-        if game.away_team_logos:
-            try:
-                logos = json.loads(game.away_team_logos)
-                game_dict['away_team_logo'] = logos[0]['href'] if logos else None
-            except:
-                game_dict['away_team_logo'] = None
-        else:
-            game_dict['away_team_logo'] = None
-
-        result.append(GameSummary(**game_dict))
-
-    return result
+    return query.limit(50).all()
 
 
 @router.get("/{game_id}", response_model=GameDetail)
+@cache_response("games:detail", model=GameDetail)
 def get_game(
     game_id: str,
     db: Session = Depends(get_db)
@@ -165,7 +111,7 @@ def get_game_boxscore(
         PlayerBoxscore.event_id == game_id
     ).order_by(
         PlayerBoxscore.athlete_starter.desc(),
-        PlayerBoxscore.PTS.desc()
+        PlayerBoxscore.points.desc()
     ).all()
 
     return {
@@ -176,6 +122,7 @@ def get_game_boxscore(
 
 
 @router.get("/{game_id}/predictions", response_model=PredictionResponse)
+@cache_response("games:predictions", model=PredictionResponse)
 def get_game_predictions(
     game_id: str,
     db: Session = Depends(get_db)
@@ -192,6 +139,7 @@ def get_game_predictions(
 
 
 @router.get("/{game_id}/odds", response_model=List[OddsResponse])
+@cache_response("games:odds", model=List[OddsResponse])
 def get_game_odds(
     game_id: str,
     db: Session = Depends(get_db)
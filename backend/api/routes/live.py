@@ -0,0 +1,82 @@
+import json
+import asyncio
+
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from core.config import settings
+from core.live import live_hub
+
+router = APIRouter()
+
+
+async def next_message(subscriber):
+    """
+    Wait for the subscriber's next message: ("delta", games), ("snapshot", games)
+    after it fell behind, or None when the heartbeat interval passes quietly.
+    """
+    try:
+        deltas = await asyncio.wait_for(subscriber.queue.get(), settings.LIVE_HEARTBEAT_SECONDS)
+    except asyncio.TimeoutError:
+        return None
+    if subscriber.resync:
+        subscriber.resync = False
+        return "snapshot", live_hub.snapshot()
+    return "delta", deltas
+
+
+@router.get("/scores")
+async def stream_scores(request: Request):
+    """
+    Server-Sent Events stream of today's live scores.
+
+    Sends a "snapshot" event with the live fields of every game today, then a
+    "delta" event per batch of changes (game id plus the fields that changed).
+    Clients load /games/today once and merge deltas instead of polling it.
+    """
+    subscriber = live_hub.subscribe()
+
+    async def events():
+        try:
+            yield f"event: snapshot\ndata: {json.dumps(live_hub.snapshot())}\n\n"
+            while not await request.is_disconnected():
+                message = await next_message(subscriber)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                event, games = message
+                yield f"event: {event}\ndata: {json.dumps(games)}\n\n"
+        finally:
+            live_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def scores_websocket(websocket: WebSocket):
+    """WebSocket variant of /scores: {"type": "snapshot" | "delta", "games": [...]} messages"""
+    await websocket.accept()
+    subscriber = live_hub.subscribe()
+    try:
+        await websocket.send_json({"type": "snapshot", "games": live_hub.snapshot()})
+        while True:
+            message = await next_message(subscriber)
+            if message is None:
+                await websocket.send_json({"type": "ping"})
+                continue
+            event, games = message
+            await websocket.send_json({"type": event, "games": games})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        live_hub.unsubscribe(subscriber)
+
+
+@router.get("/stats")
+async def live_stats():
+    """Connected clients and deltas published"""
+    return live_hub.stats()
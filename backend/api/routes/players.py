@@ -4,39 +4,45 @@ from sqlalchemy import and_, or_, desc, func
 from typing import List, Optional
 
 from core.database import get_db
+from core.cache import cache_response, ttl_for_season
 from models.models import Player, PlayerSeason, PlayerBoxscore, Game
 from schemas.player import PlayerResponse, PlayerSeasonResponse, PlayerGameLog
 from core.config import settings
+from core.pagination import Page, paginate
+from services.search import search_ids, fetch_in_order
 
 router = APIRouter()
 
+# Only the columns PlayerResponse needs
+PLAYER_COLUMNS = [getattr(Player, name) for name in PlayerResponse.model_fields]
 
-@router.get("/", response_model=List[PlayerResponse])
+
+@router.get("/", response_model=Page[PlayerResponse])
+@cache_response("players:list", model=Page[PlayerResponse])
 def get_players(
     db: Session = Depends(get_db),
     search: Optional[str] = Query(None, description="Search by name"),
-    limit: int = Query(100, le=settings.MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0)
+    limit: int = Query(100, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
 ):
-    """Get all players with optional filters"""
-    query = db.query(Player)
+    """
+    Get all players with optional filters.
 
+    With search, returns one page of the best matches (ranked, typo
+    tolerant) and no next_cursor.
+    """
     if search:
-        query = query.filter(
-            or_(
-                Player.displayName.like(f"%{search}%"),
-                Player.firstName.like(f"%{search}%"),
-                Player.lastName.like(f"%{search}%")
-            )
-        )
+        ids = search_ids(db, "players", search, limit)
+        return {"items": fetch_in_order(db, PLAYER_COLUMNS, Player.id, ids), "next_cursor": None}
 
-    query = query.order_by(Player.displayName)
-    players = query.offset(offset).limit(limit).all()
+    query = db.query(*PLAYER_COLUMNS)
 
-    return players
+    # Order by display name; id breaks ties between equal names
+    return paginate(query, [Player.displayName, Player.id], limit, cursor)
 
 
 @router.get("/{player_id}", response_model=PlayerResponse)
+@cache_response("players:detail", model=PlayerResponse)
 def get_player(
     player_id: str,
     db: Session = Depends(get_db)
@@ -51,6 +57,7 @@ def get_player(
 
 
 @router.get("/{player_id}/seasons", response_model=List[PlayerSeasonResponse])
+@cache_response("players:seasons", model=List[PlayerSeasonResponse])
 def get_player_seasons(
     player_id: str,
     db: Session = Depends(get_db)
@@ -67,6 +74,7 @@ def get_player_seasons(
 
 
 @router.get("/{player_id}/gamelog")
+@cache_response("players:gamelog", ttl=ttl_for_season)
 def get_player_gamelog(
     player_id: str,
     season: int = Query(..., description="Season year"),
@@ -125,6 +133,7 @@ def get_player_gamelog(
 
 
 @router.get("/{player_id}/stats")
+@cache_response("players:stats", ttl=ttl_for_season)
 def get_player_stats(
     player_id: str,
     season: int = Query(..., description="Season year"),
@@ -136,8 +145,16 @@ def get_player_stats(
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    # Get all games for the season
-    stats = db.query(PlayerBoxscore).join(
+    # Sum the integer stat columns for the season in one query
+    stats = db.query(
+        func.count(PlayerBoxscore.event_id).label('games_played'),
+        func.coalesce(func.sum(PlayerBoxscore.points), 0).label('total_points'),
+        func.coalesce(func.sum(PlayerBoxscore.rebounds), 0).label('total_rebounds'),
+        func.coalesce(func.sum(PlayerBoxscore.assists), 0).label('total_assists'),
+        func.coalesce(func.sum(PlayerBoxscore.steals), 0).label('total_steals'),
+        func.coalesce(func.sum(PlayerBoxscore.blocks), 0).label('total_blocks'),
+        func.coalesce(func.sum(PlayerBoxscore.turnovers), 0).label('total_turnovers')
+    ).join(
         Game, PlayerBoxscore.event_id == Game.id
     ).filter(
         and_(
@@ -145,9 +162,10 @@ def get_player_stats(
             Game.season_year == season,
             Game.event_status_completed == 1
         )
-    ).all()
+    ).one()
 
-    if not stats:
+    games_played = stats.games_played
+    if games_played == 0:
         return {
             "player_id": player_id,
             "season": season,
@@ -155,37 +173,17 @@ def get_player_stats(
             "message": "No stats found for this season"
         }
 
-    # Calculate aggregates
-    games_played = len(stats)
-    total_points = 0
-    total_rebounds = 0
-    total_assists = 0
-    total_steals = 0
-    total_blocks = 0
-    total_turnovers = 0
-
-    for stat in stats:
-        try:
-            total_points += int(stat.PTS) if stat.PTS else 0
-            total_rebounds += int(stat.REB) if stat.REB else 0
-            total_assists += int(stat.AST) if stat.AST else 0
-            total_steals += int(stat.STL) if stat.STL else 0
-            total_blocks += int(stat.BLK) if stat.BLK else 0
-            total_turnovers += int(stat.TO) if stat.TO else 0
-        except ValueError:
-            continue
-
     return {
         "player_id": player_id,
         "season": season,
         "games_played": games_played,
-        "points_per_game": round(total_points / games_played, 1),
-        "rebounds_per_game": round(total_rebounds / games_played, 1),
-        "assists_per_game": round(total_assists / games_played, 1),
-        "steals_per_game": round(total_steals / games_played, 1),
-        "blocks_per_game": round(total_blocks / games_played, 1),
-        "turnovers_per_game": round(total_turnovers / games_played, 1),
-        "total_points": total_points,
-        "total_rebounds": total_rebounds,
-        "total_assists": total_assists
+        "points_per_game": round(stats.total_points / games_played, 1),
+        "rebounds_per_game": round(stats.total_rebounds / games_played, 1),
+        "assists_per_game": round(stats.total_assists / games_played, 1),
+        "steals_per_game": round(stats.total_steals / games_played, 1),
+        "blocks_per_game": round(stats.total_blocks / games_played, 1),
+        "turnovers_per_game": round(stats.total_turnovers / games_played, 1),
+        "total_points": stats.total_points,
+        "total_rebounds": stats.total_rebounds,
+        "total_assists": stats.total_assists
     }
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List
+
+from core.database import get_db
+from core.cache import cache_response
+from models.models import Team, Player
+from schemas.search import SearchSuggestion
+from services.search import search_ids, fetch_in_order
+
+router = APIRouter()
+
+
+@router.get("/autocomplete", response_model=List[SearchSuggestion])
+@cache_response("search:autocomplete", model=List[SearchSuggestion])
+def autocomplete(
+    q: str = Query(..., min_length=1, description="What the user has typed so far"),
+    limit: int = Query(8, ge=1, le=25),
+    db: Session = Depends(get_db)
+):
+    """
+    Teams and players whose names start with what has been typed, teams
+    first. Close misspellings of longer words still match.
+    """
+    team_ids = search_ids(db, "teams", q, limit)
+    teams = fetch_in_order(db, [Team.id, Team.displayName, Team.abbreviation], Team.id, team_ids)
+    suggestions = [
+        {"type": "team", "id": team.id, "name": team.displayName, "detail": team.abbreviation}
+        for team in teams
+    ]
+
+    remaining = limit - len(suggestions)
+    if remaining:
+        player_ids = search_ids(db, "players", q, remaining)
+        players = fetch_in_order(db, [Player.id, Player.displayName, Player.jersey], Player.id, player_ids)
+        suggestions += [
+            {
+                "type": "player",
+                "id": player.id,
+                "name": player.displayName,
+                "detail": f"#{player.jersey}" if player.jersey else None
+            }
+            for player in players
+        ]
+
+    return suggestions
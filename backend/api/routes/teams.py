@@ -1,45 +1,50 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, or_, and_, desc, Integer
+from sqlalchemy import func, or_, and_, desc
 from typing import List, Optional
 import json
 
 from core.database import get_db
-from models.models import Team, Game, PlayerSeason, PlayerBoxscore
+from core.cache import cache_response, ttl_for_season
+from models.models import Team, Game, PlayerSeason, PlayerBoxscore, TeamSeasonRecord
 from schemas.team import TeamResponse, TeamScheduleGame, TeamRoster, TeamWithStats
 from core.config import settings
+from core.pagination import Page, paginate
+from services.search import search_ids, fetch_in_order
 
 router = APIRouter()
 
+# Only the columns TeamResponse needs
+TEAM_COLUMNS = [getattr(Team, name) for name in TeamResponse.model_fields]
 
-@router.get("/", response_model=List[TeamResponse])
+
+@router.get("/", response_model=Page[TeamResponse])
+@cache_response("teams:list", ttl=settings.CACHE_TTL_HISTORICAL, model=Page[TeamResponse])
 def get_teams(
     db: Session = Depends(get_db),
     search: Optional[str] = Query(None, description="Search by name or location"),
     conference: Optional[str] = Query(None, description="Filter by conference slug"),
-    limit: int = Query(100, le=settings.MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0)
+    limit: int = Query(100, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
 ):
-    """Get all teams with optional filters"""
-    query = db.query(Team)
+    """
+    Get all teams with optional filters.
 
+    With search, returns one page of the best matches (ranked, typo
+    tolerant) and no next_cursor.
+    """
     if search:
-        query = query.filter(
-            or_(
-                Team.displayName.like(f"%{search}%"),
-                Team.location.like(f"%{search}%"),
-                Team.nickname.like(f"%{search}%")
-            )
-        )
+        ids = search_ids(db, "teams", search, limit)
+        return {"items": fetch_in_order(db, TEAM_COLUMNS, Team.id, ids), "next_cursor": None}
 
-    # Order by display name
-    query = query.order_by(Team.displayName)
+    query = db.query(*TEAM_COLUMNS)
 
-    teams = query.offset(offset).limit(limit).all()
-    return teams
+    # Order by display name; id breaks ties between equal names
+    return paginate(query, [Team.displayName, Team.id], limit, cursor)
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
+@cache_response("teams:detail", ttl=settings.CACHE_TTL_HISTORICAL, model=TeamResponse)
 def get_team(
     team_id: str,
     db: Session = Depends(get_db)
@@ -54,6 +59,7 @@ def get_team(
 
 
 @router.get("/{team_id}/schedule")
+@cache_response("teams:schedule", ttl=ttl_for_season)
 def get_team_schedule(
     team_id: str,
     season: int = Query(..., description="Season year"),
@@ -111,6 +117,7 @@ def get_team_schedule(
 
 
 @router.get("/{team_id}/roster")
+@cache_response("teams:roster", ttl=ttl_for_season)
 def get_team_roster(
     team_id: str,
     season: str = Query(..., description="Season year"),
@@ -133,6 +140,7 @@ def get_team_roster(
 
 
 @router.get("/{team_id}/stats")
+@cache_response("teams:stats", ttl=ttl_for_season)
 def get_team_stats(
     team_id: str,
     season: int = Query(..., description="Season year"),
@@ -144,72 +152,36 @@ def get_team_stats(
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    # Get completed games
-    games = db.query(Game).filter(
+    # Precomputed by the ingest pipeline (data/team_records.py)
+    record = db.query(TeamSeasonRecord).filter(
         and_(
-            Game.season_year == season,
-            Game.event_status_completed == 1,
-            or_(Game.home_team_id == team_id, Game.away_team_id == team_id)
+            TeamSeasonRecord.season == season,
+            TeamSeasonRecord.team_id == team_id
+        )
+    ).first()
+
+    if not record:
+        # No games yet this season
+        record = TeamSeasonRecord(
+            games=0, wins=0, losses=0, conference_wins=0, conference_losses=0,
+            home_wins=0, home_losses=0, away_wins=0, away_losses=0,
+            points_for=0, points_against=0
         )
-    ).all()
-
-    # Calculate stats
-    wins = 0
-    losses = 0
-    conf_wins = 0
-    conf_losses = 0
-    points_for = 0
-    points_against = 0
-    home_wins = 0
-    away_wins = 0
-    home_games = 0
-    away_games = 0
-
-    for game in games:
-        is_home = game.home_team_id == team_id
-        is_conference = game.is_conference_competition == 1
-
-        if is_home:
-            won = game.home_team_winner == 1
-            score = game.home_team_score or 0
-            opp_score = game.away_team_score or 0
-            home_games += 1
-        else:
-            won = game.away_team_winner == 1
-            score = game.away_team_score or 0
-            opp_score = game.home_team_score or 0
-            away_games += 1
-
-        if won:
-            wins += 1
-            if is_home:
-                home_wins += 1
-            else:
-                away_wins += 1
-            if is_conference:
-                conf_wins += 1
-        else:
-            losses += 1
-            if is_conference:
-                conf_losses += 1
-
-        points_for += score
-        points_against += opp_score
 
-    total_games = len(games)
-    ppg = round(points_for / total_games, 1) if total_games > 0 else 0
-    opp_ppg = round(points_against / total_games, 1) if total_games > 0 else 0
+    total_games = record.games
+    ppg = round(record.points_for / total_games, 1) if total_games > 0 else 0
+    opp_ppg = round(record.points_against / total_games, 1) if total_games > 0 else 0
 
     return {
         "team_id": team_id,
         "season": season,
-        "wins": wins,
-        "losses": losses,
-        "win_percentage": round(wins / total_games, 3) if total_games > 0 else 0,
-        "conference_wins": conf_wins,
-        "conference_losses": conf_losses,
-        "home_record": f"{home_wins}-{home_games - home_wins}",
-        "away_record": f"{away_wins}-{away_games - away_wins}",
+        "wins": record.wins,
+        "losses": record.losses,
+        "win_percentage": round(record.wins / total_games, 3) if total_games > 0 else 0,
+        "conference_wins": record.conference_wins,
+        "conference_losses": record.conference_losses,
+        "home_record": f"{record.home_wins}-{record.home_losses}",
+        "away_record": f"{record.away_wins}-{record.away_losses}",
         "points_per_game": ppg,
         "opponent_points_per_game": opp_ppg,
         "point_differential": round(ppg - opp_ppg, 1),
@@ -218,6 +190,7 @@ def get_team_stats(
 
 
 @router.get("/{team_id}/player-stats")
+@cache_response("teams:player-stats", ttl=ttl_for_season)
 def get_team_player_stats(
     team_id: str,
     season: int = Query(..., description="Season year"),
@@ -238,42 +211,12 @@ def get_team_player_stats(
         PlayerBoxscore.athlete_jersey,
         PlayerBoxscore.athlete_position_abbreviation,
         func.count(PlayerBoxscore.event_id).label('games_played'),
-        func.sum(
-            case(
-                (PlayerBoxscore.PTS != None, func.cast(PlayerBoxscore.PTS, Integer)),
-                else_=0
-            )
-        ).label('total_points'),
-        func.sum(
-            case(
-                (PlayerBoxscore.REB != None, func.cast(PlayerBoxscore.REB, Integer)),
-                else_=0
-            )
-        ).label('total_rebounds'),
-        func.sum(
-            case(
-                (PlayerBoxscore.AST != None, func.cast(PlayerBoxscore.AST, Integer)),
-                else_=0
-            )
-        ).label('total_assists'),
-        func.sum(
-            case(
-                (PlayerBoxscore.STL != None, func.cast(PlayerBoxscore.STL, Integer)),
-                else_=0
-            )
-        ).label('total_steals'),
-        func.sum(
-            case(
-                (PlayerBoxscore.BLK != None, func.cast(PlayerBoxscore.BLK, Integer)),
-                else_=0
-            )
-        ).label('total_blocks'),
-        func.sum(
-            case(
-                (PlayerBoxscore.TO != None, func.cast(PlayerBoxscore.TO, Integer)),
-                else_=0
-            )
-        ).label('total_turnovers'),
+        func.coalesce(func.sum(PlayerBoxscore.points), 0).label('total_points'),
+        func.coalesce(func.sum(PlayerBoxscore.rebounds), 0).label('total_rebounds'),
+        func.coalesce(func.sum(PlayerBoxscore.assists), 0).label('total_assists'),
+        func.coalesce(func.sum(PlayerBoxscore.steals), 0).label('total_steals'),
+        func.coalesce(func.sum(PlayerBoxscore.blocks), 0).label('total_blocks'),
+        func.coalesce(func.sum(PlayerBoxscore.turnovers), 0).label('total_turnovers'),
     ).join(
         Game, PlayerBoxscore.event_id == Game.id
     ).filter(
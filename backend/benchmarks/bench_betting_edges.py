@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark betting edges: the per-row ORM loop vs. the vectorized edge engine.
+
+Builds a synthetic SQLite database of upcoming games with predictions and
+50,000 odds rows (several providers per game) and times the original
+implementation, which only checked home moneylines, against the engine,
+which de-vigs both sides of the moneyline, spread and total for every
+provider and keeps the best edge per game.
+
+Usage (from backend/):
+    python3 benchmarks/bench_betting_edges.py [--rows N] [--providers N] [--runs N]
+"""
+
+import os
+import sys
+import math
+import random
+import tempfile
+import time
+import argparse
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, BACKEND_DIR)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.database import Base
+from models.models import Game, Prediction, Odds
+from api.routes.analytics import get_betting_edges
+from services.betting_edges import load_lines, best_edges
+
+PROVIDERS = ['Caesars Sportsbook', 'ESPN BET', 'William Hill', 'DraftKings', 'FanDuel', 'BetMGM']
+
+
+def american(probability):
+    """American odds for a probability"""
+    if probability >= 0.5:
+        return -round(100 * probability / (1 - probability))
+    return round(100 * (1 - probability) / probability)
+
+
+def build_database(path, rows, providers):
+    """Create a synthetic database and return a session factory for it"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+
+    rng = random.Random(42)
+    start = datetime.now() + timedelta(days=1)
+    games, predictions, odds = [], [], []
+    for game in range(rows // providers):
+        game_id = str(500000 + game)
+        home_win = rng.uniform(0.05, 0.95)
+        games.append({
+            'id': game_id, 'uid': game_id, 'season_year': 2027, 'season_type': 2,
+            'date': (start + timedelta(minutes=game)).strftime('%Y-%m-%dT%H:%MZ'),
+            'event_status_completed': 0,
+            'home_team_displayName': f"Home {game}", 'away_team_displayName': f"Away {game}",
+        })
+        predictions.append({
+            'event_id': game_id,
+            'homeTeam_gameProjection': round(home_win * 100, 1),
+            'awayTeam_gameProjection': round((1 - home_win) * 100, 1),
+        })
+        # Books agree with the prediction up to some noise, plus their margin
+        market = min(max(home_win + rng.gauss(0, 0.06), 0.03), 0.97)
+        spread = round(-6 * math.log(market / (1 - market)) * 2) / 2
+        total = round(rng.uniform(125, 160) * 2) / 2
+        for provider_id, provider in enumerate(PROVIDERS[:providers]):
+            book = min(max(market + rng.gauss(0, 0.02), 0.02), 0.98)
+            odds.append({
+                'event_provider_id': f"{game_id}_{provider_id}", 'event_id': game_id,
+                'provider_id': str(provider_id), 'provider_name': provider,
+                'home_team_moneyline': american(min(book + 0.02, 0.99)),
+                'away_team_moneyline': american(min(1 - book + 0.02, 0.99)),
+                'spread': spread + rng.choice([-0.5, 0, 0, 0.5]),
+                'home_team_spread_odds': rng.choice([-105, -110, -110, -115]),
+                'away_team_spread_odds': rng.choice([-105, -110, -110, -115]),
+                'over_under': total + rng.choice([-1, -0.5, 0, 0, 0.5, 1]),
+                'over_odds': rng.choice([-105, -110, -110, -115]),
+                'under_odds': rng.choice([-105, -110, -110, -115]),
+            })
+    db.bulk_insert_mappings(Game, games)
+    db.bulk_insert_mappings(Prediction, predictions)
+    db.bulk_insert_mappings(Odds, odds)
+    db.commit()
+    db.close()
+    return Session, len(games), len(odds)
+
+
+def legacy_betting_edges(min_edge, db):
+    """The original implementation: ORM triples and a Python loop over home moneylines"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    results = db.query(Game, Prediction, Odds).join(
+        Prediction, Game.id == Prediction.event_id
+    ).join(
+        Odds, Game.id == Odds.event_id
+    ).filter(
+        Game.event_status_completed == 0
+    ).filter(Game.date >= today).all()
+
+    edges = []
+    for game, prediction, odds in results:
+        if odds.home_team_moneyline and odds.away_team_moneyline:
+            home_implied = (
+                abs(odds.home_team_moneyline) / (abs(odds.home_team_moneyline) + 100) * 100
+                if odds.home_team_moneyline < 0
+                else 100 / (odds.home_team_moneyline + 100) * 100
+            )
+            if prediction.homeTeam_gameProjection:
+                pred_home_pct = prediction.homeTeam_gameProjection * 100
+                edge = abs(pred_home_pct - home_implied)
+                if edge >= min_edge:
+                    edges.append({
+                        "game_id": game.id,
+                        "edge": round(edge, 1),
+                        "recommended_bet": "home" if pred_home_pct > home_implied else "away",
+                    })
+    edges.sort(key=lambda x: x['edge'], reverse=True)
+    return edges
+
+
+def time_call(func, runs):
+    """Return (best seconds, last result) over several runs"""
+    best = float('inf')
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=50000, help="Odds rows")
+    parser.add_argument('--providers', type=int, default=5, help="Providers per game")
+    parser.add_argument('--min-edge', type=float, default=5.0)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building synthetic database ({args.rows} odds rows)...")
+        Session, game_count, odds_count = build_database(
+            os.path.join(tmp, 'bench.db'), args.rows, min(args.providers, len(PROVIDERS))
+        )
+        print(f"  {game_count} games, {odds_count} odds rows\n")
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        db = Session()
+        try:
+            legacy_time, legacy = time_call(lambda: legacy_betting_edges(args.min_edge, db), args.runs)
+            load_time, lines = time_call(lambda: load_lines(db, today=today), args.runs)
+            compute_time, best = time_call(lambda: best_edges(lines, args.min_edge), args.runs)
+            # __wrapped__ skips the response cache so every run does the work
+            engine_time, edges = time_call(
+                lambda: get_betting_edges.__wrapped__(date=None, min_edge=args.min_edge, db=db),
+                args.runs
+            )
+        finally:
+            db.close()
+
+        markets = best['market'].value_counts().to_dict()
+        print(f"ORM loop (home ML only):  {legacy_time * 1000:8.1f} ms  {len(legacy)} rows")
+        print(f"Engine, endpoint:         {engine_time * 1000:8.1f} ms  {len(edges)} games "
+              f"({legacy_time / engine_time:.1f}x)")
+        print(f"  column load:            {load_time * 1000:8.1f} ms")
+        print(f"  edges (6 sides x {len(lines)} lines): {compute_time * 1000:.1f} ms")
+        print(f"Best edges by market:     {markets}")
+
+
+if __name__ == "__main__":
+    main()
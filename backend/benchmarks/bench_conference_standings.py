@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark conference standings: per-team ORM loop vs. the grouped queries.
+
+Uses the synthetic database from bench_power_rankings (24 seasons of 250
+teams in conferences of 8) and times a standings page that shows every
+conference for one season: the original loop once per conference, the new
+endpoint once per conference, and a single conference=all call.
+
+Usage (from backend/):
+    python3 benchmarks/bench_conference_standings.py [--seasons N] [--teams N] [--runs N]
+"""
+
+import os
+import sys
+import tempfile
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import and_, or_
+
+from bench_power_rankings import build_database, time_call
+from models.models import Game, Team
+from api.routes.analytics import get_conference_standings
+
+
+def legacy_conference_standings(conference, season, db):
+    """The original implementation: a Team lookup and two Game scans per team"""
+    teams_in_conf = db.query(Game.home_team_id).filter(
+        and_(
+            Game.season_year == season,
+            Game.home_team_conference_slug == conference
+        )
+    ).distinct().all()
+
+    standings = []
+    for (team_id,) in teams_in_conf:
+        team = db.query(Team).filter(Team.id == team_id).first()
+        if not team:
+            continue
+
+        conf_games = db.query(Game).filter(
+            and_(
+                Game.season_year == season,
+                Game.event_status_completed == 1,
+                Game.is_conference_competition == 1,
+                or_(Game.home_team_id == team_id, Game.away_team_id == team_id)
+            )
+        ).all()
+        conf_wins = sum(
+            1 for g in conf_games
+            if (g.home_team_winner if g.home_team_id == team_id else g.away_team_winner) == 1
+        )
+
+        all_games = db.query(Game).filter(
+            and_(
+                Game.season_year == season,
+                Game.event_status_completed == 1,
+                or_(Game.home_team_id == team_id, Game.away_team_id == team_id)
+            )
+        ).all()
+        overall_wins = sum(
+            1 for g in all_games
+            if (g.home_team_winner if g.home_team_id == team_id else g.away_team_winner) == 1
+        )
+
+        conf_total = len(conf_games)
+        standings.append({
+            "team_id": team.id,
+            "conference_wins": conf_wins,
+            "conference_losses": conf_total - conf_wins,
+            "conference_win_pct": round(conf_wins / conf_total, 3) if conf_total > 0 else 0,
+            "overall_wins": overall_wins,
+            "overall_losses": len(all_games) - overall_wins
+        })
+
+    standings.sort(key=lambda x: x['conference_win_pct'], reverse=True)
+    return standings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seasons', type=int, default=24)
+    parser.add_argument('--teams', type=int, default=250)
+    parser.add_argument('--games', type=int, default=30, help="Games per team per season")
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building synthetic database ({args.seasons * args.teams} team-seasons)...")
+        Session, game_count = build_database(
+            os.path.join(tmp, 'bench.db'), args.seasons, args.teams, args.games
+        )
+        print(f"  {game_count} games\n")
+
+        season = 2026
+        db = Session()
+        try:
+            conferences = sorted({
+                slug for (slug,) in db.query(Game.home_team_conference_slug).filter(
+                    Game.season_year == season
+                ).distinct()
+            })
+
+            legacy_time, legacy = time_call(
+                lambda: [legacy_conference_standings(c, season, db) for c in conferences], args.runs
+            )
+            # __wrapped__ skips the response cache so every run does the work
+            per_conf_time, per_conf = time_call(
+                lambda: [get_conference_standings.__wrapped__(conference=c, season=season, db=db)
+                         for c in conferences],
+                args.runs
+            )
+            all_time, all_mode = time_call(
+                lambda: get_conference_standings.__wrapped__(conference="all", season=season, db=db),
+                args.runs
+            )
+        finally:
+            db.close()
+
+        def records(rows):
+            return {(r['team_id'], r['conference_wins'], r['conference_losses'],
+                     r['overall_wins'], r['overall_losses']) for r in rows}
+
+        legacy_rows = [r for standings in legacy for r in standings]
+        per_conf_rows = [r for standings in per_conf for r in standings]
+        same = records(legacy_rows) == records(per_conf_rows) == records(all_mode)
+
+        print(f"{len(conferences)} conferences, {len(all_mode)} teams\n")
+        print(f"Per-team loop (per conference):  {legacy_time * 1000:8.1f} ms")
+        print(f"Grouped queries (per conference): {per_conf_time * 1000:7.1f} ms "
+              f"({legacy_time / per_conf_time:.1f}x)")
+        print(f"Grouped queries (conference=all): {all_time * 1000:7.1f} ms "
+              f"({legacy_time / all_time:.1f}x)")
+        print(f"Same records:                    {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark /games pagination: OFFSET over full Game rows vs. keyset cursors
+over the GameSummary columns.
+
+Builds a synthetic SQLite database of 60,000 games (with the JSON text
+columns filled in, as ESPN's are) and times fetching page 1, 100 and 1,000
+both ways.
+
+Usage (from backend/):
+    python3 benchmarks/bench_pagination.py [--games N] [--limit N] [--runs N]
+"""
+
+import os
+import sys
+import json
+import random
+import tempfile
+import time
+import argparse
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, BACKEND_DIR)
+
+from sqlalchemy import create_engine, desc, text
+from sqlalchemy.orm import sessionmaker
+
+from core.database import Base
+from core.pagination import encode_cursor
+from models.models import Game
+from api.routes.games import get_games
+
+
+def build_database(path, game_count):
+    """Create a synthetic database and return a session factory for it"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+
+    rng = random.Random(42)
+    start = datetime(2002, 11, 1)
+    officials = json.dumps([{'displayName': f"Official {i}", 'order': i} for i in range(3)])
+    games = []
+    for game in range(game_count):
+        game_id = str(400000000 + game)
+        # Several games share each tip-off time, so id has to break ties
+        date = (start + timedelta(minutes=30 * (game // 4))).strftime('%Y-%m-%dT%H:%MZ')
+        linescores = json.dumps([{'value': rng.randint(20, 50)} for _ in range(2)])
+        games.append({
+            'id': game_id, 'uid': game_id, 'date': date, 'season_year': 2003 + game // 2500,
+            'season_type': 2, 'timeValid': 1, 'event_status_completed': 1,
+            'event_status_name': 'STATUS_FINAL', 'event_status_state': 'post',
+            'officials': officials, 'home_linescores': linescores, 'away_linescores': linescores,
+            'home_team_records': json.dumps([{'summary': '20-10'}]),
+            'away_team_records': json.dumps([{'summary': '15-15'}]),
+            'home_team_id': '1', 'home_team_displayName': 'Home Team', 'home_team_abbreviation': 'HOME',
+            'home_team_location': 'Home', 'home_team_score': rng.randint(50, 100),
+            'away_team_id': '2', 'away_team_displayName': 'Away Team', 'away_team_abbreviation': 'AWAY',
+            'away_team_location': 'Away', 'away_team_score': rng.randint(50, 100),
+        })
+    db.bulk_insert_mappings(Game, games)
+    db.execute(text("CREATE INDEX IF NOT EXISTS idx_games_date_id ON games(date, id)"))
+    db.commit()
+    db.close()
+    return Session
+
+
+def legacy_page(db, limit, offset):
+    """The original implementation: every column of every game, OFFSET/LIMIT"""
+    return db.query(Game).order_by(desc(Game.date)).offset(offset).limit(limit).all()
+
+
+def time_call(func, runs):
+    """Return (best seconds, last result) over several runs"""
+    best = float('inf')
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--games', type=int, default=60000)
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building synthetic database ({args.games} games)...\n")
+        Session = build_database(os.path.join(tmp, 'bench.db'), args.games)
+        db = Session()
+        try:
+            print(f"{'Page':>6} {'OFFSET, full rows':>18} {'Cursor, summary':>16}")
+            for page in (1, 100, 1000):
+                offset = (page - 1) * args.limit
+                if offset >= args.games:
+                    break
+                cursor = None
+                if offset:
+                    # The cursor a client holds after reading the previous page
+                    last = db.query(Game.date, Game.id).order_by(
+                        desc(Game.date), desc(Game.id)
+                    ).offset(offset - 1).first()
+                    cursor = encode_cursor([last.date, last.id])
+
+                legacy_time, _ = time_call(lambda: legacy_page(db, args.limit, offset), args.runs)
+                # __wrapped__ skips the response cache so every run does the work
+                keyset_time, result = time_call(
+                    lambda: get_games.__wrapped__(
+                        db=db, date=None, season=None, team_id=None, conference=None,
+                        completed=None, limit=args.limit, cursor=cursor
+                    ),
+                    args.runs
+                )
+                assert len(result['items']) == args.limit
+                print(f"{page:>6} {legacy_time * 1000:15.2f} ms {keyset_time * 1000:13.2f} ms")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark power rankings: per-team COUNT loop vs. the set-based engine
+and the materialized team_season_records lookup.
+
+Builds a synthetic SQLite database with 6,000 team-seasons (24 seasons of
+250 teams, ~30 games per team) and times each implementation for one season.
+
+Usage (from backend/):
+    python3 benchmarks/bench_power_rankings.py [--seasons N] [--teams N] [--runs N]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+import argparse
+import sqlite3
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, '..', 'data'))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from core.database import Base
+from models.models import Game, Team
+from api.routes.analytics import get_power_rankings
+from team_records import TEAM_GAMES_SQL, REBUILD_SQL
+
+
+def build_database(path, seasons, teams_per_season, games_per_team, teams_per_conference=8):
+    """
+    Create a synthetic database and return a session factory for it.
+
+    The second half of each season is played within conferences of
+    teams_per_conference teams, so conference standings have real data.
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+
+    rng = random.Random(42)
+    team_ids = [str(1000 + i) for i in range(teams_per_season)]
+    conference_of = {
+        team_id: f"conf{i // teams_per_conference}" for i, team_id in enumerate(team_ids)
+    }
+    conferences = {}
+    for team_id, slug in conference_of.items():
+        conferences.setdefault(slug, []).append(team_id)
+    db.bulk_insert_mappings(Team, [
+        {'id': team_id, 'uid': team_id, 'displayName': f"Team {team_id}",
+         'abbreviation': f"T{team_id}", 'name': team_id, 'location': team_id,
+         'color': '000000', 'alternateColor': 'ffffff'}
+        for team_id in team_ids
+    ])
+
+    games = []
+    game_id = 0
+    for season in range(2026 - seasons + 1, 2027):
+        for week in range(1, games_per_team + 1):
+            if week <= games_per_team // 2:
+                groups = [team_ids]
+            else:
+                groups = list(conferences.values())
+            pairs = []
+            for group in groups:
+                shuffled = group[:]
+                rng.shuffle(shuffled)
+                pairs.extend(zip(shuffled[::2], shuffled[1::2]))
+            for home, away in pairs:
+                game_id += 1
+                home_score = rng.randint(50, 100)
+                away_score = rng.randint(50, 100)
+                if home_score == away_score:
+                    home_score += 1
+                games.append({
+                    'id': str(game_id), 'uid': str(game_id), 'season_year': season,
+                    'season_type': 2, 'week': week, 'date': f"{season}-01-01T00:00Z",
+                    'is_neutral_site': 0,
+                    'is_conference_competition': int(conference_of[home] == conference_of[away]),
+                    'event_status_completed': 1,
+                    'home_team_id': home, 'home_team_score': home_score,
+                    'home_team_conference_slug': conference_of[home],
+                    'home_team_winner': int(home_score > away_score),
+                    'away_team_id': away, 'away_team_score': away_score,
+                    'away_team_conference_slug': conference_of[away],
+                    'away_team_winner': int(away_score > home_score),
+                })
+    db.bulk_insert_mappings(Game, games)
+    db.execute(text("CREATE INDEX IF NOT EXISTS idx_games_season ON games(season_year)"))
+    db.commit()
+    db.close()
+
+    # Materialize team_season_records the same way data/team_records.py does
+    conn = sqlite3.connect(path)
+    team_games = TEAM_GAMES_SQL.format(home_filter="1 = 1", away_filter="1 = 1")
+    conn.execute(REBUILD_SQL.format(team_games=team_games))
+    conn.commit()
+    conn.close()
+
+    return Session, len(games)
+
+
+def legacy_power_rankings(season, limit, db):
+    """The original implementation: two COUNT queries per team"""
+    teams = db.query(
+        Team.id, Team.displayName, Team.abbreviation, Team.color, Team.alternateColor
+    ).all()
+
+    rankings = []
+    for team in teams:
+        wins = db.execute(
+            text(f"SELECT COUNT(*) FROM games WHERE season_year = {season} "
+            f"AND event_status_completed = 1 "
+            f"AND ((home_team_id = '{team.id}' AND home_team_winner = 1) "
+            f"OR (away_team_id = '{team.id}' AND away_team_winner = 1))")
+        ).scalar()
+
+        total = db.execute(
+            text(f"SELECT COUNT(*) FROM games WHERE season_year = {season} "
+            f"AND event_status_completed = 1 "
+            f"AND (home_team_id = '{team.id}' OR away_team_id = '{team.id}')")
+        ).scalar()
+
+        if total > 0:
+            rankings.append({
+                "team_id": team.id,
+                "team_name": team.displayName,
+                "abbreviation": team.abbreviation,
+                "wins": wins,
+                "losses": total - wins,
+                "win_percentage": round(wins / total, 3),
+                "color": team.color,
+                "alternateColor": team.alternateColor
+            })
+
+    rankings.sort(key=lambda x: x['win_percentage'], reverse=True)
+    for i, team in enumerate(rankings[:limit]):
+        team['rank'] = i + 1
+    return rankings[:limit]
+
+
+def time_call(func, runs):
+    """Return (best seconds, last result) over several runs"""
+    best = float('inf')
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seasons', type=int, default=24)
+    parser.add_argument('--teams', type=int, default=250)
+    parser.add_argument('--games', type=int, default=30, help="Games per team per season")
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building synthetic database ({args.seasons * args.teams} team-seasons)...")
+        Session, game_count = build_database(
+            os.path.join(tmp, 'bench.db'), args.seasons, args.teams, args.games
+        )
+        print(f"  {game_count} games\n")
+
+        season = 2026
+        limit = args.teams
+        db = Session()
+        try:
+            legacy_time, legacy = time_call(
+                lambda: legacy_power_rankings(season, limit, db), args.runs
+            )
+            # __wrapped__ skips the response cache so every run does the work.
+            # A cutoff at the final week forces the grouped query over games
+            engine_time, grouped = time_call(
+                lambda: get_power_rankings.__wrapped__(season=season, week=args.games, limit=limit, db=db),
+                args.runs
+            )
+            table_time, materialized = time_call(
+                lambda: get_power_rankings.__wrapped__(season=season, week=None, limit=limit, db=db),
+                args.runs
+            )
+        finally:
+            db.close()
+
+        def records(rankings):
+            return {(r['team_id'], r['wins'], r['losses']) for r in rankings}
+
+        same = records(legacy) == records(grouped) == records(materialized)
+
+        print(f"Per-team loop:      {legacy_time * 1000:8.1f} ms")
+        print(f"Set-based query:    {engine_time * 1000:8.1f} ms ({legacy_time / engine_time:.1f}x)")
+        print(f"Materialized table: {table_time * 1000:8.1f} ms ({legacy_time / table_time:.1f}x)")
+        print(f"Same records:       {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark player search: LIKE '%term%' scans vs. the FTS5 search index.
+
+Builds a synthetic SQLite database of 300,000 players and 360 teams, indexes
+it with data/search_index.py and times the original LIKE filter against
+/players?search= and /search/autocomplete for prefixes, full names and
+misspellings.
+
+Usage (from backend/):
+    python3 benchmarks/bench_search.py [--players N] [--runs N]
+"""
+
+import os
+import sys
+import random
+import sqlite3
+import tempfile
+import time
+import argparse
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DATA_DIR = os.path.join(BACKEND_DIR, '..', 'data')
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, DATA_DIR)
+
+from sqlalchemy import create_engine, or_
+from sqlalchemy.orm import sessionmaker
+
+from core.database import Base
+from models.models import Player
+from api.routes.players import get_players, PLAYER_COLUMNS
+from api.routes.search import autocomplete
+from search_index import create_search_tables, rebuild_search_index
+
+FIRST_NAMES = ['Cooper', 'Zion', 'Kyle', 'Zach', 'Jalen', 'Marcus', 'Tyler', 'Jordan', 'Caleb',
+               'Isaiah', 'Malik', 'Darius', 'Andre', 'Trey', 'Cameron', 'Devin', 'Jamal', 'Keegan']
+LAST_NAMES = ['Flagg', 'Williamson', 'Filipowski', 'Edey', 'Johnson', 'Williams', 'Brown',
+              'Jackson', 'Davis', 'Harris', 'Robinson', 'Walker', 'Mitchell', 'Anderson',
+              'Thompson', 'Washington', 'Richardson', 'Montgomery', 'Okafor', 'Castellanos']
+# Most names are made up from syllables, so the vocabulary is realistically large
+SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'sa', 'to', 'vi', 'der', 'ban', 'cor', 'el', 'fin',
+             'gar', 'hal', 'jon', 'mar', 'nel', 'os', 'per', 'ril', 'son', 'tan', 'wes', 'yo']
+
+QUERIES = [
+    ('short prefix', 'ka'),
+    ('prefix', 'fil'),
+    ('full name', 'kyle filipowski'),
+    ('typo', 'filipowsky'),
+    ('typo, two words', 'jalen richardsen'),
+]
+
+
+def made_up_name(rng, syllables):
+    return ''.join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize()
+
+
+def build_database(path, player_count):
+    """Create and index a synthetic database; return a session factory for it"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(42)
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    players = []
+    for player in range(player_count):
+        if rng.random() < 0.2:
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        else:
+            first, last = made_up_name(rng, 2), made_up_name(rng, rng.randint(2, 4))
+        players.append((str(1000000 + player), f"u{player}", first, last, f"{first} {last}"))
+    cursor.executemany(
+        "INSERT INTO players (id, uid, firstName, lastName, displayName) VALUES (?, ?, ?, ?, ?)",
+        players
+    )
+    cursor.executemany(
+        "INSERT INTO teams (id, uid, displayName, location, nickname, abbreviation, name) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(str(team), f"t{team}", f"School {team} Wildcats", f"School {team}", "Wildcats",
+          f"S{team}", "Wildcats") for team in range(1, 361)]
+    )
+    create_search_tables(cursor)
+    rebuild_search_index(cursor)
+    conn.commit()
+    conn.close()
+    return sessionmaker(bind=engine)
+
+
+def legacy_search(db, search, limit):
+    """The original implementation: LIKE '%term%' on three columns"""
+    return db.query(*PLAYER_COLUMNS).filter(
+        or_(
+            Player.displayName.like(f"%{search}%"),
+            Player.firstName.like(f"%{search}%"),
+            Player.lastName.like(f"%{search}%")
+        )
+    ).order_by(Player.displayName, Player.id).limit(limit).all()
+
+
+def time_call(func, runs):
+    """Return (best seconds, last result) over several runs"""
+    best = float('inf')
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--players', type=int, default=300000)
+    parser.add_argument('--limit', type=int, default=25)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building and indexing synthetic database ({args.players} players)...\n")
+        Session = build_database(os.path.join(tmp, 'bench.db'), args.players)
+        db = Session()
+        try:
+            print(f"{'Query':<36} {'LIKE':>16} {'FTS5 /players':>20} {'Autocomplete':>14}")
+            for label, q in QUERIES:
+                like_time, like_rows = time_call(lambda: legacy_search(db, q, args.limit), args.runs)
+                # __wrapped__ skips the response cache so every run does the work
+                fts_time, page = time_call(
+                    lambda: get_players.__wrapped__(db=db, search=q, limit=args.limit, cursor=None),
+                    args.runs
+                )
+                complete_time, _ = time_call(
+                    lambda: autocomplete.__wrapped__(q=q, limit=8, db=db), args.runs
+                )
+                print(f"{label + ' (' + q + ')':<36} {like_time * 1000:7.2f} ms ({len(like_rows):>3}) "
+                      f"{fts_time * 1000:10.2f} ms ({len(page['items']):>3}) {complete_time * 1000:11.2f} ms")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Check that no hot API route does a full table scan.
+
+Requests every route in HOT_ROUTES against the database at DATABASE_URL
+(ids, seasons and dates are sampled from it), captures each SQL statement
+the route runs, and prints EXPLAIN QUERY PLAN for it. Any plan step that
+scans a whole table without an index fails the check, unless the table is
+one of the small lookup tables in SMALL_TABLES or holds fewer than
+--min-rows rows (with ANALYZE statistics, scanning a tiny table is the
+planner's best choice). Indexes live in data/indexes.py (migration 7).
+
+Run it against a populated database: a route that returns 404 early never
+reaches its later queries.
+
+Usage (from backend/):
+    python3 benchmarks/check_query_plans.py [--verbose] [--min-rows N]
+    DATABASE_URL=sqlite:////path/to/ncaab.db python3 benchmarks/check_query_plans.py
+"""
+
+import os
+import re
+import sys
+import argparse
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+# Every request has to reach the database
+os.environ['REDIS_ENABLED'] = 'false'
+os.environ['LOCAL_CACHE_ENABLED'] = 'false'
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from core.database import engine
+from core.live import today_rows
+from main import app
+
+# Read whole by design: a few hundred rows at most
+SMALL_TABLES = {'seasons', 'season_types', 'conferences', 'teams'}
+
+HOT_ROUTES = [
+    "/api/v1/games/?limit=50",
+    "/api/v1/games/?season={season}",
+    "/api/v1/games/?team_id={team_id}",
+    "/api/v1/games/?date={date}",
+    "/api/v1/games/today",
+    "/api/v1/games/{game_id}",
+    "/api/v1/games/{game_id}/boxscore",
+    "/api/v1/games/{game_id}/predictions",
+    "/api/v1/games/{game_id}/odds",
+    "/api/v1/teams/?limit=50",
+    "/api/v1/teams/?search={team_name}",
+    "/api/v1/teams/{team_id}",
+    "/api/v1/teams/{team_id}/schedule?season={season}",
+    "/api/v1/teams/{team_id}/roster?season={season}",
+    "/api/v1/teams/{team_id}/stats?season={season}",
+    "/api/v1/teams/{team_id}/player-stats?season={season}",
+    "/api/v1/players/?limit=50",
+    "/api/v1/players/?search={player_name}",
+    "/api/v1/players/{player_id}",
+    "/api/v1/players/{player_id}/seasons",
+    "/api/v1/players/{player_id}/gamelog?season={season}",
+    "/api/v1/players/{player_id}/stats?season={season}",
+    "/api/v1/analytics/power-rankings?season={season}",
+    "/api/v1/analytics/power-rankings?season={season}&week=10",
+    "/api/v1/analytics/ap-poll?season={season}",
+    "/api/v1/analytics/conference-standings?conference=all&season={season}",
+    "/api/v1/analytics/betting-edges",
+    "/api/v1/betting/lines?date={date}",
+    "/api/v1/betting/movers",
+    "/api/v1/betting/providers",
+    "/api/v1/betting/compare/{game_id}",
+    "/api/v1/search/autocomplete?q={team_name}",
+    "/api/v1/seasons/current",
+]
+
+# Hot queries that run outside a plain request (/live streams never end)
+HOT_CALLS = {
+    "live feed poll (core.live.today_rows)": today_rows,
+}
+
+# "SCAN games" or "SCAN g" / "SCAN games AS g"; a scan with USING INDEX,
+# of a VIRTUAL TABLE, or of a subquery/CTE has more text or another name
+FULL_SCAN = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+
+
+def sample_values():
+    """Real ids to put in the routes, from the most recent boxscore"""
+    with engine.connect() as conn:
+        row = conn.execute(text('''
+            SELECT g.id, g.season_year, substr(g.date, 1, 10), pb.team_id, pb.athlete_id
+            FROM player_boxscores pb JOIN games g ON g.id = pb.event_id
+            ORDER BY g.date DESC LIMIT 1
+        ''')).first()
+        if row is None:
+            sys.exit("The database has no boxscores; run the check against a populated database")
+        team_name = conn.execute(text("SELECT displayName FROM teams WHERE id = :id"),
+                                 {"id": row[3]}).scalar() or "a"
+        player_name = conn.execute(text("SELECT displayName FROM players WHERE id = :id"),
+                                   {"id": row[4]}).scalar() or "a"
+    return {
+        "game_id": row[0], "season": row[1], "date": row[2], "team_id": row[3],
+        "player_id": row[4], "team_name": team_name.split()[0], "player_name": player_name,
+    }
+
+
+def capture_statements(routes):
+    """{route: (status, [(sql, params)])} for every SELECT each route or call runs"""
+    captured = {}
+    current = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            current.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        client = TestClient(app)
+        for route in routes:
+            current.clear()
+            response = client.get(route)
+            captured[route] = (response.status_code, list(current))
+        for name, call in HOT_CALLS.items():
+            current.clear()
+            call()
+            captured[name] = ('called', list(current))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return captured
+
+
+def query_plan(statement, parameters):
+    raw = engine.raw_connection()
+    try:
+        return [row[3] for row in raw.cursor().execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    finally:
+        raw.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--verbose', action='store_true', help="Print every plan")
+    parser.add_argument('--min-rows', type=int, default=1000, help="Scans of smaller tables pass")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        names = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'")).scalars().all()
+        checked = {
+            name for name in names if name not in SMALL_TABLES
+            and conn.execute(text(f'SELECT COUNT(*) FROM "{name}"')).scalar() >= args.min_rows
+        }
+
+    values = sample_values()
+    routes = [route.format(**values) for route in HOT_ROUTES]
+    failures = 0
+    for route, (status, statements) in capture_statements(routes).items():
+        scans = []
+        plans = []
+        for statement, parameters in statements:
+            plan = query_plan(statement, parameters)
+            plans.append((statement, plan))
+            for step in plan:
+                match = FULL_SCAN.match(step)
+                if match and match.group(1) in checked:
+                    scans.append((match.group(1), statement))
+
+        mark = '✗' if scans else '✓'
+        print(f"{mark} {route}  [{status}, {len(statements)} queries]")
+        for table, statement in scans:
+            print(f"    full scan of {table}: {' '.join(statement.split())[:160]}")
+        if args.verbose:
+            for statement, plan in plans:
+                print(f"    {' '.join(statement.split())[:120]}")
+                for step in plan:
+                    print(f"      {step}")
+        failures += len(scans)
+
+    if failures:
+        print(f"\n✗ {failures} full table scans")
+        sys.exit(1)
+    print(f"\n✓ No full table scans in {len(routes) + len(HOT_CALLS)} routes")
+
+
+if __name__ == "__main__":
+    main()
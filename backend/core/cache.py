@@ -1,8 +1,17 @@
 import json
-import hashlib
-from typing import Optional, Any
+import inspect
+import time
+import threading
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from datetime import datetime, timedelta
+from typing import Optional, Any, Callable, Union
+from urllib.parse import quote
 from functools import wraps
 import redis
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 from core.config import settings
 
 # Redis client (optional)
@@ -20,46 +29,313 @@ if settings.REDIS_ENABLED:
         print(f"Redis connection failed: {e}")
         redis_client = None
 
+# Only scalar query parameters are part of a cache key (skips db sessions etc.)
+KEY_PARAM_TYPES = (str, int, float, bool, type(None))
+
 
 def generate_cache_key(prefix: str, **kwargs) -> str:
-    """Generate cache key from prefix and parameters"""
-    params_str = json.dumps(kwargs, sort_keys=True)
-    params_hash = hashlib.md5(params_str.encode()).hexdigest()
-    return f"{prefix}:{params_hash}"
+    """
+    Generate cache key from prefix and parameters.
+
+    Keys look like "teams:stats:season=2026:team_id=150:" with parameters
+    sorted by name and values URL-quoted, so the ingest scripts can delete
+    exactly the keys for a season, date or team with a glob such as
+    "teams:*:team_id=150:*" (see data/cache_invalidation.py).
+    """
+    params = "".join(
+        f":{name}={quote(str(value), safe='')}"
+        for name, value in sorted(kwargs.items())
+    )
+    return f"{prefix}{params}:"
+
+
+def current_season() -> int:
+    """Season year in progress (a season is named for the year it ends)"""
+    now = datetime.now()
+    return now.year + 1 if now.month >= 7 else now.year
+
+
+def ttl_for_season(season=None, **params) -> int:
+    """Completed past seasons never change, so cache them for the historical TTL"""
+    try:
+        if season is not None and int(season) < current_season():
+            return settings.CACHE_TTL_HISTORICAL
+    except ValueError:
+        pass
+    return settings.CACHE_TTL
+
+
+def ttl_for_date(date=None, season=None, **params) -> int:
+    """Today's games change minute to minute; dates older than a week are settled"""
+    if date:
+        try:
+            day = datetime.strptime(date[:10], "%Y-%m-%d")
+        except ValueError:
+            return settings.CACHE_TTL
+        if day.date() == datetime.now().date():
+            return settings.CACHE_TTL_GAMES_TODAY
+        if day < datetime.now() - timedelta(days=7):
+            return settings.CACHE_TTL_HISTORICAL
+        return settings.CACHE_TTL
+    return ttl_for_season(season)
+
+
+def _cache_get(cache_key: str) -> Optional[Any]:
+    try:
+        cached = redis_client.get(cache_key)
+        if cached:
+            return json.loads(cached)
+    except Exception as e:
+        print(f"Cache read error: {e}")
+    return None
+
+
+def _cache_set(cache_key: str, ttl: int, value: Any):
+    try:
+        redis_client.setex(cache_key, ttl, json.dumps(value))
+    except Exception as e:
+        print(f"Cache write error: {e}")
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry TTLs.
+
+    Holds already-serialized responses, so a hit skips both the Redis round
+    trip and json.loads. Past max_entries the least recently used entry is
+    evicted. Thread-safe: sync routes run concurrently in the threadpool.
+    """
+
+    def __init__(self, max_entries: int, max_ttl: int):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: int):
+        expires_at = time.monotonic() + min(ttl, self.max_ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, pattern: str) -> int:
+        """Drop entries whose key matches a Redis-style glob pattern"""
+        with self._lock:
+            keys = [key for key in self._entries if fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class _Flight:
+    """One in-progress computation that concurrent identical requests wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one computation.
+
+    The first caller (the leader) runs the function; callers arriving before
+    it finishes block and receive the same result, or the same exception.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
 
+    def join(self, key: str):
+        """Return (flight, is_leader) for key"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def finish(self, key: str, flight: _Flight, result=None, error=None):
+        flight.result = result
+        flight.error = error
+        with self._lock:
+            self._flights.pop(key, None)
+        flight.done.set()
+
+    @staticmethod
+    def wait(flight: _Flight):
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+
+local_cache = (
+    LocalCache(settings.LOCAL_CACHE_MAX_ENTRIES, settings.LOCAL_CACHE_MAX_TTL)
+    if settings.LOCAL_CACHE_ENABLED else None
+)
+single_flight = SingleFlight()
+
+
+def cache_stats() -> dict:
+    """Counters for the cache tiers, for monitoring"""
+    return {
+        "local": local_cache.stats() if local_cache else None,
+        "coalesced": single_flight.coalesced,
+        "redis": redis_client is not None,
+    }
+
+
+def _lookup_shared(cache_key: str, seconds: int) -> Optional[Any]:
+    """Read through to Redis and warm the local tier on a hit"""
+    if not redis_client:
+        return None
+    cached = _cache_get(cache_key)
+    if cached is not None and local_cache:
+        local_cache.set(cache_key, cached, seconds)
+    return cached
+
+
+def _store(cache_key: str, seconds: int, result: Any):
+    if local_cache:
+        local_cache.set(cache_key, result, seconds)
+    if redis_client:
+        _cache_set(cache_key, seconds, result)
+
+
+def cache_response(
+    prefix: str,
+    ttl: Union[int, Callable[..., int]] = settings.CACHE_TTL,
+    model: Any = None
+):
+    """
+    Decorator to cache route responses.
+
+    Lookups go to the in-process LRU first, then Redis when enabled, and
+    concurrent misses for the same key are coalesced so the handler runs
+    once. Works on both sync and async handlers. Sync handlers already run in
+    FastAPI's threadpool; async handlers push the blocking Redis calls onto
+    it so the event loop never waits on the network.
+
+    Args:
+        prefix: Key prefix, e.g. "teams:stats"
+        ttl: Seconds, or a callable taking the query parameters (such as
+            ttl_for_season) that picks a TTL per request
+        model: Response model used to serialize ORM results before caching
+    """
+    adapter = TypeAdapter(model) if model is not None else None
+
+    def serialize(result):
+        if adapter is not None:
+            return adapter.dump_python(
+                adapter.validate_python(result, from_attributes=True), mode="json"
+            )
+        return jsonable_encoder(result)
+
+    def key_and_ttl(kwargs):
+        params = {k: v for k, v in kwargs.items() if isinstance(v, KEY_PARAM_TYPES)}
+        seconds = ttl(**params) if callable(ttl) else ttl
+        return generate_cache_key(prefix, **params), seconds
 
-def cache_response(prefix: str, ttl: int = settings.CACHE_TTL):
-    """Decorator to cache function responses"""
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # If Redis is not available, just call the function
-            if not redis_client:
-                return await func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                # No cache tier configured, just call the function
+                if not local_cache and not redis_client:
+                    return await func(*args, **kwargs)
 
-            # Generate cache key
-            cache_key = generate_cache_key(prefix, **kwargs)
+                cache_key, seconds = key_and_ttl(kwargs)
+                if local_cache:
+                    cached = local_cache.get(cache_key)
+                    if cached is not None:
+                        return cached
 
-            # Try to get from cache
-            try:
-                cached = redis_client.get(cache_key)
-                if cached:
-                    return json.loads(cached)
-            except Exception as e:
-                print(f"Cache read error: {e}")
+                flight, leader = single_flight.join(cache_key)
+                if not leader:
+                    return await run_in_threadpool(single_flight.wait, flight)
+
+                try:
+                    result = await run_in_threadpool(_lookup_shared, cache_key, seconds)
+                    if result is None:
+                        result = serialize(await func(*args, **kwargs))
+                        await run_in_threadpool(_store, cache_key, seconds, result)
+                except Exception as e:
+                    single_flight.finish(cache_key, flight, error=e)
+                    raise
+                single_flight.finish(cache_key, flight, result=result)
+                return result
+            return async_wrapper
 
-            # Call function and cache result
-            result = await func(*args, **kwargs)
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # No cache tier configured, just call the function
+            if not local_cache and not redis_client:
+                return func(*args, **kwargs)
+
+            cache_key, seconds = key_and_ttl(kwargs)
+            if local_cache:
+                cached = local_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            flight, leader = single_flight.join(cache_key)
+            if not leader:
+                return single_flight.wait(flight)
 
             try:
-                redis_client.setex(
-                    cache_key,
-                    ttl,
-                    json.dumps(result)
-                )
+                result = _lookup_shared(cache_key, seconds)
+                if result is None:
+                    result = serialize(func(*args, **kwargs))
+                    _store(cache_key, seconds, result)
             except Exception as e:
-                print(f"Cache write error: {e}")
-
+                single_flight.finish(cache_key, flight, error=e)
+                raise
+            single_flight.finish(cache_key, flight, result=result)
             return result
         return wrapper
     return decorator
@@ -67,12 +343,40 @@ def cache_response(prefix: str, ttl: int = settings.CACHE_TTL):
 
 def invalidate_cache(pattern: str):
     """Invalidate cache keys matching pattern"""
+    if local_cache:
+        local_cache.invalidate(pattern)
+
     if not redis_client:
         return
 
     try:
-        keys = redis_client.keys(pattern)
+        # SCAN instead of KEYS so a large keyspace doesn't block Redis
+        keys = list(redis_client.scan_iter(match=pattern, count=500))
         if keys:
             redis_client.delete(*keys)
     except Exception as e:
         print(f"Cache invalidation error: {e}")
+
+
+def start_invalidation_listener():
+    """
+    Subscribe to invalidations published by the data scripts.
+
+    Redis keys are deleted by the scripts themselves; this only drops the
+    matching entries from this process's local tier. Without Redis there is
+    no channel, and LOCAL_CACHE_MAX_TTL bounds how stale an entry can get.
+    Returns the listener thread (call .stop() on shutdown), or None.
+    """
+    if not redis_client or not local_cache:
+        return None
+
+    def handle(message):
+        local_cache.invalidate(message["data"])
+
+    try:
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{settings.CACHE_INVALIDATION_CHANNEL: handle})
+        return pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+    except Exception as e:
+        print(f"Cache invalidation listener failed: {e}")
+        return None
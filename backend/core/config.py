@@ -5,6 +5,11 @@ from typing import List
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///data/ncaab.db"
+    # SQLite connection tuning (same values as data/db.py)
+    SQLITE_READONLY: bool = True  # the API never writes; ingest scripts own the database
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # page cache per pooled connection
+    SQLITE_BUSY_TIMEOUT_SECONDS: float = 30.0
 
     # Redis
     REDIS_HOST: str = "localhost"
@@ -28,6 +33,18 @@ class Settings(BaseSettings):
     CACHE_TTL_GAMES_TODAY: int = 60  # 1 minute for live games
     CACHE_TTL_HISTORICAL: int = 86400  # 24 hours for historical data
 
+    # In-process cache tier (in front of Redis, or on its own when Redis is off)
+    LOCAL_CACHE_ENABLED: bool = True
+    LOCAL_CACHE_MAX_ENTRIES: int = 2048  # least recently used entries are evicted past this
+    LOCAL_CACHE_MAX_TTL: int = 300  # caps how long a process can serve a response ingest has replaced
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"  # Redis pub/sub channel the data scripts publish to
+
+    # Live score push (/api/v1/live)
+    LIVE_POLL_SECONDS: float = 2.0  # how often the games table is checked while clients are connected
+    LIVE_HEARTBEAT_SECONDS: float = 15.0  # keep-alive interval for idle connections
+    LIVE_MAX_PENDING: int = 100  # delta batches buffered per client before it is resynced
+    LIVE_SCORES_CHANNEL: str = "live:scores"  # Redis pub/sub channel data/live_games.py publishes to
+
     # Pagination
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 200
@@ -1,14 +1,45 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, and_
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from core.config import settings
 
 # Create engine - using relative path for SQLite
 DATABASE_URL = settings.DATABASE_URL.replace("data/", "../data/")
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+
+def readonly_url(url: str) -> str:
+    """SQLite URL opening the same file with mode=ro"""
+    path = url.split(":///", 1)[1]
+    return f"sqlite:///file:{path}?mode=ro&uri=true"
+
+
+if IS_SQLITE:
+    engine = create_engine(
+        readonly_url(DATABASE_URL) if settings.SQLITE_READONLY else DATABASE_URL,
+        connect_args={"check_same_thread": False, "timeout": settings.SQLITE_BUSY_TIMEOUT_SECONDS}
+    )
+
+    @event.listens_for(engine, "connect")
+    def configure_sqlite(dbapi_connection, connection_record):
+        """
+        Tune each pooled connection the way data/db.py tunes the ingest
+        scripts'. The scripts put the database in WAL mode, so these readers
+        see the last committed data while update_daily.py writes instead of
+        waiting for it.
+        """
+        cursor = dbapi_connection.cursor()
+        if settings.SQLITE_READONLY:
+            cursor.execute("PRAGMA query_only = ON")
+        else:
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute(f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA temp_store = MEMORY")
+        cursor.close()
+else:
+    engine = create_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -22,3 +53,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def starts_with(column, prefix: str):
+    """
+    column LIKE 'prefix%' as a range an index can serve. SQLite's LIKE is
+    case-insensitive, so it never uses an index on a BINARY text column.
+    """
+    return and_(column >= prefix, column < prefix + "\U0010ffff")
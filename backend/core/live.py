@@ -0,0 +1,198 @@
+import json
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Optional
+
+from core.config import settings
+from core.cache import redis_client
+from core.database import SessionLocal, starts_with
+from models.models import Game
+
+logger = logging.getLogger(__name__)
+
+# GameSummary fields that change while a game is on; deltas carry only these
+LIVE_FIELDS = [
+    "date",
+    "event_status_name",
+    "event_status_state",
+    "event_status_completed",
+    "event_status_detail",
+    "event_status_short_detail",
+    "home_team_score",
+    "home_team_winner",
+    "away_team_score",
+    "away_team_winner",
+]
+
+
+class Subscriber:
+    """One connected client: a bounded queue of delta batches"""
+
+    def __init__(self, max_pending: int):
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        # Set when the client fell too far behind; it gets a fresh snapshot
+        self.resync = False
+
+
+class LiveHub:
+    """
+    In-process pub/sub for live score and status deltas.
+
+    Keeps the latest live fields of every game it has seen, so publishers can
+    send whole rows and subscribers only receive fields that changed, and a
+    client that connects gets a snapshot before its first delta. Rows may be
+    published from any thread; all state lives on the event loop.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self.games = {}  # event id -> {field: value}
+        self.subscribers = set()
+        self.published = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def subscribe(self) -> Subscriber:
+        subscriber = Subscriber(self.max_pending)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    def snapshot(self, day: Optional[str] = None) -> list:
+        """Live fields of the day's games (today's by default)"""
+        day = day or datetime.now().strftime("%Y-%m-%d")
+        return [
+            {"id": event_id, **fields}
+            for event_id, fields in self.games.items()
+            if (fields.get("date") or "").startswith(day)
+        ]
+
+    def publish(self, rows: list):
+        """Merge rows ({"id": ..., field: value}) and fan out what changed; thread-safe"""
+        if self._loop is None or not rows:
+            return
+        self._loop.call_soon_threadsafe(self._dispatch, rows)
+
+    def _dispatch(self, rows: list):
+        deltas = []
+        for row in rows:
+            current = self.games.setdefault(row["id"], {})
+            changed = {
+                field: row[field] for field in LIVE_FIELDS
+                if field in row and current.get(field) != row[field]
+            }
+            if changed:
+                current.update(changed)
+                deltas.append({"id": row["id"], **changed})
+        if not deltas:
+            return
+
+        self.published += len(deltas)
+        for subscriber in self.subscribers:
+            if subscriber.resync:
+                continue
+            try:
+                subscriber.queue.put_nowait(deltas)
+            except asyncio.QueueFull:
+                # Drop its backlog; the endpoint sends a snapshot instead
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+                subscriber.resync = True
+                subscriber.queue.put_nowait([])
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self.subscribers),
+            "games": len(self.games),
+            "deltas_published": self.published,
+        }
+
+
+live_hub = LiveHub(settings.LIVE_MAX_PENDING)
+
+
+def today_rows() -> list:
+    """Live fields of today's games, read straight from the database"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    db = SessionLocal()
+    try:
+        rows = db.query(Game.id, *[getattr(Game, field) for field in LIVE_FIELDS]).filter(
+            starts_with(Game.date, today)
+        ).all()
+    finally:
+        db.close()
+    return [{"id": row[0], **dict(zip(LIVE_FIELDS, row[1:]))} for row in rows]
+
+
+class LiveFeed:
+    """
+    Feeds the hub from the ingest side.
+
+    With Redis, rows published by data/live_games.py on LIVE_SCORES_CHANNEL
+    are forwarded as they arrive. The games table is also polled every
+    LIVE_POLL_SECONDS while anyone is subscribed (one query for all clients),
+    which catches updates when Redis is off or a message was missed.
+    """
+
+    def __init__(self, hub: LiveHub):
+        self.hub = hub
+        self._stop = threading.Event()
+        self._thread = None
+        self._pubsub_thread = None
+
+    def start(self):
+        self.hub.bind(asyncio.get_running_loop())
+        # Prime the snapshot so the first client doesn't wait a poll interval
+        try:
+            self.hub.publish(today_rows())
+        except Exception as e:
+            logger.warning(f"Live feed initial load failed: {e}")
+        self._thread = threading.Thread(target=self._poll, name="live-feed", daemon=True)
+        self._thread.start()
+        self._pubsub_thread = self._subscribe_redis()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._pubsub_thread:
+            self._pubsub_thread.stop()
+        if self._thread:
+            self._thread.join(timeout=settings.LIVE_POLL_SECONDS + 1)
+
+    def _poll(self):
+        while not self._stop.wait(settings.LIVE_POLL_SECONDS):
+            if not self.hub.subscribers:
+                continue
+            try:
+                self.hub.publish(today_rows())
+            except Exception as e:
+                logger.warning(f"Live feed poll failed: {e}")
+
+    def _subscribe_redis(self):
+        if not redis_client:
+            return None
+
+        def handle(message):
+            try:
+                self.hub.publish(json.loads(message["data"]))
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Bad live scores message: {e}")
+
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{settings.LIVE_SCORES_CHANNEL: handle})
+            return pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+        except Exception as e:
+            logger.warning(f"Live scores subscription failed: {e}")
+            return None
+
+
+def start_live_feed() -> LiveFeed:
+    """Start feeding live_hub (call from the app's lifespan; .stop() on shutdown)"""
+    return LiveFeed(live_hub).start()
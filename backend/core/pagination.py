@@ -0,0 +1,104 @@
+import json
+import base64
+import binascii
+from typing import Generic, List, Optional, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import desc, tuple_
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list endpoint; pass next_cursor back as ?cursor= for the next"""
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(values: list) -> str:
+    """Opaque cursor for the sort key values of the last row on a page"""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Sort key values from a cursor made by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed, holds anything but
+            scalar values, or is for another ordering
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not all(value is None or isinstance(value, (str, int, float)) for value in values):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def after(keys: list, values: list, descending: bool):
+    """Row-value filter for the rows after values in ORDER BY keys order"""
+    position, start = tuple_(*keys), tuple_(*values)
+    return position < start if descending else position > start
+
+
+def rows_after(query, keys: list, values: list, count: int, descending: bool) -> list:
+    """
+    Up to count rows of an ordered query after a cursor position.
+
+    SQLite sorts NULL before any value, so rows whose leading sort key is
+    NULL come first ascending and last descending, and a row-value
+    comparison against NULL is never true. The non-NULL and NULL runs are
+    therefore read as two index range scans, the second only when a page
+    crosses into it.
+    """
+    lead, rest = keys[0], keys[1:]
+    if values[0] is None:
+        rows = query.filter(lead.is_(None), after(rest, values[1:], descending)).limit(count).all()
+        if descending or len(rows) == count:
+            return rows
+        return rows + query.filter(lead.isnot(None)).limit(count - len(rows)).all()
+
+    rows = query.filter(after(keys, values, descending)).limit(count).all()
+    if not descending or len(rows) == count:
+        return rows
+    return rows + query.filter(lead.is_(None)).limit(count - len(rows)).all()
+
+
+def paginate(query, keys: list, limit: int, cursor: Optional[str] = None, descending: bool = False) -> dict:
+    """
+    Keyset pagination: the next page starts after the last row's sort key.
+
+    Each page is an index range scan from the cursor, so deep pages cost the
+    same as the first, unlike OFFSET which reads and discards every earlier
+    row.
+
+    Args:
+        query: Query selecting at least the key columns
+        keys: Sort columns, ending with a unique one (e.g. [Game.date, Game.id]);
+              an index on them in this order keeps every page a range scan.
+              Only the first may be NULL
+        limit: Page size
+        cursor: next_cursor of the previous page (None for the first page)
+        descending: Sort newest/largest first
+
+    Returns:
+        {"items": rows, "next_cursor": cursor or None on the last page}
+    """
+    query = query.order_by(*[desc(key) if descending else key for key in keys])
+    if cursor:
+        rows = rows_after(query, keys, decode_cursor(cursor, len(keys)), limit + 1, descending)
+    else:
+        rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], key.key) for key in keys])
+    return {"items": rows, "next_cursor": next_cursor}
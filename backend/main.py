@@ -3,9 +3,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 
-from api.routes import games, teams, players, analytics, betting, seasons
+from api.routes import games, teams, players, analytics, betting, seasons, live, search
 from core.config import settings
 from core.database import engine, Base
+from core.cache import cache_stats, start_invalidation_listener
+from core.live import start_live_feed
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,7 +19,13 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up NCAA Basketball API")
     # Create tables if they don't exist (for dev)
     # Base.metadata.create_all(bind=engine)
+    invalidation_listener = start_invalidation_listener()
+    # Push score deltas to /api/v1/live subscribers
+    live_feed = start_live_feed()
     yield
+    live_feed.stop()
+    if invalidation_listener:
+        invalidation_listener.stop()
     logger.info("Shutting down NCAA Basketball API")
 
 
@@ -44,6 +52,8 @@ app.include_router(players.router, prefix="/api/v1/players", tags=["players"])
 app.include_router(analytics.router, prefix="/api/v1/analytics", tags=["analytics"])
 app.include_router(betting.router, prefix="/api/v1/betting", tags=["betting"])
 app.include_router(seasons.router, prefix="/api/v1/seasons", tags=["seasons"])
+app.include_router(live.router, prefix="/api/v1/live", tags=["live"])
+app.include_router(search.router, prefix="/api/v1/search", tags=["search"])
 
 
 @app.get("/")
@@ -58,3 +68,9 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/cache")
+async def cache_health():
+    """Hit, miss, eviction and coalescing counters for the response cache"""
+    return cache_stats()
@@ -130,6 +130,7 @@ class Game(Base):
     home_team_color = Column(Text)
     home_team_alternate_color = Column(Text)
     home_team_logos = Column(Text)
+    home_team_logo = Column(Text)  # primary logo href, decoded from home_team_logos at ingest
     home_team_conference_id = Column(Text)
     home_team_conference_slug = Column(Text)
     away_team_id = Column(Text, ForeignKey("teams.id"))
@@ -147,6 +148,7 @@ class Game(Base):
     away_team_color = Column(Text)
     away_team_alternate_color = Column(Text)
     away_team_logos = Column(Text)
+    away_team_logo = Column(Text)
     away_team_conference_id = Column(Text)
     away_team_conference_slug = Column(Text)
 
@@ -180,6 +182,21 @@ class TeamBoxscore(Base):
     flagrantFouls = Column(Text)
     fouls = Column(Text)
     largestLead = Column(Text)
+    # Integer copies of the stats above, parsed at ingest
+    fgm = Column(Integer)
+    fga = Column(Integer)
+    fg3m = Column(Integer)
+    fg3a = Column(Integer)
+    ftm = Column(Integer)
+    fta = Column(Integer)
+    reb = Column(Integer)
+    oreb = Column(Integer)
+    dreb = Column(Integer)
+    ast = Column(Integer)
+    stl = Column(Integer)
+    blk = Column(Integer)
+    tov = Column(Integer)
+    pf = Column(Integer)
 
 
 class PlayerBoxscore(Base):
@@ -211,6 +228,23 @@ class PlayerBoxscore(Base):
     TO = Column(Text)
     PF = Column(Text)
     PTS = Column(Text)
+    # Integer copies of the stats above, parsed at ingest (FG/3PT/FT split)
+    minutes = Column(Integer)
+    points = Column(Integer)
+    rebounds = Column(Integer)
+    offensive_rebounds = Column(Integer)
+    defensive_rebounds = Column(Integer)
+    assists = Column(Integer)
+    steals = Column(Integer)
+    blocks = Column(Integer)
+    turnovers = Column(Integer)
+    fouls = Column(Integer)
+    fgm = Column(Integer)
+    fga = Column(Integer)
+    fg3m = Column(Integer)
+    fg3a = Column(Integer)
+    ftm = Column(Integer)
+    fta = Column(Integer)
 
 
 class Prediction(Base):
@@ -281,3 +315,36 @@ class Ranking(Base):
     record_losses = Column(Integer)
     record_ties = Column(Integer)
     ranked_type = Column(Text)
+
+
+class TeamSeasonRecord(Base):
+    __tablename__ = "team_season_records"
+
+    season = Column(Integer, ForeignKey("seasons.year"), primary_key=True)
+    team_id = Column(Text, ForeignKey("teams.id"), primary_key=True)
+    conference_slug = Column(Text)
+    games = Column(Integer)
+    wins = Column(Integer)
+    losses = Column(Integer)
+    conference_wins = Column(Integer)
+    conference_losses = Column(Integer)
+    home_wins = Column(Integer)
+    home_losses = Column(Integer)
+    away_wins = Column(Integer)
+    away_losses = Column(Integer)
+    points_for = Column(Integer)
+    points_against = Column(Integer)
+    updated_at = Column(Text)
+
+
+class OddsSnapshot(Base):
+    """Append-only line history; only values that changed are set (see data/odds_history.py)"""
+    __tablename__ = "odds_snapshots"
+
+    event_id = Column(Text, ForeignKey("games.id"), primary_key=True)
+    provider_id = Column(Text, primary_key=True)
+    captured_at = Column(Text, primary_key=True)
+    spread = Column(Float)
+    over_under = Column(Float)
+    home_moneyline = Column(Integer)
+    away_moneyline = Column(Integer)
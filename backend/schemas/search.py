@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class SearchSuggestion(BaseModel):
+    type: str  # "team" or "player"
+    id: str
+    name: str
+    detail: Optional[str] = None  # team abbreviation or player jersey
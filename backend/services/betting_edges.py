@@ -0,0 +1,202 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from core.database import starts_with
+from models.models import Game, Prediction, Odds
+
+# Final margins (home minus away) and totals are modelled as logistic
+# distributions around their expected value with these standard deviations
+MARGIN_SD = 11.0
+TOTAL_SD = 17.0
+
+# Price assumed when a spread or total is posted without one
+STANDARD_PRICE = -110.0
+
+# Days ahead scanned without a date; odds are only collected for the next
+# week (data/update_odds.py), so this misses nothing
+LOOKAHEAD_DAYS = 14
+
+# (market, side) of each column of the side arrays
+SIDES = [
+    ("moneyline", "home"),
+    ("moneyline", "away"),
+    ("spread", "home"),
+    ("spread", "away"),
+    ("total", "over"),
+    ("total", "under"),
+]
+
+
+def logistic_scale(sd: float) -> float:
+    """Scale of the logistic distribution with standard deviation sd"""
+    return sd * np.sqrt(3) / np.pi
+
+
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def logit(p):
+    return np.log(p / (1 - p))
+
+
+def implied_probability(price):
+    """Break-even probability of American odds, vig included"""
+    price = np.asarray(price, dtype=float)
+    return np.where(price < 0, -price / (100 - price), 100 / (price + 100))
+
+
+def devig(price, other_price):
+    """Probability of the first side with the bookmaker's margin removed"""
+    implied = implied_probability(price)
+    return implied / (implied + implied_probability(other_price))
+
+
+def load_lines(db: Session, date: Optional[str] = None, today: Optional[str] = None) -> pd.DataFrame:
+    """
+    One row per (upcoming game, provider) with a prediction and odds.
+
+    Only the columns the edge engine needs are selected, straight into a
+    DataFrame; date filters games by day, otherwise games from today up to
+    LOOKAHEAD_DAYS ahead. The closed range lets the games date index drive
+    the join instead of a scan of every stored prediction.
+    """
+    query = db.query(
+        Game.id.label("game_id"),
+        Game.date.label("date"),
+        Game.home_team_displayName.label("home_team"),
+        Game.away_team_displayName.label("away_team"),
+        Prediction.homeTeam_gameProjection.label("home_projection"),
+        Odds.provider_name.label("provider"),
+        Odds.home_team_moneyline.label("home_moneyline"),
+        Odds.away_team_moneyline.label("away_moneyline"),
+        Odds.spread.label("spread"),
+        Odds.home_team_spread_odds.label("home_spread_price"),
+        Odds.away_team_spread_odds.label("away_spread_price"),
+        Odds.over_under.label("total"),
+        Odds.over_odds.label("over_price"),
+        Odds.under_odds.label("under_price"),
+    ).join(
+        Prediction, Game.id == Prediction.event_id
+    ).join(
+        Odds, Game.id == Odds.event_id
+    ).filter(
+        Game.event_status_completed == 0
+    )
+
+    if date:
+        query = query.filter(starts_with(Game.date, date))
+    elif today:
+        horizon = datetime.strptime(today, "%Y-%m-%d") + timedelta(days=LOOKAHEAD_DAYS)
+        query = query.filter(Game.date >= today, Game.date < horizon.strftime("%Y-%m-%d"))
+
+    return pd.read_sql(query.statement, db.connection())
+
+
+def side_arrays(lines: pd.DataFrame):
+    """
+    Price every side of every market on every line.
+
+    Moneyline and spread sides are priced from the prediction's home win
+    probability: the expected home margin is the one that gives that win
+    probability, and a spread covers with the chance the margin beats it.
+    The prediction has no total, so the fair total is the consensus of the
+    providers' de-vigged over/under lines, and a total's edge is how far a
+    provider's line is off that consensus.
+
+    Returns:
+        (model_prob, market_prob, price, line) arrays of shape
+        (len(lines), len(SIDES)); market_prob is de-vigged and
+        missing values are NaN
+    """
+    projection = lines["home_projection"].to_numpy(dtype=float)
+    # ESPN reports projections as percentages
+    home_win = np.where(projection > 1, projection / 100, projection)
+    home_win = np.where((home_win > 0) & (home_win < 1), home_win, np.nan)
+
+    margin_scale = logistic_scale(MARGIN_SD)
+    total_scale = logistic_scale(TOTAL_SD)
+    expected_margin = margin_scale * logit(home_win)
+
+    home_ml = lines["home_moneyline"].to_numpy(dtype=float)
+    away_ml = lines["away_moneyline"].to_numpy(dtype=float)
+    moneyline_market = devig(home_ml, away_ml)
+
+    spread = lines["spread"].to_numpy(dtype=float)
+    home_spread_price = lines["home_spread_price"].fillna(STANDARD_PRICE).to_numpy(dtype=float)
+    away_spread_price = lines["away_spread_price"].fillna(STANDARD_PRICE).to_numpy(dtype=float)
+    spread_model = sigmoid((expected_margin + spread) / margin_scale)
+    spread_market = devig(home_spread_price, away_spread_price)
+
+    total = lines["total"].to_numpy(dtype=float)
+    over_price = lines["over_price"].fillna(STANDARD_PRICE).to_numpy(dtype=float)
+    under_price = lines["under_price"].fillna(STANDARD_PRICE).to_numpy(dtype=float)
+    over_market = devig(over_price, under_price)
+    # Each provider's line and over probability imply a median total
+    implied_total = pd.Series(total + total_scale * logit(over_market), index=lines.index)
+    consensus_total = implied_total.groupby(lines["game_id"]).transform("mean").to_numpy()
+    over_model = sigmoid((consensus_total - total) / total_scale)
+
+    no_line = np.full(len(lines), np.nan)
+    # Columns in SIDES order
+    model = np.column_stack([home_win, 1 - home_win, spread_model, 1 - spread_model,
+                             over_model, 1 - over_model])
+    market = np.column_stack([moneyline_market, 1 - moneyline_market, spread_market,
+                              1 - spread_market, over_market, 1 - over_market])
+    price = np.column_stack([home_ml, away_ml, home_spread_price, away_spread_price,
+                             over_price, under_price])
+    line = np.column_stack([no_line, no_line, spread, -spread, total, total])
+    return model, market, price, line
+
+
+def best_edges(lines: pd.DataFrame, min_edge: float = 0.0) -> pd.DataFrame:
+    """
+    The best bet per game across markets, sides and providers.
+
+    Edge is the model probability minus the de-vigged market probability,
+    so the provider of the best edge is the one whose line gives that side
+    the lowest no-vig probability. That is not necessarily its best raw
+    price: the vig is removed per provider, and spreads and totals differ
+    by line.
+
+    Args:
+        min_edge: Minimum edge in percentage points
+
+    Returns:
+        One row per game whose best edge is at least min_edge, best first,
+        with market, side, line, price, provider, model_prob, market_prob
+        and edge (probabilities as fractions)
+    """
+    columns = ["game_id", "date", "home_team", "away_team", "provider", "market", "side",
+               "line", "price", "model_prob", "market_prob", "edge"]
+    if lines.empty:
+        return pd.DataFrame(columns=columns)
+
+    # Missing or malformed prices come out as NaN and never win
+    with np.errstate(divide="ignore", invalid="ignore"):
+        model, market, price, line = side_arrays(lines)
+        edge = model - market
+    edge[np.isnan(edge) | np.isnan(price)] = -np.inf
+
+    # Best side of each line, then best line of each game
+    rows = np.arange(len(lines))
+    best = edge.argmax(axis=1)
+    best_edge = edge[rows, best]
+    names = np.array(SIDES)
+
+    bets = lines[["game_id", "date", "home_team", "away_team", "provider"]].assign(
+        market=names[best, 0],
+        side=names[best, 1],
+        line=line[rows, best],
+        price=price[rows, best],
+        model_prob=model[rows, best],
+        market_prob=market[rows, best],
+        edge=best_edge,
+    )
+    bets = bets[best_edge * 100 >= min_edge]
+    bets = bets.sort_values("edge", ascending=False, kind="stable")
+    return bets.drop_duplicates("game_id")[columns].reset_index(drop=True)
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func
+
+from models.models import OddsSnapshot
+
+# Tracked line values, as named in odds_snapshots
+LINE_COLUMNS = ["spread", "over_under", "home_moneyline", "away_moneyline"]
+
+
+def window_start(hours: float) -> str:
+    """UTC cutoff `hours` ago in the snapshots' captured_at format"""
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    return since.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _value(db: Session, pairs, column: str, before: Optional[str] = None, latest: bool = True):
+    """
+    Correlated lookup of one line value for each (event, provider) pair.
+
+    Snapshots only carry values that changed, so the value at a point in
+    time is the latest non-null one at or before it. The primary key
+    (event_id, provider_id, captured_at) turns each lookup into a short
+    index range scan.
+    """
+    snapshot = aliased(OddsSnapshot)
+    value = getattr(snapshot, column)
+    filters = [
+        snapshot.event_id == pairs.c.event_id,
+        snapshot.provider_id == pairs.c.provider_id,
+        value.isnot(None)
+    ]
+    if before is not None:
+        filters.append(snapshot.captured_at < before)
+    return db.query(value).filter(and_(*filters)).order_by(
+        snapshot.captured_at.desc() if latest else snapshot.captured_at
+    ).limit(1).correlate(pairs).scalar_subquery()
+
+
+def line_changes(db: Session, hours: float):
+    """
+    Opening and current values of every line that changed within `hours`.
+
+    The opening value is the line as it stood when the window began, or
+    its first value if it was posted inside the window; the current value
+    is the latest one. Returns one row per (event, provider) with
+    <column>_open and <column>_current for each of LINE_COLUMNS.
+    """
+    since = window_start(hours)
+
+    # Lines with any snapshot in the window. Ordering by captured_at keeps
+    # SQLite on idx_odds_snapshots_captured; plain DISTINCT makes it walk the
+    # whole primary key instead.
+    pairs = db.query(
+        OddsSnapshot.event_id, OddsSnapshot.provider_id
+    ).filter(OddsSnapshot.captured_at >= since).distinct().order_by(
+        OddsSnapshot.captured_at
+    ).subquery("pairs")
+
+    columns = []
+    for column in LINE_COLUMNS:
+        opening = func.coalesce(
+            _value(db, pairs, column, before=since),
+            _value(db, pairs, column, latest=False)
+        )
+        columns.append(opening.label(f"{column}_open"))
+        columns.append(_value(db, pairs, column).label(f"{column}_current"))
+
+    return db.query(pairs.c.event_id, pairs.c.provider_id, *columns).all()
@@ -0,0 +1,97 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, case, literal
+from typing import Optional
+
+from models.models import Game
+
+
+def team_games_subquery(db: Session, season: int, week: Optional[int] = None):
+    """
+    Unpivot completed games into one row per (team, game).
+
+    Each game contributes a home row and an away row, so a single GROUP BY
+    over the result yields every team's record without per-team queries.
+    When week is given, only games played in that week or earlier count;
+    games without a week number are excluded from a cutoff.
+    """
+    filters = [
+        Game.season_year == season,
+        Game.event_status_completed == 1
+    ]
+    if week is not None:
+        filters.append(Game.week <= week)
+
+    home = db.query(
+        Game.id.label('game_id'),
+        Game.home_team_id.label('team_id'),
+        Game.away_team_id.label('opponent_id'),
+        Game.home_team_winner.label('won'),
+        Game.home_team_score.label('score'),
+        Game.away_team_score.label('opponent_score'),
+        Game.is_conference_competition.label('is_conference'),
+        Game.home_team_conference_slug.label('conference_slug'),
+        literal(1).label('is_home')
+    ).filter(and_(*filters))
+
+    away = db.query(
+        Game.id.label('game_id'),
+        Game.away_team_id.label('team_id'),
+        Game.home_team_id.label('opponent_id'),
+        Game.away_team_winner.label('won'),
+        Game.away_team_score.label('score'),
+        Game.home_team_score.label('opponent_score'),
+        Game.is_conference_competition.label('is_conference'),
+        Game.away_team_conference_slug.label('conference_slug'),
+        literal(0).label('is_home')
+    ).filter(and_(*filters))
+
+    return home.union_all(away).subquery('team_games')
+
+
+def season_records(db: Session, season: int, week: Optional[int] = None):
+    """
+    Compute every team's record for a season in one pass over games.
+
+    Returns one row per team with overall, conference and home/away
+    win-loss counts plus points for and against.
+    """
+    tg = team_games_subquery(db, season, week)
+    won = tg.c.won == 1
+    is_conference = tg.c.is_conference == 1
+    is_home = tg.c.is_home == 1
+
+    return db.query(
+        tg.c.team_id,
+        func.count().label('games'),
+        func.sum(case((won, 1), else_=0)).label('wins'),
+        func.sum(case((and_(is_conference, won), 1), else_=0)).label('conference_wins'),
+        func.sum(case((is_conference, 1), else_=0)).label('conference_games'),
+        func.sum(case((and_(is_home, won), 1), else_=0)).label('home_wins'),
+        func.sum(case((is_home, 1), else_=0)).label('home_games'),
+        func.sum(case((and_(~is_home, won), 1), else_=0)).label('away_wins'),
+        func.sum(case((~is_home, 1), else_=0)).label('away_games'),
+        func.sum(func.coalesce(tg.c.score, 0)).label('points_for'),
+        func.sum(func.coalesce(tg.c.opponent_score, 0)).label('points_against')
+    ).group_by(tg.c.team_id).all()
+
+
+def head_to_head_records(db: Session, season: int, conference: Optional[str] = None):
+    """
+    Conference results between each pair of teams for a season.
+
+    Returns one row per (team, opponent) with wins, games and points for
+    and against, for every conference when conference is None.
+    """
+    tg = team_games_subquery(db, season)
+    filters = [tg.c.is_conference == 1]
+    if conference is not None:
+        filters.append(tg.c.conference_slug == conference)
+
+    return db.query(
+        tg.c.team_id,
+        tg.c.opponent_id,
+        func.count().label('games'),
+        func.sum(case((tg.c.won == 1, 1), else_=0)).label('wins'),
+        func.sum(func.coalesce(tg.c.score, 0)).label('points_for'),
+        func.sum(func.coalesce(tg.c.opponent_score, 0)).label('points_against')
+    ).filter(and_(*filters)).group_by(tg.c.team_id, tg.c.opponent_id).all()
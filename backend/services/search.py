@@ -0,0 +1,152 @@
+import re
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# FTS5 table and bm25 column weights per searchable table (see data/search_index.py)
+SEARCH_TABLES = {
+    "players": ("players_search", (4.0, 1.0, 2.0)),
+    "teams": ("teams_search", (4.0, 2.0, 2.0, 3.0)),
+}
+
+# Shortest word that gets typo correction, and close terms tried per word
+MIN_FUZZY_LENGTH = 4
+MAX_CORRECTIONS = 3
+
+# Most matches scored with bm25; past this, newest ids are returned unranked
+RANK_LIMIT = 1000
+
+
+def search_words(q: str) -> List[str]:
+    """Lowercase words of a search string (punctuation dropped)"""
+    return re.findall(r"\w+", q.lower())
+
+
+def max_typos(word: str) -> int:
+    return 1 if len(word) <= 5 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or limit + 1 once it is certain to exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def corrections(db: Session, table: str, word: str) -> List[str]:
+    """
+    Terms indexed for table within a few typos of word (none if word is
+    itself an indexed term).
+
+    Candidates are the terms sharing the most trigrams with it, found in
+    the trigram-tokenized <fts table>_spelling table; only those are
+    compared letter by letter.
+    """
+    fts_table, _ = SEARCH_TABLES[table]
+    trigrams = {word[i:i + 3] for i in range(len(word) - 2)}
+    if not trigrams:
+        return []
+    known = db.execute(
+        text(f"SELECT 1 FROM {fts_table}_terms WHERE term = :word"), {"word": word}
+    ).first()
+    if known:
+        return []
+    candidates = db.execute(
+        text(f"SELECT term FROM {fts_table}_spelling WHERE {fts_table}_spelling MATCH :query "
+             "ORDER BY rank LIMIT 50"),
+        {"query": " OR ".join(f'"{trigram}"' for trigram in sorted(trigrams))}
+    ).scalars().all()
+
+    limit = max_typos(word)
+    close = sorted(
+        (distance, term) for term in candidates
+        if term != word and (distance := edit_distance(word, term, limit)) <= limit
+    )
+    return [term for _, term in close[:MAX_CORRECTIONS]]
+
+
+def match_query(words: List[str], alternatives: Optional[dict] = None) -> str:
+    """FTS5 query requiring every word as a prefix, or one of its alternatives"""
+    terms = []
+    for word in words:
+        options = [f'"{word}"*'] + [f'"{term}"' for term in (alternatives or {}).get(word, [])]
+        terms.append(options[0] if len(options) == 1 else f"({' OR '.join(options)})")
+    return " AND ".join(terms)
+
+
+def _ranked(db: Session, table: str, query: str, limit: int) -> List[str]:
+    """
+    Rowids of the best matches for an FTS5 query.
+
+    bm25 scores every match before LIMIT applies, so a short prefix such as
+    "jo" would rank thousands of rows. Past RANK_LIMIT matches the newest ids
+    come back instead (ESPN ids grow over time), which is a cheap rowid-order
+    scan of the index.
+    """
+    fts_table, weights = SEARCH_TABLES[table]
+    newest = db.execute(
+        text(f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :query "
+             f"ORDER BY rowid DESC LIMIT :cap"),
+        {"query": query, "cap": RANK_LIMIT + 1}
+    ).scalars().all()
+    if len(newest) > RANK_LIMIT:
+        return [str(rowid) for rowid in newest[:limit]]
+
+    rows = db.execute(
+        text(f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :query "
+             f"ORDER BY bm25({fts_table}, {', '.join(map(str, weights))}) LIMIT :limit"),
+        {"query": query, "limit": limit}
+    ).scalars().all()
+    return [str(rowid) for rowid in rows]
+
+
+def search_ids(db: Session, table: str, q: str, limit: int, fuzzy: bool = True) -> List[str]:
+    """
+    Ids of the best matches for q in players or teams, best first.
+
+    Every word must start a name, location or nickname word, so results
+    update as the user types. When that finds fewer than limit matches,
+    words may also match indexed terms within one or two typos, and those
+    matches follow the exact ones.
+    """
+    words = search_words(q)
+    if not words:
+        return []
+
+    ids = _ranked(db, table, match_query(words), limit)
+    if not fuzzy or len(ids) >= limit:
+        return ids
+
+    alternatives = {
+        word: corrections(db, table, word) for word in words if len(word) >= MIN_FUZZY_LENGTH
+    }
+    if not any(alternatives.values()):
+        return ids
+    seen = set(ids)
+    for id_ in _ranked(db, table, match_query(words, alternatives), limit):
+        if id_ not in seen and len(ids) < limit:
+            ids.append(id_)
+            seen.add(id_)
+    return ids
+
+
+def fetch_in_order(db: Session, columns: list, id_column, ids: List[str]) -> list:
+    """Rows for ids, in the order of ids"""
+    if not ids:
+        return []
+    rows = db.query(*columns).filter(id_column.in_(ids)).all()
+    by_id = {row.id: row for row in rows}
+    return [by_id[id_] for id_ in ids if id_ in by_id]
@@ -6,10 +6,11 @@ This script discovers and fetches all completed games for the current or specifi
 
 import sys
 import os
-import sqlite3
 from datetime import datetime, timedelta
+from db import connect
 from discover_completed_games import discover_new_completed_games
 from update_games import update_games
+from cache_invalidation import game_patterns, invalidate_patterns
 
 def backfill_season(season_year=None, season_start_month=None):
     """
@@ -40,7 +41,7 @@ def backfill_season(season_year=None, season_start_month=None):
         else:
             db_path = 'data/ncaab.db'  # Will fail with helpful error
         try:
-            conn = sqlite3.connect(db_path)
+            conn = connect(db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT startDate, endDate FROM seasons WHERE year = ?", (season_year,))
             result = cursor.fetchone()
@@ -106,7 +107,10 @@ def backfill_season(season_year=None, season_start_month=None):
     print(f"Fetching detailed data for {len(new_game_ids)} games...")
     print("This includes game stats, team boxscores, and player boxscores.\n")
 
-    update_games(event_ids=new_game_ids, verbose=True)
+    stats = update_games(event_ids=new_game_ids, verbose=True)
+
+    # Historical seasons are cached for a day, so drop what the backfill changed
+    invalidate_patterns(game_patterns(stats['season_teams'], stats['dates'], stats['event_ids']))
 
     # Recalculate current year for final message
     current_year_check = datetime.now().year
@@ -116,7 +120,9 @@ def backfill_season(season_year=None, season_start_month=None):
     print(f"\n{'='*60}")
     print(f"✓ BACKFILL COMPLETE")
     print(f"{'='*60}\n")
-    print(f"Added {len(new_game_ids)} games to the database.")
+    print(f"Added {stats['games_added']} games to the database.")
+    if stats['errors']:
+        print(f"{stats['errors']} games failed; rerun to retry them (python3 data/ingest_state.py shows why).")
     print(f"Database should now have all completed games for season {season_year-1}-{str(season_year)[-2:]}.")
 
     if season_year != current_year_check:
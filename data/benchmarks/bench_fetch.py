@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark ESPN fetch throughput: thread pool vs. the shared async engine.
+
+Starts mock_espn.py in a subprocess (so the server doesn't compete for the
+GIL) and fetches the same game summaries three ways: the old pattern of
+ThreadPoolExecutor(max_workers=10) with a thread-local httpx.Client and no
+retries, the engine at the same concurrency, and the engine at a higher cap.
+Injected 429/503s show up as failures for the thread pool and as retries
+for the engine.
+
+Usage (from the project root):
+    python3 data/benchmarks/bench_fetch.py [--requests N] [--latency S] [--error-rate F]
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import threading
+import subprocess
+import concurrent.futures
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DATA_DIR)
+
+import httpx
+
+from espn_client import ESPNClient
+
+SUMMARY_PATH = "/apis/site/v2/sports/basketball/mens-college-basketball/summary"
+SUMMARY_URL = f"https://site.api.espn.com{SUMMARY_PATH}"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_mock_server(latency, error_rate):
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(DATA_DIR, 'mock_espn.py'), '--port', str(port),
+         '--latency', str(latency), '--error-rate', str(error_rate)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("mock ESPN server did not start")
+
+
+def event_ids(count):
+    return [f"20250115{n % 1000:03d}" for n in range(count)]
+
+
+def legacy_fetch(base_url, ids):
+    """The pattern every script used: thread-local clients, no retries"""
+    local = threading.local()
+
+    def fetch(event_id):
+        if not hasattr(local, 'client'):
+            local.client = httpx.Client(timeout=30.0)
+        try:
+            response = local.client.get(f"{base_url}{SUMMARY_PATH}",
+                                        params={'event': event_id, 'limit': 250})
+            response.raise_for_status()
+            return response.json() is not None
+        except httpx.HTTPError:
+            return False
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        return list(executor.map(fetch, ids))
+
+
+def engine_fetch(client, ids):
+    async def fetch(event_id):
+        response = await client.get(SUMMARY_URL, params={'event': event_id, 'limit': 250})
+        return response.is_success and response.json() is not None
+
+    return list(client.map(fetch, ids))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    results = fn()
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--latency', type=float, default=0.15, help="Mean mock response delay (s)")
+    parser.add_argument('--error-rate', type=float, default=0.02, help="Injected 429/503 fraction")
+    parser.add_argument('--concurrency', type=int, default=32, help="Cap for the second engine run")
+    args = parser.parse_args()
+
+    process, base_url = start_mock_server(args.latency, args.error_rate)
+    ids = event_ids(args.requests)
+    try:
+        print(f"{args.requests} summaries, {args.latency * 1000:.0f} ms mean latency, "
+              f"{args.error_rate:.0%} injected errors\n")
+
+        runs = [("Thread pool (10 workers)", lambda: legacy_fetch(base_url, ids), None)]
+        for concurrency in (10, args.concurrency):
+            client = ESPNClient(max_concurrency=concurrency, rate_limit=0, base_url=base_url)
+            runs.append((f"Async engine ({concurrency} in flight)",
+                         lambda client=client: engine_fetch(client, ids), client))
+
+        baseline = None
+        for label, run, client in runs:
+            elapsed, results = timed(run)
+            failed = results.count(False)
+            baseline = baseline or elapsed
+            retries = f", {client.retries} retries" if client else ""
+            print(f"{label:30s} {elapsed:6.2f} s  {len(ids) / elapsed:7.0f} req/s  "
+                  f"({baseline / elapsed:.1f}x)  {failed} failed{retries}")
+            if client:
+                client.close()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
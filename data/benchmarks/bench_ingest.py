@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark backfill throughput as the parse stage gets more processes.
+
+Fetches N summaries from mock_espn.py once into a response archive, then
+backfills them into a fresh database with update_games.fetch_and_write_games()
+in replay mode, so the I/O stage runs at disk speed and the parse stage
+sets the pace. parse_workers=0 parses inline on the fetch loop's process,
+as every summary was parsed before the stages were split. A final run
+against the mock server shows the network-bound case.
+
+Each run is a fresh process with its own database, so the ESPN engine is
+configured from that run's environment.
+
+Usage (from the project root):
+    python3 data/benchmarks/bench_ingest.py [--requests N] [--workers N] [--latency S]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+import concurrent.futures
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DATA_DIR)
+
+from bench_fetch import start_mock_server, event_ids
+
+SPAWN = multiprocessing.get_context('spawn')
+
+
+def backfill(directory, ids, parse_workers):
+    """Create a database in directory and backfill ids into it; returns (seconds, games)"""
+    os.chdir(directory)
+    os.makedirs('data', exist_ok=True)
+    from create_db import create_database
+    from update_games import fetch_and_write_games
+    with contextlib.redirect_stdout(None):
+        create_database()
+    start = time.perf_counter()
+    written = fetch_and_write_games(ids, verbose=False, resume=False, parse_workers=parse_workers)
+    return time.perf_counter() - start, written['games_added']
+
+
+def run(tmp, label, ids, parse_workers, env):
+    """backfill() in a fresh process with env set"""
+    directory = tempfile.mkdtemp(dir=tmp)
+    os.environ.update(env)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=SPAWN) as pool:
+            elapsed, games = pool.submit(backfill, directory, ids, parse_workers).result()
+    finally:
+        for key in env:
+            del os.environ[key]
+    print(f"{label:<34} {elapsed:7.2f}s {games / elapsed:9.0f}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Most parse processes to try")
+    parser.add_argument('--latency', type=float, default=0.01, help="Mock server latency in seconds")
+    args = parser.parse_args()
+
+    ids = event_ids(args.requests)
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = {'ESPN_ARCHIVE_PATH': os.path.join(tmp, 'archive')}
+        process, base_url = start_mock_server(args.latency, 0.0)
+        try:
+            print(f"Backfilling {args.requests} games ({os.cpu_count()} CPUs)\n")
+            print(f"{'Source, parse workers':<34} {'Time':>8} {'Games/s':>9}")
+            # Fills the archive the replay runs read
+            run(tmp, f"mock ESPN, 0 (filling archive)", ids, 0, {'ESPN_BASE_URL': base_url, **archive})
+
+            workers = 0
+            while True:
+                run(tmp, f"archive replay, {workers}", ids, workers, {'ESPN_REPLAY': '1', **archive})
+                if workers >= args.workers:
+                    break
+                workers = min(max(workers * 2, 1), args.workers)
+
+            run(tmp, f"mock ESPN, {args.workers}", ids, args.workers, {'ESPN_BASE_URL': base_url})
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
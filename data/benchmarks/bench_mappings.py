@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Benchmark ESPN JSON -> row extraction: hand-written dicts vs. espn_mappings.
+
+Builds N game summaries, odds and predictor payloads with mock_espn.py (plus
+synthetic athlete payloads, which the mock server doesn't serve), then turns
+them into table rows with the compiled mappings the fetchers use and with
+the dict-building code they used before (kept below as the baseline),
+checks both produce the same rows and times them. JSON decoding is left
+out of both timings.
+
+Usage (from the project root):
+    python3 data/benchmarks/bench_mappings.py [--games N] [--repeat N]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DATA_DIR)
+
+import mock_espn
+from boxscore_stats import (
+    PLAYER_NUMERIC_COLUMNS, TEAM_NUMERIC_COLUMNS,
+    add_player_numeric_stats, add_team_numeric_stats, add_team_stat
+)
+from update_games import game_rows_from_summary
+from espn_mappings import ODDS, PREDICTION, PLAYER_SEASON
+
+
+# --- the dict-building extraction the fetchers used before espn_mappings ----
+
+def legacy_game_rows(event_id, data):
+    game_header = data.get('header', {})
+    base_comp_info = game_header.get('competitions', [{}])[0]
+    if not base_comp_info.get('status', {}).get('type', {}).get('completed'):
+        return None, [], []
+
+    g = {
+        'id': game_header.get('id'),
+        'uid': game_header.get('uid'),
+        'season_year': game_header.get('season', {}).get('year'),
+        'season_type': game_header.get('season', {}).get('type'),
+        'week': game_header.get('week'),
+        'game_note': game_header.get('gameNote'),
+        'timeValid': game_header.get('timeValid'),
+        'date': base_comp_info.get('date'),
+        'is_neutral_site': base_comp_info.get('neutralSite'),
+        'is_conference_competition': base_comp_info.get('conferenceCompetition'),
+        'event_status_id': base_comp_info.get('status', {}).get('type', {}).get('id'),
+        'event_status_name': base_comp_info.get('status', {}).get('type', {}).get('name'),
+        'event_status_state': base_comp_info.get('status', {}).get('type', {}).get('state'),
+        'event_status_completed': base_comp_info.get('status', {}).get('type', {}).get('completed'),
+        'event_status_description': base_comp_info.get('status', {}).get('type', {}).get('description'),
+        'event_status_detail': base_comp_info.get('status', {}).get('type', {}).get('detail'),
+        'event_status_short_detail': base_comp_info.get('status', {}).get('type', {}).get('shortDetail'),
+        'event_tournament_id': base_comp_info.get('tournamentId'),
+        'venue_id': data.get('gameInfo', {}).get('venue', {}).get('id'),
+        'attendance': data.get('gameInfo', {}).get('attendance'),
+        'officials': data.get('gameInfo', {}).get('officials')
+    }
+    for competitor in base_comp_info.get('competitors', []):
+        home_away = competitor.get('homeAway')
+        g.update({
+            f'{home_away}_team_id': competitor.get('id'),
+            f'{home_away}_team_winner': competitor.get('winner'),
+            f'{home_away}_team_score': competitor.get('score'),
+            f'{home_away}_linescores': competitor.get('linescores', []),
+            f'{home_away}_team_records': competitor.get('record', []),
+            f'{home_away}_team_guid': competitor.get('team', {}).get('guid'),
+            f'{home_away}_team_uid': competitor.get('team', {}).get('uid'),
+            f'{home_away}_team_location': competitor.get('team', {}).get('location'),
+            f'{home_away}_team_name': competitor.get('team', {}).get('name'),
+            f'{home_away}_team_abbreviation': competitor.get('team', {}).get('abbreviation'),
+            f'{home_away}_team_nickname': competitor.get('team', {}).get('nickname'),
+            f'{home_away}_team_displayName': competitor.get('team', {}).get('displayName'),
+            f'{home_away}_team_color': competitor.get('team', {}).get('color'),
+            f'{home_away}_team_alternate_color': competitor.get('team', {}).get('alternateColor'),
+            f'{home_away}_team_logos': competitor.get('team', {}).get('logos', []),
+            f'{home_away}_team_logo': next(iter(competitor.get('team', {}).get('logos', [])), {}).get('href'),
+            f'{home_away}_team_conference_id': competitor.get('team', {}).get('groups', {}).get('id'),
+            f'{home_away}_team_conference_slug': competitor.get('team', {}).get('groups', {}).get('slug')
+        })
+
+    teams = []
+    for team in data.get('boxscore', {}).get('teams', []):
+        team_dict = {
+            'event_team_id': f"{event_id}_{team.get('team', {}).get('id')}",
+            'event_id': event_id,
+            'team_id': team.get('team', {}).get('id'),
+            'home_away': team.get('homeAway')
+        }
+        for stat in team.get('statistics', []):
+            add_team_stat(team_dict, stat.get('name'), stat.get('displayValue'))
+        teams.append(add_team_numeric_stats(team_dict))
+
+    players = []
+    for team in data.get('boxscore', {}).get('players', []):
+        team_id = team.get('team', {}).get('id')
+        stat_labels = team.get('statistics', [{}])[0].get('labels', [])
+        for athlete in team.get('statistics', [{}])[0].get('athletes', []):
+            athlete_id = athlete.get('athlete', {}).get('id')
+            athlete_dict = {
+                'event_athlete_id': f"{event_id}_{athlete_id}",
+                'event_id': event_id,
+                'athlete_id': athlete_id,
+                'team_id': team_id,
+                'athlete_name': athlete.get('athlete', {}).get('displayName'),
+                'athlete_headshot': athlete.get('athlete', {}).get('headshot', {}).get('href'),
+                'athlete_jersey': athlete.get('athlete', {}).get('jersey'),
+                'athlete_position_name': athlete.get('athlete', {}).get('position', {}).get('name'),
+                'athlete_position_abbreviation': athlete.get('athlete', {}).get('position', {}).get('abbreviation'),
+                'athlete_position_display_name': athlete.get('athlete', {}).get('position', {}).get('displayName'),
+                'athlete_starter': athlete.get('starter'),
+                'athlete_did_not_play': athlete.get('didNotPlay'),
+                'athlete_ejected': athlete.get('ejected')
+            }
+            for index, stat_value in enumerate(athlete.get('stats', [])):
+                athlete_dict.update({stat_labels[index]: stat_value})
+            players.append(add_player_numeric_stats(athlete_dict))
+
+    side_columns = ['team_id', 'team_winner', 'team_score', 'linescores', 'team_records', 'team_guid',
+                    'team_uid', 'team_location', 'team_name', 'team_abbreviation', 'team_nickname',
+                    'team_displayName', 'team_color', 'team_alternate_color', 'team_logos', 'team_logo',
+                    'team_conference_id', 'team_conference_slug']
+    json_columns = {'officials', 'home_linescores', 'home_team_records', 'home_team_logos',
+                    'away_linescores', 'away_team_records', 'away_team_logos'}
+    game_columns = ['id', 'uid', 'season_year', 'season_type', 'week', 'game_note', 'timeValid', 'date',
+                    'is_neutral_site', 'is_conference_competition', 'event_status_id', 'event_status_name',
+                    'event_status_state', 'event_status_completed', 'event_status_description',
+                    'event_status_detail', 'event_status_short_detail', 'event_tournament_id', 'venue_id',
+                    'attendance', 'officials',
+                    *(f'home_{c}' for c in side_columns), *(f'away_{c}' for c in side_columns)]
+    team_columns = ['event_team_id', 'event_id', 'team_id', 'home_away', 'fieldGoalsMade',
+                    'fieldGoalsAttempted', 'fieldGoalPct', 'threePointFieldGoalsMade',
+                    'threePointFieldGoalsAttempted', 'threePointFieldGoalPct', 'freeThrowsMade',
+                    'freeThrowsAttempted', 'freeThrowPct', 'totalRebounds', 'offensiveRebounds',
+                    'defensiveRebounds', 'assists', 'steals', 'blocks', 'turnovers', 'teamTurnovers',
+                    'totalTurnovers', 'technicalFouls', 'flagrantFouls', 'fouls', 'largestLead',
+                    *TEAM_NUMERIC_COLUMNS]
+    player_columns = ['event_athlete_id', 'event_id', 'athlete_id', 'team_id', 'athlete_name',
+                      'athlete_headshot', 'athlete_jersey', 'athlete_position_name',
+                      'athlete_position_abbreviation', 'athlete_position_display_name', 'athlete_starter',
+                      'athlete_did_not_play', 'athlete_ejected', 'MIN', 'FG', '3PT', 'FT', 'OREB', 'DREB',
+                      'REB', 'AST', 'STL', 'BLK', 'TO', 'PF', 'PTS', *PLAYER_NUMERIC_COLUMNS]
+    return (
+        tuple(json.dumps(g.get(c)) if c in json_columns else g.get(c) for c in game_columns),
+        [tuple(tb.get(c) for c in team_columns) for tb in teams],
+        [tuple(pb.get(c) for c in player_columns) for pb in players]
+    )
+
+
+def legacy_odds_rows(event_id, data):
+    rows = []
+    for item in data.get('items', []):
+        provider = item.get('provider', {})
+        home_odds, away_odds = {}, {}
+        for team_odds in item.get('homeTeamOdds', {}).get('items', []):
+            home_odds = {
+                'favorite': team_odds.get('favorite'), 'underdog': team_odds.get('underdog'),
+                'moneyline': team_odds.get('moneyLine'), 'spread_odds': team_odds.get('spreadOdds'),
+                'spread': team_odds.get('spread', {}).get('displayValue'),
+                'team_id': team_odds.get('team', {}).get('id')
+            }
+        for team_odds in item.get('awayTeamOdds', {}).get('items', []):
+            away_odds = {
+                'favorite': team_odds.get('favorite'), 'underdog': team_odds.get('underdog'),
+                'moneyline': team_odds.get('moneyLine'), 'spread_odds': team_odds.get('spreadOdds'),
+                'spread': team_odds.get('spread', {}).get('displayValue'),
+                'team_id': team_odds.get('team', {}).get('id')
+            }
+        o = {
+            'event_provider_id': f"{event_id}_{provider.get('id')}", 'event_id': event_id,
+            'provider_id': provider.get('id'), 'provider_name': provider.get('name'),
+            'details': item.get('details'), 'over_under': item.get('overUnder'),
+            'spread': item.get('spread'), 'over_odds': item.get('overOdds'),
+            'under_odds': item.get('underOdds'),
+            'away_team_favorite': away_odds.get('favorite'), 'away_team_underdog': away_odds.get('underdog'),
+            'away_team_moneyline': away_odds.get('moneyline'),
+            'away_team_spread_odds': away_odds.get('spread_odds'),
+            'away_team_spread': away_odds.get('spread'), 'away_team_id': away_odds.get('team_id'),
+            'home_team_favorite': home_odds.get('favorite'), 'home_team_underdog': home_odds.get('underdog'),
+            'home_team_moneyline': home_odds.get('moneyline'),
+            'home_team_spread_odds': home_odds.get('spread_odds'),
+            'home_team_spread': home_odds.get('spread'), 'home_team_id': home_odds.get('team_id')
+        }
+        rows.append(tuple(o.get(column) for column in ODDS.columns))
+    return rows
+
+
+def legacy_prediction_row(event_id, data):
+    p = {'event_id': event_id, 'name': data.get('name'), 'short_name': data.get('shortName')}
+    for side in ('homeTeam', 'awayTeam'):
+        team = data.get(side, {})
+        p.update({
+            f'{side}_team_id': team.get('team', {}).get('id'),
+            f'{side}_gameProjection': team.get('gameProjection'),
+            f'{side}_gameProjection_display': team.get('gameProjectionDisplay'),
+            f'{side}_teamChanceLoss': team.get('teamChanceLoss'),
+            f'{side}_teamChanceLoss_display': team.get('teamChanceLossDisplay')
+        })
+    return tuple(p.get(column) for column in PREDICTION.columns)
+
+
+def legacy_player_season_row(season, player_id, data):
+    p = {
+        'season_player_id': f"{season}-{player_id}", 'season': season, 'player_id': player_id,
+        'uid': data.get('uid'), 'guid': data.get('guid'), 'firstName': data.get('firstName'),
+        'lastName': data.get('lastName'), 'fullName': data.get('fullName'),
+        'displayName': data.get('displayName'), 'shortName': data.get('shortName'),
+        'weight': data.get('weight'), 'displayWeight': data.get('displayWeight'),
+        'height': data.get('height'), 'displayHeight': data.get('displayHeight'),
+        'birthPlace_city': data.get('birthPlace', {}).get('city'),
+        'birthPlace_state': data.get('birthPlace', {}).get('state'),
+        'birthPlace_country': data.get('birthPlace', {}).get('country'),
+        'slug': data.get('slug'),
+        'headshot': data.get('headshot', {}).get('href', f"https://a.espncdn.com/i/headshots/mens-college-basketball/players/full/{player_id}.png"),
+        'jersey': data.get('jersey'), 'hand_type': data.get('hand', {}).get('type'),
+        'hand_abbreviation': data.get('hand', {}).get('abbreviation'),
+        'hand_displayValue': data.get('hand', {}).get('displayValue'),
+        'flag_href': data.get('flag', {}).get('href'),
+        'position_id': data.get('position', {}).get('id'),
+        'position_name': data.get('position', {}).get('name'),
+        'position_abbreviation': data.get('position', {}).get('abbreviation'),
+        'position_displayValue': data.get('position', {}).get('displayValue'),
+        'experience_years': data.get('experience', {}).get('years'),
+        'experience_displayValue': data.get('experience', {}).get('displayValue'),
+        'experience_abbreviation': data.get('experience', {}).get('abbreviation')
+    }
+    try:
+        p['team_id'] = data.get('team', {}).get('$ref').split('/teams/')[1].split('?')[0]
+    except Exception:
+        p['team_id'] = None
+    return tuple(p.get(column) for column in PLAYER_SEASON.columns)
+
+
+# --- the same through espn_mappings -----------------------------------------
+
+def mapped_odds_rows(event_id, data):
+    return [
+        ODDS.extract(event_id, item,
+                     (item.get('homeTeamOdds', {}).get('items') or [{}])[-1],
+                     (item.get('awayTeamOdds', {}).get('items') or [{}])[-1])
+        for item in data.get('items', [])
+    ]
+
+
+def athlete_payload(player_id):
+    """An athlete as the seasons/{season}/athletes/{id} endpoint returns it"""
+    return {
+        'uid': f"s:40~l:41~a:{player_id}", 'guid': f"mock-athlete-{player_id}",
+        'firstName': 'Mock', 'lastName': f"Player {player_id}", 'fullName': f"Mock Player {player_id}",
+        'displayName': f"Mock Player {player_id}", 'shortName': f"M. Player {player_id}",
+        'weight': 190.0, 'displayWeight': '190 lbs', 'height': 76.0, 'displayHeight': "6' 4\"",
+        'birthPlace': {'city': 'Mock City', 'state': 'MC', 'country': 'USA'},
+        'slug': f"mock-player-{player_id}", 'jersey': str(player_id % 50),
+        'hand': {'type': 'RIGHT', 'abbreviation': 'R', 'displayValue': 'Right'},
+        'flag': {'href': 'https://a.espncdn.com/i/teamlogos/countries/500/usa.png'},
+        'position': {'id': '1', 'name': 'Guard', 'abbreviation': 'G', 'displayValue': 'Guard'},
+        'team': {'$ref': f"http://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/2025/teams/{player_id // 100}?lang=en"},
+        'experience': {'years': 2, 'displayValue': 'Sophomore', 'abbreviation': 'SO'}
+    }
+
+
+def timed(function, payloads, repeat):
+    """Best time over repeat passes of function(*payload) for every payload; returns (seconds, results)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [function(*payload) for payload in payloads]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5, help="Passes per case (best is reported)")
+    args = parser.parse_args()
+
+    ids = [f"20250115{n:03d}" for n in range(min(args.games, 1000))]
+    ids += [f"20250116{n:03d}" for n in range(max(args.games - 1000, 0))]
+    # Round-trip through JSON so payloads look exactly like parsed responses
+    summaries = [(event_id, json.loads(json.dumps(mock_espn.summary(event_id)))) for event_id in ids]
+    odds = [(event_id, json.loads(json.dumps(mock_espn.odds(event_id)))) for event_id in ids]
+    predictions = [(event_id, json.loads(json.dumps(mock_espn.predictor(event_id)))) for event_id in ids]
+    athletes = [('2025', str(player_id), athlete_payload(player_id))
+                for player_id in range(10000, 10000 + args.games)]
+
+    cases = [
+        ('game summaries', summaries, legacy_game_rows, game_rows_from_summary),
+        ('odds', odds, legacy_odds_rows, mapped_odds_rows),
+        ('predictions', predictions, legacy_prediction_row, PREDICTION.extract),
+        ('player seasons', athletes, legacy_player_season_row, PLAYER_SEASON.extract),
+    ]
+
+    print(f"Extracting rows from {args.games} payloads of each kind (best of {args.repeat})\n")
+    print(f"{'Payload':<16} {'Dicts':>9} {'Mappings':>9} {'Speedup':>8}")
+    for label, payloads, legacy, mapped in cases:
+        legacy_time, legacy_rows = timed(legacy, payloads, args.repeat)
+        mapped_time, mapped_rows = timed(mapped, payloads, args.repeat)
+        assert mapped_rows == legacy_rows, f"{label}: mapped rows differ from the dict-built rows"
+        print(f"{label:<16} {legacy_time * 1000:7.1f}ms {mapped_time * 1000:7.1f}ms {legacy_time / mapped_time:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark the rankings ingest: full walk vs. incremental poll-week updates.
+
+Starts mock_espn.py in this process with --weeks published poll weeks and
+builds a scratch database in a temporary directory, then runs
+update_rankings.py three ways and counts the requests the server saw:
+
+    full walk    every week of every season, as get_rankings.py (and the
+                 daily update before the rankings stage) fetches them
+    no new poll  the daily stage when no poll was published since the last
+                 run: the poll list pages come back as 304s
+    new week     the daily stage after one more week was published
+
+Usage (from the project root):
+    python3 data/benchmarks/bench_rankings.py [--seasons N] [--weeks N] [--latency S]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DATA_DIR)
+
+from mock_espn import MockESPNServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seasons', type=int, default=5)
+    parser.add_argument('--weeks', type=int, default=18, help="Poll weeks published per season")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mock server latency per request (seconds)")
+    args = parser.parse_args()
+
+    server = MockESPNServer(latency=args.latency, poll_weeks=args.weeks)
+    server.start()
+    workdir = tempfile.mkdtemp(prefix='bench_rankings_')
+    os.chdir(workdir)
+    os.mkdir('data')
+
+    # The ESPN client and response cache read these at import
+    os.environ['ESPN_BASE_URL'] = server.url
+    os.environ['ESPN_CACHE_PATH'] = os.path.join(workdir, 'espn_cache.db')
+
+    from db import connect
+    from create_db import create_database
+    from setup_indexes import setup_indexes_and_logging
+    from update_rankings import update_rankings
+
+    create_database('data/ncaab.db', verbose=False)
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        setup_indexes_and_logging()
+    seasons = list(range(2026 - args.seasons, 2026))
+    conn = connect('data/ncaab.db')
+    conn.executemany("INSERT INTO seasons (year) VALUES (?)", [(season,) for season in seasons])
+    conn.commit()
+    conn.close()
+
+    def run(label, **kwargs):
+        requests, not_modified = server.requests, server.not_modified
+        start = time.perf_counter()
+        stats = update_rankings(verbose=False, **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<14} {server.requests - requests:>9} {server.not_modified - not_modified:>6} "
+              f"{stats['weeks_added']:>7} {stats['rankings_added']:>6} {elapsed:8.2f}s")
+
+    print(f"\n{args.seasons} seasons x 2 polls x {args.weeks} weeks, {args.latency * 1000:.0f}ms latency\n")
+    print(f"{'Run':<14} {'Requests':>9} {'304s':>6} {'Weeks':>7} {'Rows':>6} {'Time':>9}")
+    run('full walk', seasons=seasons, full=True)
+    run('no new poll')
+    server.poll_weeks = args.weeks + 1
+    run('new week')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark re-parsing game summaries: refetching from ESPN vs. the archive.
+
+Starts mock_espn.py in a subprocess, fetches and parses N summaries with
+update_games.get_game_stats() through the engine with and without
+ESPN_ARCHIVE_PATH (the cost of archiving), then parses the same summaries
+again in replay mode with 1..--workers processes, as replay.py does.
+
+Usage (from the project root):
+    python3 data/benchmarks/bench_replay.py [--requests N] [--latency S] [--workers N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing
+import concurrent.futures
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DATA_DIR)
+
+from bench_fetch import start_mock_server, event_ids
+from response_archive import ResponseArchive, print_summary
+
+# Spawned workers build their own engine from the environment at import
+SPAWN = multiprocessing.get_context('spawn')
+
+
+def parse_events(ids):
+    """Fetch and parse ids in this process; the engine is configured from the environment"""
+    from espn_client import espn
+    from update_games import get_game_stats
+    return sum(1 for game_info, _, _ in espn.map(get_game_stats, ids) if game_info)
+
+
+def run_in_subprocess(ids, env):
+    """parse_events() in a fresh process with extra environment variables set"""
+    os.environ.update(env)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=SPAWN) as pool:
+            start = time.perf_counter()
+            games = pool.submit(parse_events, ids).result()
+            return time.perf_counter() - start, games
+    finally:
+        for key in env:
+            del os.environ[key]
+
+
+def replay(ids, workers, batch):
+    batches = [ids[i:i + batch] for i in range(0, len(ids), batch)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=SPAWN) as pool:
+        # Start every worker before timing, as a long replay amortises it
+        list(pool.map(parse_events, [[]] * workers))
+        start = time.perf_counter()
+        games = sum(pool.map(parse_events, batches))
+        return time.perf_counter() - start, games
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.05, help="Mock server latency in seconds")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--batch', type=int, default=100, help="Events per replay task")
+    args = parser.parse_args()
+
+    ids = event_ids(args.requests)
+    process, base_url = start_mock_server(args.latency, 0.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_path = os.path.join(tmp, 'archive')
+        try:
+            print(f"Parsing {args.requests} summaries ({args.latency * 1000:.0f} ms mock latency)\n")
+            print(f"{'Source':<30} {'Time':>8} {'Games/s':>9}")
+            for label, env in (
+                ('ESPN (mock)', {}),
+                ('ESPN (mock), archiving', {'ESPN_ARCHIVE_PATH': archive_path}),
+            ):
+                elapsed, games = run_in_subprocess(ids, {'ESPN_BASE_URL': base_url, **env})
+                print(f"{label:<30} {elapsed:7.2f}s {games / elapsed:9.0f}")
+        finally:
+            process.terminate()
+            process.wait()
+
+        # Replay workers inherit these
+        os.environ['ESPN_ARCHIVE_PATH'] = archive_path
+        os.environ['ESPN_REPLAY'] = '1'
+        workers = 1
+        while True:
+            elapsed, games = replay(ids, workers, args.batch)
+            print(f"{f'Archive replay, {workers} worker(s)':<30} {elapsed:7.2f}s {games / elapsed:9.0f}")
+            if workers >= args.workers:
+                break
+            workers = min(workers * 2, args.workers)
+
+        print()
+        archive = ResponseArchive(archive_path)
+        print_summary(archive)
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark the roster sync: full crawl vs. incremental diffing.
+
+Starts mock_espn.py in this process and builds a scratch database in a
+temporary directory with one season of team_seasons, then runs
+update_rosters.py and counts the requests the server saw:
+
+    full crawl       every rostered athlete fetched, as get_players.py does
+    no changes       the daily stage when no roster changed: roster and
+                     athlete-list pages come back as 304s
+    N teams changed  the daily stage after --changes teams each signed an
+                     athlete and renumbered another
+
+and finally checks a full crawl leaves player_seasons exactly as the
+incremental runs did.
+
+Usage (from the project root):
+    python3 data/benchmarks/bench_rosters.py [--changes N] [--latency S]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DATA_DIR)
+
+from mock_espn import MockESPNServer, TEAM_COUNT
+
+SEASON = 2026
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--changes', type=int, default=5, help="Teams whose roster changes between runs")
+    parser.add_argument('--latency', type=float, default=0.02, help="Mock server latency per request (seconds)")
+    args = parser.parse_args()
+
+    server = MockESPNServer(latency=args.latency)
+    server.start()
+    workdir = tempfile.mkdtemp(prefix='bench_rosters_')
+    os.chdir(workdir)
+    os.mkdir('data')
+
+    # The ESPN client and response cache read these at import
+    os.environ['ESPN_BASE_URL'] = server.url
+    os.environ['ESPN_CACHE_PATH'] = os.path.join(workdir, 'espn_cache.db')
+
+    from db import connect
+    from create_db import create_database
+    from setup_indexes import setup_indexes_and_logging
+    from update_rosters import update_rosters
+
+    create_database('data/ncaab.db', verbose=False)
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        setup_indexes_and_logging()
+    conn = connect('data/ncaab.db')
+    conn.executemany(
+        "INSERT INTO team_seasons (season_conf_team, season, team_id) VALUES (?, ?, ?)",
+        [(f"{SEASON}_{team_id}", str(SEASON), str(team_id)) for team_id in range(1, TEAM_COUNT + 1)]
+    )
+    conn.commit()
+    conn.close()
+
+    def player_seasons():
+        conn = connect('data/ncaab.db')
+        rows = conn.execute("SELECT * FROM player_seasons ORDER BY season_player_id").fetchall()
+        conn.close()
+        return rows
+
+    def run(label, **kwargs):
+        requests, not_modified = server.requests, server.not_modified
+        start = time.perf_counter()
+        stats = update_rosters(verbose=False, **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<16} {server.requests - requests:>9} {server.not_modified - not_modified:>6} "
+              f"{stats['players_added']:>6} {stats['players_updated']:>8} {elapsed:8.2f}s")
+
+    print(f"\n{TEAM_COUNT} teams, {args.latency * 1000:.0f}ms latency\n")
+    print(f"{'Run':<16} {'Requests':>9} {'304s':>6} {'New':>6} {'Changed':>8} {'Time':>9}")
+    run('full crawl', full=True)
+    run('no changes')
+    server.roster_changes = args.changes
+    run(f"{args.changes} teams changed")
+
+    incremental = player_seasons()
+    run('full crawl', full=True)
+    assert player_seasons() == incremental, "a full crawl differs from the incremental runs"
+    print("\n✓ Incremental runs match a full crawl")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark reads during an ingest write: default sqlite3 connections vs. db.py.
+
+Builds a synthetic games table, then runs a writer that rewrites it in
+chunked transactions (like update_games.py's ChunkedWriter) while reader
+threads repeat an analytics-style aggregate, as the API does during
+update_daily.py. Reports reader latency and "database is locked" errors for
+default rollback-journal connections and for db.connect() (WAL,
+synchronous=NORMAL, mmap, larger page cache, read-only readers).
+
+Usage (from the project root):
+    python3 data/benchmarks/bench_wal.py [--games N] [--chunk N] [--readers N]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import threading
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DATA_DIR)
+
+from db import connect
+
+READ_SQL = '''
+    SELECT home_team_id, COUNT(*), AVG(home_team_score - away_team_score)
+    FROM games WHERE season_year = ? GROUP BY home_team_id
+'''
+
+
+def build_database(path, game_count):
+    rng = random.Random(42)
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE games (
+            id TEXT PRIMARY KEY, season_year INTEGER, home_team_id TEXT, away_team_id TEXT,
+            home_team_score INTEGER, away_team_score INTEGER, officials TEXT
+        )
+    ''')
+    conn.execute("CREATE INDEX idx_games_season ON games(season_year)")
+    conn.executemany(
+        "INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(str(400000000 + game), 2003 + game % 20, str(rng.randint(1, 360)), str(rng.randint(1, 360)),
+          rng.randint(50, 100), rng.randint(50, 100), 'x' * 400) for game in range(game_count)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def write_chunks(conn, game_count, chunk):
+    """Rewrite every game in chunk-sized transactions (INSERT OR REPLACE, as the ingest does)"""
+    rng = random.Random(7)
+    for start in range(0, game_count, chunk):
+        conn.executemany(
+            "INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(str(400000000 + game), 2003 + game % 20, str(rng.randint(1, 360)), str(rng.randint(1, 360)),
+              rng.randint(50, 100), rng.randint(50, 100), 'y' * 400)
+             for game in range(start, min(start + chunk, game_count))]
+        )
+        conn.commit()
+
+
+def run(path, tuned, game_count, chunk, reader_count):
+    """Return (write seconds, reader latencies in ms, locked errors)"""
+    writer = connect(path) if tuned else sqlite3.connect(path)
+    latencies, errors = [], []
+    done = threading.Event()
+
+    def read_loop():
+        conn = connect(path, readonly=True) if tuned else sqlite3.connect(path)
+        rng = random.Random(threading.get_ident())
+        while not done.is_set():
+            start = time.perf_counter()
+            try:
+                conn.execute(READ_SQL, (2003 + rng.randrange(20),)).fetchall()
+                latencies.append((time.perf_counter() - start) * 1000)
+            except sqlite3.OperationalError as e:
+                errors.append(str(e))
+        conn.close()
+
+    readers = [threading.Thread(target=read_loop) for _ in range(reader_count)]
+    for reader in readers:
+        reader.start()
+    start = time.perf_counter()
+    write_chunks(writer, game_count, chunk)
+    write_time = time.perf_counter() - start
+    done.set()
+    for reader in readers:
+        reader.join()
+    writer.close()
+    return write_time, sorted(latencies), len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--games', type=int, default=200000)
+    parser.add_argument('--chunk', type=int, default=20000, help="Rows per write transaction")
+    parser.add_argument('--readers', type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Rewriting {args.games} games in chunks of {args.chunk} with {args.readers} readers...\n")
+        print(f"{'Connections':<22} {'Write':>8} {'Reads':>7} {'p50':>8} {'p99':>9} {'max':>9} {'Locked':>7}")
+        for label, tuned in (('sqlite3 defaults', False), ('db.connect (WAL)', True)):
+            path = os.path.join(tmp, f"{'tuned' if tuned else 'default'}.db")
+            build_database(path, args.games)
+            write_time, latencies, errors = run(path, tuned, args.games, args.chunk, args.readers)
+            if latencies:
+                p50 = latencies[len(latencies) // 2]
+                p99 = latencies[int(len(latencies) * 0.99)]
+                print(f"{label:<22} {write_time:7.2f}s {len(latencies):>7} {p50:6.1f}ms {p99:7.1f}ms "
+                      f"{latencies[-1]:7.1f}ms {errors:>7}")
+            else:
+                print(f"{label:<22} {write_time:7.2f}s {0:>7} {'-':>8} {'-':>9} {'-':>9} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Integer boxscore columns parsed from ESPN's display strings.
+
+ESPN reports every boxscore stat as text ("15", "--", "5-12"). The text
+columns are kept as-is for display; these helpers fill the typed columns
+next to them so the API can SUM native integers instead of casting.
+"""
+
+# Player label -> integer column
+PLAYER_INT_STATS = {
+    'MIN': 'minutes',
+    'PTS': 'points',
+    'REB': 'rebounds',
+    'OREB': 'offensive_rebounds',
+    'DREB': 'defensive_rebounds',
+    'AST': 'assists',
+    'STL': 'steals',
+    'BLK': 'blocks',
+    'TO': 'turnovers',
+    'PF': 'fouls',
+}
+
+# Player made-attempted label -> (made column, attempted column)
+PLAYER_SPLIT_STATS = {
+    'FG': ('fgm', 'fga'),
+    '3PT': ('fg3m', 'fg3a'),
+    'FT': ('ftm', 'fta'),
+}
+
+# Team stat name -> integer column (abbreviated: assists, steals etc. are
+# already taken by the text columns)
+TEAM_INT_STATS = {
+    'fieldGoalsMade': 'fgm',
+    'fieldGoalsAttempted': 'fga',
+    'threePointFieldGoalsMade': 'fg3m',
+    'threePointFieldGoalsAttempted': 'fg3a',
+    'freeThrowsMade': 'ftm',
+    'freeThrowsAttempted': 'fta',
+    'totalRebounds': 'reb',
+    'offensiveRebounds': 'oreb',
+    'defensiveRebounds': 'dreb',
+    'assists': 'ast',
+    'steals': 'stl',
+    'blocks': 'blk',
+    'totalTurnovers': 'tov',
+    'fouls': 'pf',
+}
+
+# ESPN's combined made-attempted team stats -> (made, attempted) text columns.
+# Older ingests stored them as-is under the name with "-" replaced by "_"
+TEAM_SPLIT_STATS = {
+    'fieldGoalsMade-fieldGoalsAttempted': ('fieldGoalsMade', 'fieldGoalsAttempted'),
+    'threePointFieldGoalsMade-threePointFieldGoalsAttempted': ('threePointFieldGoalsMade', 'threePointFieldGoalsAttempted'),
+    'freeThrowsMade-freeThrowsAttempted': ('freeThrowsMade', 'freeThrowsAttempted'),
+}
+
+PLAYER_NUMERIC_COLUMNS = list(PLAYER_INT_STATS.values()) + [
+    column for pair in PLAYER_SPLIT_STATS.values() for column in pair
+]
+TEAM_NUMERIC_COLUMNS = list(TEAM_INT_STATS.values())
+
+
+def to_int(value):
+    """'15' -> 15; '--', '' and None -> None"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def split_made_attempted(value):
+    """'5-12' -> (5, 12); anything else -> (None, None)"""
+    if not isinstance(value, str) or '-' not in value:
+        return None, None
+    made, attempted = value.split('-', 1)
+    return to_int(made), to_int(attempted)
+
+
+def add_player_numeric_stats(athlete_dict):
+    """Fill the integer columns of a player boxscore dict from its text stats"""
+    for label, column in PLAYER_INT_STATS.items():
+        athlete_dict[column] = to_int(athlete_dict.get(label))
+    for label, (made_column, attempted_column) in PLAYER_SPLIT_STATS.items():
+        athlete_dict[made_column], athlete_dict[attempted_column] = split_made_attempted(athlete_dict.get(label))
+    return athlete_dict
+
+
+def add_team_stat(team_dict, name, display_value):
+    """
+    Store one ESPN team statistic under its column name.
+
+    Made-attempted stats arrive as one combined stat, e.g.
+    "fieldGoalsMade-fieldGoalsAttempted" = "30-60"; those are split into
+    both text columns.
+    """
+    if '-' in name:
+        made_name, attempted_name = name.split('-', 1)
+        made, attempted = split_made_attempted(display_value)
+        if made is not None:
+            team_dict[made_name] = str(made)
+            team_dict[attempted_name] = str(attempted)
+            return
+    team_dict[name.replace("-", "_")] = display_value
+
+
+def add_team_numeric_stats(team_dict):
+    """Fill the integer columns of a team boxscore dict from its text stats"""
+    for name, column in TEAM_INT_STATS.items():
+        team_dict[column] = to_int(team_dict.get(name))
+    return team_dict
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Invalidate cached API responses after an ingest run.
+
+The backend caches route responses in Redis under keys built by
+backend/core/cache.py: generate_cache_key, e.g.
+"teams:stats:season=2026:team_id=150:" (parameters sorted by name, values
+URL-quoted). This module builds glob patterns in the same format so the
+update scripts delete only the keys for the seasons, dates, teams and games
+they just wrote.
+
+Each pattern is also published on CACHE_INVALIDATION_CHANNEL so running API
+processes drop the same entries from their in-process cache tier.
+
+Reads REDIS_ENABLED / REDIS_HOST / REDIS_PORT / REDIS_DB from the environment,
+the same settings the backend uses. Does nothing when Redis is disabled or
+unreachable; cached entries then simply expire by TTL.
+"""
+
+import os
+from urllib.parse import quote
+
+import redis
+
+INVALIDATION_CHANNEL = os.environ.get('CACHE_INVALIDATION_CHANNEL', 'cache:invalidate')
+
+
+def get_redis_client():
+    """Return a Redis client, or None if caching is disabled or Redis is down"""
+    if os.environ.get('REDIS_ENABLED', 'false').lower() not in ('1', 'true', 'yes'):
+        return None
+
+    try:
+        client = redis.Redis(
+            host=os.environ.get('REDIS_HOST', 'localhost'),
+            port=int(os.environ.get('REDIS_PORT', 6379)),
+            db=int(os.environ.get('REDIS_DB', 0)),
+            decode_responses=True
+        )
+        client.ping()
+        return client
+    except Exception as e:
+        print(f"  ⚠ Redis connection failed, skipping cache invalidation: {e}")
+        return None
+
+
+def key_pattern(prefix, **params):
+    """
+    Glob matching cached keys under prefix that carry the given parameters.
+
+    Several parameters only match when they sit next to each other in the
+    (sorted) key, e.g. season and team_id on the team routes.
+    """
+    parts = "".join(f":{name}={quote(str(value), safe='')}" for name, value in sorted(params.items()))
+    if not params:
+        return f"{prefix}:*"
+    return f"{prefix}*{parts}:*"
+
+
+def game_patterns(season_teams=(), dates=(), event_ids=()):
+    """
+    Cache key patterns affected by writing games.
+
+    Args:
+        season_teams: (season, team_id) pairs whose games changed
+        dates: Game dates (YYYY-MM-DD) that changed
+        event_ids: Game IDs that changed
+    """
+    patterns = set()
+    seasons = {season for season, _ in season_teams}
+
+    for season in seasons:
+        patterns.add(key_pattern('games:list', season=season))
+        patterns.add(key_pattern('players', season=season))
+        patterns.add(key_pattern('analytics', season=season))
+
+    # Team pages are keyed by season and team, so only the touched teams go
+    for season, team_id in season_teams:
+        patterns.add(key_pattern('teams', season=season, team_id=team_id))
+        patterns.add(key_pattern('games:list', team_id=team_id))
+
+    for date in dates:
+        patterns.add(key_pattern('games:list', date=date))
+        patterns.add(key_pattern('betting:lines', date=date))
+        patterns.add(key_pattern('analytics:betting-edges', date=date))
+
+    for event_id in event_ids:
+        patterns.add(key_pattern('games', game_id=event_id))
+        patterns.add(key_pattern('betting:compare', game_id=event_id))
+
+    if season_teams or dates or event_ids:
+        # Lists with no season/date/team filter can include any game
+        patterns.add("games:list:*date=None:*:season=None:team_id=None:")
+        patterns.add(key_pattern('games:today'))
+
+    return patterns
+
+
+def odds_patterns(event_ids=()):
+    """Cache key patterns affected by writing odds or predictions"""
+    patterns = set()
+    for event_id in event_ids:
+        patterns.add(key_pattern('games', game_id=event_id))
+        patterns.add(key_pattern('betting:compare', game_id=event_id))
+
+    if event_ids:
+        # Line listings span every upcoming game
+        patterns.add(key_pattern('betting:lines'))
+        patterns.add(key_pattern('betting:movers'))
+        patterns.add(key_pattern('betting:providers'))
+        patterns.add(key_pattern('analytics:betting-edges'))
+
+    return patterns
+
+
+def rankings_patterns(seasons=()):
+    """Cache key patterns affected by writing poll weeks for these seasons"""
+    return {key_pattern('analytics:ap-poll', season=season) for season in seasons}
+
+
+def roster_patterns(season=None, team_ids=(), player_ids=()):
+    """Cache key patterns affected by writing player seasons and players"""
+    patterns = set()
+    for team_id in team_ids:
+        patterns.add(key_pattern('teams:roster', season=season, team_id=team_id))
+    for player_id in player_ids:
+        patterns.add(key_pattern('players:detail', player_id=player_id))
+        patterns.add(key_pattern('players:seasons', player_id=player_id))
+
+    if player_ids:
+        # Player listings and name suggestions can include any player
+        patterns.add(key_pattern('players:list'))
+        patterns.add(key_pattern('search:autocomplete'))
+
+    return patterns
+
+
+def invalidate_patterns(patterns, verbose=True):
+    """
+    Delete every cached key matching any of the patterns.
+
+    Returns:
+        Number of keys deleted
+    """
+    if not patterns:
+        return 0
+
+    client = get_redis_client()
+    if client is None:
+        return 0
+
+    deleted = 0
+    try:
+        for pattern in sorted(patterns):
+            # SCAN instead of KEYS so a large keyspace doesn't block Redis
+            keys = list(client.scan_iter(match=pattern, count=500))
+            if keys:
+                deleted += client.delete(*keys)
+            client.publish(INVALIDATION_CHANNEL, pattern)
+    except Exception as e:
+        print(f"  ⚠ Cache invalidation error: {e}")
+
+    if verbose:
+        print(f"  ✓ Invalidated {deleted} cached responses ({len(patterns)} patterns)")
+
+    return deleted
@@ -0,0 +1,125 @@
+"""
+Single-threaded, chunked database writer for streaming ingest.
+
+Fetch results are handed to put() as they arrive and flow through a bounded
+queue to one writer thread, which owns the sqlite connection and commits
+every `chunk_size` items in its own transaction. Memory stays flat however
+long the backfill is, a full queue slows the fetchers down instead of
+piling up results, and everything up to the last chunk survives a crash.
+
+    with ChunkedWriter(db_path, write_game_chunk) as writer:
+        for result in parse_summaries(espn.map(tracked(fetch_game_summary), event_ids)):
+            writer.put(result)
+
+The chunk size defaults to INGEST_CHUNK_SIZE (200).
+"""
+
+import os
+import sys
+import queue
+import threading
+from db import connect
+
+DEFAULT_CHUNK_SIZE = int(os.getenv('INGEST_CHUNK_SIZE', 200))
+
+_STOP = object()
+
+
+class ChunkedWriter:
+    def __init__(self, db_path, write_chunk, chunk_size=None, queue_size=None, prepare=None):
+        """
+        Args:
+            db_path: SQLite database to write to
+            write_chunk: write_chunk(cursor, items) writes one chunk (no commit)
+            chunk_size: Items per transaction
+            queue_size: Items buffered between producers and the writer
+                        (default twice the chunk size)
+            prepare: Optional prepare(cursor), run and committed once before
+                     the first chunk (e.g. apply_migrations)
+        """
+        self.db_path = db_path
+        self.write_chunk = write_chunk
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self.prepare = prepare
+        self.queue = queue.Queue(maxsize=queue_size or self.chunk_size * 2)
+
+        self.items_written = 0
+        self.chunks_written = 0
+        self.error = None
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='chunked-writer', daemon=True)
+        self._thread.start()
+        return self
+
+    def put(self, item):
+        """Queue one item for writing; blocks while the queue is full"""
+        if not self._offer(item):
+            raise RuntimeError("writer thread failed") from self.error
+
+    def _offer(self, item):
+        """Put unless the writer has died (so a full queue can't hang us)"""
+        while self.error is None and self._thread.is_alive():
+            try:
+                self.queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self):
+        """Flush the last partial chunk, stop the writer and re-raise its error"""
+        if self._thread is not None:
+            self._offer(_STOP)
+            self._thread.join()
+            self._thread = None
+        if self.error is not None:
+            raise RuntimeError("writer thread failed") from self.error
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        # Still flush on a producer error: whatever was fetched is kept
+        if exc_type is None:
+            self.close()
+            return False
+        # ...but let the producer's exception propagate; a writer error
+        # that didn't already cause it is only reported
+        try:
+            self.close()
+        except RuntimeError:
+            if exc.__cause__ is not self.error:
+                print(f"ChunkedWriter: writer thread failed: {self.error!r}", file=sys.stderr)
+        return False
+
+    def _run(self):
+        conn = connect(self.db_path)
+        cursor = conn.cursor()
+        chunk = []
+        try:
+            if self.prepare:
+                self.prepare(cursor)
+                conn.commit()
+            while True:
+                item = self.queue.get()
+                if item is _STOP:
+                    break
+                chunk.append(item)
+                if len(chunk) >= self.chunk_size:
+                    self._flush(conn, cursor, chunk)
+                    chunk = []
+            if chunk:
+                self._flush(conn, cursor, chunk)
+        except Exception as e:
+            conn.rollback()
+            self.error = e
+        finally:
+            conn.close()
+
+    def _flush(self, conn, cursor, chunk):
+        self.write_chunk(cursor, chunk)
+        conn.commit()
+        self.items_written += len(chunk)
+        self.chunks_written += 1
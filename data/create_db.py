@@ -1,7 +1,13 @@
-import sqlite3
+from db import connect
+from team_records import create_team_season_records_table
+from ingest_state import create_ingest_state_table
+from odds_history import create_odds_snapshots_table
+from search_index import create_search_tables
+from ranking_state import create_ranking_weeks_table
+from migrate import apply_migrations
 
-def create_database():
-    conn = sqlite3.connect('data/ncaab.db')
+def create_database(path='data/ncaab.db', verbose=True):
+    conn = connect(path)
     cursor = conn.cursor()
 
     # Create seasons table with year as primary key
@@ -235,6 +241,7 @@ def create_database():
             home_team_color TEXT,
             home_team_alternate_color TEXT,
             home_team_logos TEXT,
+            home_team_logo TEXT,
             home_team_conference_id TEXT,
             home_team_conference_slug TEXT,
             away_team_id TEXT,
@@ -252,6 +259,7 @@ def create_database():
             away_team_color TEXT,
             away_team_alternate_color TEXT,
             away_team_logos TEXT,
+            away_team_logo TEXT,
             away_team_conference_id TEXT,
             away_team_conference_slug TEXT,
             FOREIGN KEY (season_year) REFERENCES seasons(year),
@@ -289,6 +297,20 @@ def create_database():
             flagrantFouls TEXT,
             fouls TEXT,
             largestLead TEXT,
+            fgm INTEGER,
+            fga INTEGER,
+            fg3m INTEGER,
+            fg3a INTEGER,
+            ftm INTEGER,
+            fta INTEGER,
+            reb INTEGER,
+            oreb INTEGER,
+            dreb INTEGER,
+            ast INTEGER,
+            stl INTEGER,
+            blk INTEGER,
+            tov INTEGER,
+            pf INTEGER,
             FOREIGN KEY (event_id) REFERENCES games(id),
             FOREIGN KEY (team_id) REFERENCES teams(id)
         )
@@ -323,6 +345,22 @@ def create_database():
             "TO" TEXT,
             PF TEXT,
             PTS TEXT,
+            minutes INTEGER,
+            points INTEGER,
+            rebounds INTEGER,
+            offensive_rebounds INTEGER,
+            defensive_rebounds INTEGER,
+            assists INTEGER,
+            steals INTEGER,
+            blocks INTEGER,
+            turnovers INTEGER,
+            fouls INTEGER,
+            fgm INTEGER,
+            fga INTEGER,
+            fg3m INTEGER,
+            fg3a INTEGER,
+            ftm INTEGER,
+            fta INTEGER,
             FOREIGN KEY (event_id) REFERENCES games(id),
             FOREIGN KEY (athlete_id) REFERENCES players(id),
             FOREIGN KEY (team_id) REFERENCES teams(id)
@@ -381,9 +419,29 @@ def create_database():
         )
     ''')
 
+    # Create materialized per-season team records (maintained by update_games.py)
+    create_team_season_records_table(cursor)
+
+    # Create per-event ingest checkpoints (see ingest_state.py)
+    create_ingest_state_table(cursor)
+
+    # Create the append-only line history (see odds_history.py)
+    create_odds_snapshots_table(cursor)
+
+    # Create the player and team name search index (see search_index.py)
+    create_search_tables(cursor)
+
+    # Create the rankings poll-week checkpoints (see ranking_state.py)
+    create_ranking_weeks_table(cursor)
+
+    # Tables above are already current; this records the migrations as applied
+    # and creates the indexes they add
+    apply_migrations(cursor)
+
     conn.commit()
     conn.close()
-    print("Database and tables created successfully.")
+    if verbose:
+        print("Database and tables created successfully.")
 
 if __name__ == "__main__":
     create_database()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+SQLite connection factory shared by the data scripts.
+
+Every connection is tuned the same way:
+- journal_mode=WAL: the API keeps reading while a script writes, and a
+  writer no longer waits for open readers to finish
+- synchronous=NORMAL: with WAL, commits only fsync at checkpoints; a power
+  loss can lose the last commits but cannot corrupt the database
+- mmap_size: pages are read straight from the OS page cache instead of
+  being copied in by read() calls
+- cache_size: a 64 MB page cache per connection instead of the 2 MB default
+- timeout: wait up to 30 s for another writer's lock instead of failing
+  with "database is locked" (stage_runner.py runs stages in parallel)
+
+backend/core/database.py applies the same settings to the API's read-only
+connections.
+
+Usage:
+    python3 data/db.py    # pragmas in effect for script connections
+"""
+
+import sqlite3
+import os
+
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KB = 64 * 1024
+BUSY_TIMEOUT_SECONDS = 30
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def configure(conn, readonly=False):
+    """Apply the connection pragmas to an open connection and return it"""
+    if readonly:
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        # journal_mode is stored in the database file; synchronous is per connection
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+def connect(path=None, readonly=False, **kwargs):
+    """
+    Open a tuned connection to the database.
+
+    Args:
+        path: Database file (default: get_db_path())
+        readonly: Open with mode=ro, so any write raises instead of taking a lock
+        **kwargs: Passed to sqlite3.connect (e.g. check_same_thread=False)
+    """
+    path = path or get_db_path()
+    kwargs.setdefault('timeout', BUSY_TIMEOUT_SECONDS)
+    if readonly:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, **kwargs)
+    else:
+        conn = sqlite3.connect(path, **kwargs)
+    return configure(conn, readonly)
+
+
+def print_pragmas():
+    conn = connect()
+    for pragma in ('journal_mode', 'synchronous', 'mmap_size', 'cache_size', 'page_size'):
+        print(f"  {pragma:<13} {conn.execute(f'PRAGMA {pragma}').fetchone()[0]}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    print_pragmas()
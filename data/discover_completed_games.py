@@ -1,17 +1,14 @@
-import httpx
-import sqlite3
 from datetime import datetime, timedelta
-import threading
 import os
+from db import connect
+from espn_client import espn
+from response_cache import get_json, response_cache
+from ingest_state import DONE
 
-# Thread-local storage for httpx clients
-_thread_local = threading.local()
-
-def get_client():
-    """Get or create a thread-local httpx client"""
-    if not hasattr(_thread_local, 'client'):
-        _thread_local.client = httpx.Client(timeout=30.0)
-    return _thread_local.client
+# Months that ended this many days ago are treated as final and served from
+# the response cache for up to HISTORICAL_MAX_AGE seconds without a request
+HISTORICAL_MONTH_DAYS = 7
+HISTORICAL_MAX_AGE = int(os.getenv('DISCOVERY_HISTORICAL_MAX_AGE', 30 * 86400))
 
 def generate_month_list(start_date, end_date):
     """Generate list of YYYYMM strings for date range"""
@@ -29,10 +26,25 @@ def generate_month_list(start_date, end_date):
 
     return months
 
-def fetch_events_for_month(year_month):
+def month_max_age(year_month):
+    """
+    How long a cached events list for a month can be used without asking
+    ESPN: a month that ended over HISTORICAL_MONTH_DAYS ago no longer
+    changes, anything more recent is always revalidated (a 304 if unchanged).
+    """
+    year, month = int(year_month[:4]), int(year_month[4:])
+    month_end = datetime(year + month // 12, month % 12 + 1, 1)
+    if datetime.now() - month_end > timedelta(days=HISTORICAL_MONTH_DAYS):
+        return HISTORICAL_MAX_AGE
+    return 0
+
+async def fetch_events_for_month(year_month):
     """
     Fetch all event IDs for a given month (YYYYMM format).
     Returns list of event IDs with their completion status.
+
+    The first page gives the page count; the remaining pages are fetched
+    concurrently. Responses go through the local response cache.
     """
     base_url = "https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/events"
     params = {
@@ -40,11 +52,10 @@ def fetch_events_for_month(year_month):
         'groups': '52',  # Group 52 includes all D1 games (50 misses early season games)
         'limit': 1000
     }
+    max_age = month_max_age(year_month)
 
     try:
-        response = get_client().get(url=base_url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = await get_json(base_url, params=params, max_age=max_age)
     except Exception as e:
         print(f"  Error fetching events for {year_month}: {e}")
         return []
@@ -56,17 +67,17 @@ def fetch_events_for_month(year_month):
     all_events.extend(data.get('items', []))
 
     # Process additional pages if they exist
+    async def fetch_page(page):
+        try:
+            page_data = await get_json(base_url, params={**params, 'page': page}, max_age=max_age)
+            return page_data.get('items', [])
+        except Exception as e:
+            print(f"  Error fetching page {page} for {year_month}: {e}")
+            return []
+
     if page_count > 1:
-        for page in range(2, page_count + 1):
-            params['page'] = page
-            try:
-                response = get_client().get(url=base_url, params=params)
-                response.raise_for_status()
-                page_data = response.json()
-                all_events.extend(page_data.get('items', []))
-            except Exception as e:
-                print(f"  Error fetching page {page} for {year_month}: {e}")
-                continue
+        for items in await espn.gather(fetch_page, range(2, page_count + 1)):
+            all_events.extend(items)
 
     # Extract event IDs from $ref URLs
     event_ids = []
@@ -79,7 +90,11 @@ def fetch_events_for_month(year_month):
     return event_ids
 
 def get_existing_game_ids(start_date):
-    """Query database for existing game IDs since start_date"""
+    """
+    Game IDs since start_date that are fully ingested (ingest_state done).
+    Games the live tracker inserted are in games before their summary and
+    boxscores are, so they are not counted until then.
+    """
     # Determine database path - works from project root or data/ directory
     # Prefer data/ncaab.db as it's the canonical location
     if os.path.exists('data/ncaab.db'):
@@ -89,13 +104,14 @@ def get_existing_game_ids(start_date):
     else:
         raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
 
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     cursor.execute("""
-        SELECT id FROM games
-        WHERE date >= ?
-    """, (start_date.isoformat(),))
+        SELECT games.id FROM games
+        JOIN ingest_state ON ingest_state.event_id = games.id
+        WHERE games.date >= ? AND ingest_state.status = ?
+    """, (start_date.isoformat(), DONE))
 
     existing_ids = [row[0] for row in cursor.fetchall()]
     conn.close()
@@ -146,14 +162,17 @@ def discover_new_completed_games(days_lookback=7, start_date=None, end_date=None
     if verbose:
         print(f"\nFetching events from ESPN API...")
 
+    # All months (and their pages) are fetched concurrently
     all_event_ids = []
-    for year_month in months_to_check:
-        if verbose:
-            print(f"  Fetching {year_month}...", end=' ')
-        events = fetch_events_for_month(year_month)
+    cache_before = response_cache.counts() if response_cache is not None else None
+    month_events = espn.run(espn.gather(fetch_events_for_month, months_to_check))
+    for year_month, events in zip(months_to_check, month_events):
         all_event_ids.extend(events)
         if verbose:
-            print(f"({len(events)} events)")
+            print(f"  {year_month}: {len(events)} events")
+    if verbose and cache_before is not None:
+        fresh, unchanged, downloaded = (now - before for now, before in zip(response_cache.counts(), cache_before))
+        print(f"  Response cache: {fresh} fresh, {unchanged} unchanged (304), {downloaded} downloaded")
 
     if verbose:
         print(f"\nTotal events discovered: {len(all_event_ids)}")
@@ -0,0 +1,276 @@
+"""
+Shared async HTTP engine for the ESPN ingest scripts.
+
+One httpx.AsyncClient runs on a background event loop, so every request a
+process makes shares a single keep-alive connection pool (HTTP/2 when the
+h2 package is installed), one concurrency cap and one token-bucket rate
+limit. 429s, 5xx responses and transport errors are retried with jittered
+exponential backoff, honouring Retry-After.
+
+Fetch functions are written as coroutines and fanned out with map(), which
+replaces ThreadPoolExecutor.map() and yields results in input order:
+
+    from espn_client import espn
+
+    async def fetch_odds(event_id):
+        response = await espn.get(url, params=params)
+        response.raise_for_status()
+        ...
+
+    for odds in espn.map(fetch_odds, event_ids):
+        ...
+
+Settings are read from the environment:
+    ESPN_MAX_CONCURRENCY  requests in flight at once (default 20)
+    ESPN_RATE_LIMIT       requests per second, 0 to disable (default 100)
+    ESPN_MAX_RETRIES      retries per request (default 4)
+    ESPN_BASE_URL         send every request to this host instead of ESPN,
+                          e.g. the mock server: http://127.0.0.1:8765
+    ESPN_ARCHIVE_PATH     keep every response body in this response_archive.py
+                          directory (default: no archive)
+    ESPN_REPLAY           1 to answer requests from the archive with no network
+"""
+
+import os
+import time
+import random
+import atexit
+import asyncio
+import threading
+import importlib.util
+from collections import deque
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+
+from response_archive import ResponseArchive, DEFAULT_ARCHIVE_PATH
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+
+class TokenBucket:
+    """Allows `rate` requests per second with bursts of up to `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds):
+        """Drain the bucket so nobody sends for `seconds` (after a 429)"""
+        if self.rate:
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+def retry_after_seconds(response):
+    """Retry-After as seconds (delta or HTTP date), or None"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff: uniform(0, base * 2^attempt), capped"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+class ESPNClient:
+    def __init__(self, max_concurrency=None, rate_limit=None, max_retries=None,
+                 base_url=None, timeout=30.0, archive_path=None, replay=None):
+        self.max_concurrency = max_concurrency or int(os.getenv('ESPN_MAX_CONCURRENCY', 20))
+        self.rate_limit = rate_limit if rate_limit is not None else float(os.getenv('ESPN_RATE_LIMIT', 100))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('ESPN_MAX_RETRIES', 4))
+        self.base_url = base_url or os.getenv('ESPN_BASE_URL')
+        self.timeout = timeout
+        self.http2 = importlib.util.find_spec('h2') is not None
+        self.replay = replay if replay is not None else os.getenv('ESPN_REPLAY', '').lower() in ('1', 'true')
+        archive_path = archive_path or os.getenv('ESPN_ARCHIVE_PATH')
+        if self.replay and not archive_path:
+            archive_path = DEFAULT_ARCHIVE_PATH
+        self.archive = ResponseArchive(archive_path) if archive_path else None
+
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._semaphore = None
+        self._bucket = TokenBucket(self.rate_limit)
+        self._start_lock = threading.Lock()
+
+    # --- event loop -------------------------------------------------------
+
+    def _ensure_loop(self):
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name='espn-client', daemon=True
+                )
+                self._thread.start()
+        return self._loop
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro):
+        """Run a coroutine on the engine's loop and wait for its result"""
+        return self._submit(coro).result()
+
+    def close(self):
+        """Close the connection pool and stop the loop"""
+        if self._loop is None:
+            return
+        if self._client is not None:
+            self.run(self._client.aclose())
+            self._client = None
+        if self.archive is not None:
+            self.archive.close()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    # --- requests ---------------------------------------------------------
+
+    def _rewrite(self, url):
+        if not self.base_url:
+            return url
+        base = urlsplit(self.base_url)
+        parts = urlsplit(url)
+        return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+    def _replay(self, url, params):
+        """The archived response for a request, or a 404 if it was never archived"""
+        request = httpx.Request('GET', url, params=params)
+        body = self.archive.load(url, params)
+        if body is None:
+            return httpx.Response(404, request=request)
+        return httpx.Response(200, content=body, request=request,
+                              headers={'Content-Type': 'application/json'})
+
+    async def get(self, url, params=None, headers=None):
+        """
+        GET a URL through the shared pool, retrying 429/5xx and transport errors.
+
+        Returns the final httpx.Response (callers still raise_for_status());
+        raises the last transport error once retries are exhausted. Safe to
+        await from any event loop. In replay mode the response comes from the
+        archive without touching the network, rate limit or concurrency cap.
+        """
+        if self.replay:
+            return self._replay(url, params)
+
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is not loop:
+            return await asyncio.wrap_future(self._submit(self.get(url, params=params, headers=headers)))
+
+        if self._client is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=30.0
+                )
+            )
+
+        archive_url = url
+        url = self._rewrite(url)
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+            self.requests += 1
+            try:
+                async with self._semaphore:
+                    response = await self._client.get(url, params=params, headers=headers)
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    self.failures += 1
+                    raise
+                delay = backoff_delay(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    if self.archive is not None and response.status_code == 200:
+                        # Compressing off the loop keeps other requests moving
+                        await asyncio.to_thread(self.archive.store, archive_url, params, response.content)
+                    return response
+                if attempt == self.max_retries:
+                    self.failures += 1
+                    return response
+                delay = retry_after_seconds(response)
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                if response.status_code == 429:
+                    self._bucket.pause(delay)
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def gather(self, func, items):
+        """Await func(item) for every item concurrently, results in input order"""
+        return await asyncio.gather(*(func(item) for item in items))
+
+    def map(self, func, items, window=None):
+        """
+        Like ThreadPoolExecutor.map() for a coroutine function: yields
+        func(item) results in input order. At most `window` calls are
+        scheduled ahead of the consumer (default 16x the concurrency cap).
+        """
+        window = window or self.max_concurrency * 16
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(self._submit(func(item)))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'failures': self.failures,
+            'http2': self.http2,
+            'archived': self.archive.stored + self.archive.deduplicated if self.archive else 0,
+            'replayed': self.archive.replayed if self.archive else 0
+        }
+
+
+# Process-wide engine shared by every script
+espn = ESPNClient()
+atexit.register(espn.close)
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Declarative ESPN JSON -> table row mappings shared by the ingest scripts.
+
+Each RowMapping lists a table's columns in INSERT order and where each one
+comes from in the payload, as a dotted path from one of the mapping's roots
+('competition.status.type.id'), optionally with a converter. The spec is
+compiled once, at import, into a plain Python function that walks every
+shared prefix a single time and returns the row as a tuple ready for
+executemany(), so fetchers no longer build a dict per row through chains
+of .get(..., {}) and then copy it into a tuple:
+
+    row = GAME.extract(header, competition, game_info, home, away)
+    cursor.executemany(GAME.insert_sql, rows)
+
+A missing or null object anywhere along a path yields None for the column
+instead of raising.
+
+check_mappings() compares every mapping with the tables create_db.py
+creates, so a renamed or misspelled column fails the check instead of
+being dropped silently.
+
+Usage:
+    python3 data/espn_mappings.py            # check every mapping against create_db.py
+    python3 data/espn_mappings.py --source   # also print the generated extractors
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+
+from boxscore_stats import PLAYER_NUMERIC_COLUMNS, TEAM_NUMERIC_COLUMNS
+
+_EMPTY = {}
+
+
+class RowMapping:
+    def __init__(self, table, roots, fields):
+        """
+        Args:
+            table: Table the rows are written to
+            roots: Argument names of extract(), e.g. ('event_id', 'item')
+            fields: (column, source) or (column, source, convert) in column
+                    order. source is a dotted path starting at a root (a bare
+                    root name is the root itself) or a tuple of paths, whose
+                    values are passed to convert together.
+        """
+        self.table = table
+        self.roots = tuple(roots)
+        self.columns = [field[0] for field in fields]
+        # Quoted, as columns such as "3PT" and "TO" need to be
+        quoted = ', '.join('"' + column + '"' for column in self.columns)
+        self.insert_sql = (
+            f"INSERT OR REPLACE INTO {table} ({quoted}) VALUES ({', '.join('?' * len(self.columns))})"
+        )
+        self.source, self.extract = compile_extractor(table, self.roots, fields)
+        self._positions = {column: position for position, column in enumerate(self.columns)}
+
+    def index(self, column):
+        """Position of a column in extracted rows"""
+        return self._positions[column]
+
+
+def compile_extractor(table, roots, fields):
+    """Generate and compile extract(*roots) for a field list; returns (source, function)"""
+    lines = [f"def extract({', '.join(roots)}):"]
+    namespace = {'_EMPTY': _EMPTY}
+    objects = {}
+
+    def obj(root, keys):
+        """Local variable holding the dict at root.keys ({} when missing or not a dict)"""
+        path = (root, *keys)
+        if path not in objects:
+            source = f"{obj(root, keys[:-1])}.get({keys[-1]!r})" if keys else root
+            name = f"_obj{len(objects)}"
+            lines.append(f"    {name} = {source}")
+            lines.append(f"    if {name}.__class__ is not dict: {name} = _EMPTY")
+            objects[path] = name
+        return objects[path]
+
+    def value(path):
+        root, *keys = path.split('.')
+        if root not in roots:
+            raise ValueError(f"{table}: {path!r} does not start at one of {roots}")
+        if not keys:
+            return root
+        return f"{obj(root, keys[:-1])}.get({keys[-1]!r})"
+
+    values = []
+    for position, field in enumerate(fields):
+        column, source, convert = (*field, None) if len(field) == 2 else field
+        expressions = [value(path) for path in (source if isinstance(source, tuple) else (source,))]
+        if convert is None:
+            values.append(expressions[0])
+        else:
+            namespace[f"_convert{position}"] = convert
+            values.append(f"_convert{position}({', '.join(expressions)})")
+
+    lines.append("    return (")
+    lines.extend(f"        {expression}," for expression in values)
+    lines.append("    )")
+    source = '\n'.join(lines)
+    exec(compile(source, f"<{table} mapping>", 'exec'), namespace)
+    return source, namespace['extract']
+
+
+# --- converters -------------------------------------------------------------
+
+def json_value(value):
+    return json.dumps(value)
+
+
+def json_list(value):
+    """JSON for a list field, [] when ESPN leaves it out"""
+    return json.dumps(value if value is not None else [])
+
+
+def first_href(items):
+    """href of the first item of a list (e.g. a team's logos)"""
+    return items[0].get('href') if items else None
+
+
+def joined_id(*parts):
+    """'401_52': ids joined into a composite key"""
+    return '_'.join(str(part) for part in parts)
+
+
+def ref_id(collection):
+    """Converter taking the id out of a $ref URL: .../teams/52?lang=en -> '52'"""
+    marker = f"/{collection}/"
+
+    def convert(ref):
+        if not isinstance(ref, str) or marker not in ref:
+            return None
+        return ref.split(marker)[1].split('?')[0]
+    return convert
+
+
+def record_stat(name):
+    """Converter taking one stat (wins, losses, ...) out of a record's stats list"""
+    def convert(stats):
+        value = None
+        for stat in stats or ():
+            if stat.get('name') == name:
+                value = stat.get('value')
+        return value
+    return convert
+
+
+def headshot_or_default(href, player_id):
+    if href is not None:
+        return href
+    return f"https://a.espncdn.com/i/headshots/mens-college-basketball/players/full/{player_id}.png"
+
+
+# --- mappings ---------------------------------------------------------------
+
+def competitor_fields(side):
+    """games columns for the home or away competitor"""
+    return [
+        (f'{side}_team_id', f'{side}.id'),
+        (f'{side}_team_winner', f'{side}.winner'),
+        (f'{side}_team_score', f'{side}.score'),
+        (f'{side}_linescores', f'{side}.linescores', json_list),
+        (f'{side}_team_records', f'{side}.record', json_list),
+        (f'{side}_team_guid', f'{side}.team.guid'),
+        (f'{side}_team_uid', f'{side}.team.uid'),
+        (f'{side}_team_location', f'{side}.team.location'),
+        (f'{side}_team_name', f'{side}.team.name'),
+        (f'{side}_team_abbreviation', f'{side}.team.abbreviation'),
+        (f'{side}_team_nickname', f'{side}.team.nickname'),
+        (f'{side}_team_displayName', f'{side}.team.displayName'),
+        (f'{side}_team_color', f'{side}.team.color'),
+        (f'{side}_team_alternate_color', f'{side}.team.alternateColor'),
+        (f'{side}_team_logos', f'{side}.team.logos', json_list),
+        (f'{side}_team_logo', f'{side}.team.logos', first_href),
+        (f'{side}_team_conference_id', f'{side}.team.groups.id'),
+        (f'{side}_team_conference_slug', f'{side}.team.groups.slug'),
+    ]
+
+
+# Game summary: header, header.competitions[0], gameInfo and the two competitors
+GAME = RowMapping('games', ('header', 'competition', 'game_info', 'home', 'away'), [
+    ('id', 'header.id'),
+    ('uid', 'header.uid'),
+    ('season_year', 'header.season.year'),
+    ('season_type', 'header.season.type'),
+    ('week', 'header.week'),
+    ('game_note', 'header.gameNote'),
+    ('timeValid', 'header.timeValid'),
+    ('date', 'competition.date'),
+    ('is_neutral_site', 'competition.neutralSite'),
+    ('is_conference_competition', 'competition.conferenceCompetition'),
+    ('event_status_id', 'competition.status.type.id'),
+    ('event_status_name', 'competition.status.type.name'),
+    ('event_status_state', 'competition.status.type.state'),
+    ('event_status_completed', 'competition.status.type.completed'),
+    ('event_status_description', 'competition.status.type.description'),
+    ('event_status_detail', 'competition.status.type.detail'),
+    ('event_status_short_detail', 'competition.status.type.shortDetail'),
+    ('event_tournament_id', 'competition.tournamentId'),
+    ('venue_id', 'game_info.venue.id'),
+    ('attendance', 'game_info.attendance'),
+    ('officials', 'game_info.officials', json_value),
+    *competitor_fields('home'),
+    *competitor_fields('away'),
+])
+
+# Text columns of team_boxscores, named after ESPN's statistics (see boxscore_stats.add_team_stat)
+TEAM_TEXT_STATS = [
+    'fieldGoalsMade', 'fieldGoalsAttempted', 'fieldGoalPct', 'threePointFieldGoalsMade',
+    'threePointFieldGoalsAttempted', 'threePointFieldGoalPct', 'freeThrowsMade', 'freeThrowsAttempted',
+    'freeThrowPct', 'totalRebounds', 'offensiveRebounds', 'defensiveRebounds', 'assists', 'steals',
+    'blocks', 'turnovers', 'teamTurnovers', 'totalTurnovers', 'technicalFouls', 'flagrantFouls',
+    'fouls', 'largestLead',
+]
+
+# One entry of boxscore.teams; stats holds its parsed statistics
+TEAM_BOXSCORE = RowMapping('team_boxscores', ('event_id', 'team', 'stats'), [
+    ('event_team_id', ('event_id', 'team.team.id'), joined_id),
+    ('event_id', 'event_id'),
+    ('team_id', 'team.team.id'),
+    ('home_away', 'team.homeAway'),
+    *((name, f'stats.{name}') for name in TEAM_TEXT_STATS),
+    *((column, f'stats.{column}') for column in TEAM_NUMERIC_COLUMNS),
+])
+
+# Text columns of player_boxscores, named after ESPN's boxscore labels
+PLAYER_TEXT_STATS = ['MIN', 'FG', '3PT', 'FT', 'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TO', 'PF', 'PTS']
+
+# One athlete of boxscore.players[].statistics[0]; stats maps labels to values
+PLAYER_BOXSCORE = RowMapping('player_boxscores', ('event_id', 'team_id', 'athlete', 'stats'), [
+    ('event_athlete_id', ('event_id', 'athlete.athlete.id'), joined_id),
+    ('event_id', 'event_id'),
+    ('athlete_id', 'athlete.athlete.id'),
+    ('team_id', 'team_id'),
+    ('athlete_name', 'athlete.athlete.displayName'),
+    ('athlete_headshot', 'athlete.athlete.headshot.href'),
+    ('athlete_jersey', 'athlete.athlete.jersey'),
+    ('athlete_position_name', 'athlete.athlete.position.name'),
+    ('athlete_position_abbreviation', 'athlete.athlete.position.abbreviation'),
+    ('athlete_position_display_name', 'athlete.athlete.position.displayName'),
+    ('athlete_starter', 'athlete.starter'),
+    ('athlete_did_not_play', 'athlete.didNotPlay'),
+    ('athlete_ejected', 'athlete.ejected'),
+    *((label, f'stats.{label}') for label in PLAYER_TEXT_STATS),
+    *((column, f'stats.{column}') for column in PLAYER_NUMERIC_COLUMNS),
+])
+
+
+def team_odds_fields(side):
+    return [
+        (f'{side}_team_favorite', f'{side}.favorite'),
+        (f'{side}_team_underdog', f'{side}.underdog'),
+        (f'{side}_team_moneyline', f'{side}.moneyLine'),
+        (f'{side}_team_spread_odds', f'{side}.spreadOdds'),
+        (f'{side}_team_spread', f'{side}.spread.displayValue'),
+        (f'{side}_team_id', f'{side}.team.id'),
+    ]
+
+
+# One provider's item of the competition odds; home/away are its team odds entries
+ODDS = RowMapping('odds', ('event_id', 'item', 'home', 'away'), [
+    ('event_provider_id', ('event_id', 'item.provider.id'), joined_id),
+    ('event_id', 'event_id'),
+    ('provider_id', 'item.provider.id'),
+    ('provider_name', 'item.provider.name'),
+    ('details', 'item.details'),
+    ('over_under', 'item.overUnder'),
+    ('spread', 'item.spread'),
+    ('over_odds', 'item.overOdds'),
+    ('under_odds', 'item.underOdds'),
+    *team_odds_fields('away'),
+    *team_odds_fields('home'),
+])
+
+
+def predictor_fields(side):
+    return [
+        (f'{side}_team_id', f'data.{side}.team.id'),
+        (f'{side}_gameProjection', f'data.{side}.gameProjection'),
+        (f'{side}_gameProjection_display', f'data.{side}.gameProjectionDisplay'),
+        (f'{side}_teamChanceLoss', f'data.{side}.teamChanceLoss'),
+        (f'{side}_teamChanceLoss_display', f'data.{side}.teamChanceLossDisplay'),
+    ]
+
+
+# Competition predictor
+PREDICTION = RowMapping('predictions', ('event_id', 'data'), [
+    ('event_id', 'event_id'),
+    ('name', 'data.name'),
+    ('short_name', 'data.shortName'),
+    *predictor_fields('homeTeam'),
+    *predictor_fields('awayTeam'),
+])
+
+# Athlete in a season roster; season and player_id come from its URL
+PLAYER_SEASON = RowMapping('player_seasons', ('season', 'player_id', 'data'), [
+    ('season_player_id', ('season', 'player_id'), lambda season, player_id: f"{season}-{player_id}"),
+    ('season', 'season'),
+    ('player_id', 'player_id'),
+    ('uid', 'data.uid'),
+    ('guid', 'data.guid'),
+    ('firstName', 'data.firstName'),
+    ('lastName', 'data.lastName'),
+    ('fullName', 'data.fullName'),
+    ('displayName', 'data.displayName'),
+    ('shortName', 'data.shortName'),
+    ('weight', 'data.weight'),
+    ('displayWeight', 'data.displayWeight'),
+    ('height', 'data.height'),
+    ('displayHeight', 'data.displayHeight'),
+    ('birthPlace_city', 'data.birthPlace.city'),
+    ('birthPlace_state', 'data.birthPlace.state'),
+    ('birthPlace_country', 'data.birthPlace.country'),
+    ('slug', 'data.slug'),
+    ('headshot', ('data.headshot.href', 'player_id'), headshot_or_default),
+    ('jersey', 'data.jersey'),
+    ('hand_type', 'data.hand.type'),
+    ('hand_abbreviation', 'data.hand.abbreviation'),
+    ('hand_displayValue', 'data.hand.displayValue'),
+    ('flag_href', 'data.flag.href'),
+    ('position_id', 'data.position.id'),
+    ('position_name', 'data.position.name'),
+    ('position_abbreviation', 'data.position.abbreviation'),
+    ('position_displayValue', 'data.position.displayValue'),
+    ('team_id', 'data.team.$ref', ref_id('teams')),
+    ('experience_years', 'data.experience.years'),
+    ('experience_displayValue', 'data.experience.displayValue'),
+    ('experience_abbreviation', 'data.experience.abbreviation'),
+])
+
+# Active athlete from the v3 athletes list (one player's current details)
+PLAYER = RowMapping('players', ('data',), [
+    ('id', 'data.id'),
+    ('uid', 'data.uid'),
+    ('guid', 'data.guid'),
+    ('firstName', 'data.firstName'),
+    ('lastName', 'data.lastName'),
+    ('displayName', 'data.displayName'),
+    ('shortName', 'data.shortName'),
+    ('weight', 'data.weight'),
+    ('displayWeight', 'data.displayWeight'),
+    ('height', 'data.height'),
+    ('displayHeight', 'data.displayHeight'),
+    ('birthPlace_city', 'data.birthPlace.city'),
+    ('birthPlace_state', 'data.birthPlace.state'),
+    ('birthPlace_country', 'data.birthPlace.country'),
+    ('experience_years', 'data.experience.years'),
+    ('experience_displayValue', 'data.experience.displayValue'),
+    ('experience_abbreviation', 'data.experience.abbreviation'),
+    ('jersey', 'data.jersey'),
+    ('hand_type', 'data.hand.type'),
+    ('hand_abbreviation', 'data.hand.abbreviation'),
+    ('hand_displayValue', 'data.hand.displayValue'),
+])
+
+# One team of a poll week's ranks, others or droppedOut; team_id comes from its $ref
+RANKING = RowMapping('rankings', ('week', 'team_id', 'ranked', 'ranked_type'), [
+    ('season_week_team', ('week.season.year', 'week.occurrence.number', 'team_id'), joined_id),
+    ('season', 'week.season.year'),
+    ('week', 'week.occurrence.number'),
+    ('team_id', 'team_id'),
+    ('week_displayValue', 'week.occurrence.displayValue'),
+    ('headline', 'week.headline'),
+    ('short_headline', 'week.shortHeadline'),
+    ('season_displayName', 'week.season.displayName'),
+    ('ranking_provider_id', 'week.id'),
+    ('ranking_provider_name', 'week.name'),
+    ('ranking_provider_type', 'week.type'),
+    ('current_rank', 'ranked.current'),
+    ('previous_rank', 'ranked.previous'),
+    ('first_place_votes', 'ranked.firstPlaceVotes'),
+    ('points', 'ranked.points'),
+    ('trend', 'ranked.trend'),
+    ('record_summary', 'ranked.record.summary'),
+    ('record_wins', 'ranked.record.stats', record_stat('wins')),
+    ('record_losses', 'ranked.record.stats', record_stat('losses')),
+    ('record_ties', 'ranked.record.stats', record_stat('ties')),
+    ('ranked_type', 'ranked_type'),
+])
+
+MAPPINGS = [GAME, TEAM_BOXSCORE, PLAYER_BOXSCORE, ODDS, PREDICTION, PLAYER_SEASON, PLAYER, RANKING]
+
+
+def check_mappings(verbose=True):
+    """
+    Check every mapping against a database built by create_db.py.
+
+    Returns:
+        List of problems (columns a mapping writes that its table lacks)
+    """
+    from db import connect
+    from create_db import create_database
+
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'schema.db')
+        create_database(path, verbose=False)
+        conn = connect(path)
+        for mapping in MAPPINGS:
+            table_columns = [row[1] for row in conn.execute(f"PRAGMA table_info({mapping.table})")]
+            missing = [column for column in mapping.columns if column not in table_columns]
+            unmapped = [column for column in table_columns if column not in mapping.columns]
+            problems.extend(f"{mapping.table}.{column} is mapped but not in create_db.py" for column in missing)
+            if verbose:
+                mark = '✗' if missing else '✓'
+                print(f"{mark} {mapping.table:<17} {len(mapping.columns)} columns mapped"
+                      + (f", not mapped: {', '.join(unmapped)}" if unmapped else ""))
+        conn.close()
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the ESPN row mappings against create_db.py")
+    parser.add_argument('--source', action='store_true', help="Print the generated extractors")
+    args = parser.parse_args()
+
+    if args.source:
+        for mapping in MAPPINGS:
+            print(f"# {mapping.table}\n{mapping.source}\n")
+    problems = check_mappings()
+    for problem in problems:
+        print(f"  {problem}")
+    sys.exit(1 if problems else 0)
@@ -1,19 +1,8 @@
-import httpx
 import pandas as pd
-import sqlite3
-import concurrent.futures
-import threading
+from db import connect
+from espn_client import espn
 
-# Thread-local storage for httpx clients
-_thread_local = threading.local()
-
-def get_client():
-    """Get or create a thread-local httpx client"""
-    if not hasattr(_thread_local, 'client'):
-        _thread_local.client = httpx.Client(timeout=30.0)
-    return _thread_local.client
-
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 
 cursor = conn.cursor()
 
@@ -24,11 +13,11 @@ event_ids = sorted([int(x[0]) for x in event_ids])
 conn.close()
 
 
-def get_odds_for_game(event_id):
+async def get_odds_for_game(event_id):
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/events/{event_id}/competitions/{event_id}/odds/"
 
     try:
-        response = get_client().get(url)
+        response = await espn.get(url)
         response.raise_for_status()
         data = response.json()
     except Exception as e:
@@ -87,18 +76,15 @@ def get_odds_for_game(event_id):
 
 all_odds = []
 
-# Using ThreadPoolExecutor to fetch rosters in parallel
-# You can adjust max_workers if needed
-with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-    results = executor.map(get_odds_for_game, event_ids[40000:])
-
-    for odds in results:
-        if odds:  # Only append if it's not None
-            all_odds.extend(odds)
+# Fetch odds in parallel through the shared ESPN client
+# You can adjust ESPN_MAX_CONCURRENCY if needed
+for odds in espn.map(get_odds_for_game, event_ids[40000:]):
+    if odds:  # Only append if it's not None
+        all_odds.extend(odds)
 
 
 # Connect to database and insert/update data
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 cursor = conn.cursor()
 
 # Batch insert/update odds
@@ -1,19 +1,9 @@
 import pandas as pd
 import httpx
-import sqlite3
-import concurrent.futures
-import threading
+from db import connect
+from espn_client import espn
 
-# Thread-local storage for httpx clients
-_thread_local = threading.local()
-
-def get_client():
-    """Get or create a thread-local httpx client"""
-    if not hasattr(_thread_local, 'client'):
-        _thread_local.client = httpx.Client(timeout=30.0)
-    return _thread_local.client
-
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 # conn = sqlite3.connect('ncaab.db')
 
 cursor = conn.cursor()
@@ -24,11 +14,11 @@ event_ids = cursor.fetchall()
 event_ids = sorted([int(x[0]) for x in event_ids])
 conn.close()
 
-def get_prediction_for_game(event_id):
+async def get_prediction_for_game(event_id):
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/events/{event_id}/competitions/{event_id}/predictor?lang=en&region=us"
 
     try:
-        response = get_client().get(url=url)
+        response = await espn.get(url)
         # This will raise HTTPStatusError if the response is 4xx or 5xx
         response.raise_for_status()
     except httpx.HTTPStatusError as e:
@@ -71,18 +61,15 @@ def get_prediction_for_game(event_id):
 
 all_predictions = []
 
-# Using ThreadPoolExecutor to fetch rosters in parallel
-# You can adjust max_workers if needed
-with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-    results = executor.map(get_prediction_for_game, event_ids[40000:])
-
-    for prediction in results:
-        if prediction:  # Only append if it's not None
-            all_predictions.append(prediction)
+# Fetch predictions in parallel through the shared ESPN client
+# You can adjust ESPN_MAX_CONCURRENCY if needed
+for prediction in espn.map(get_prediction_for_game, event_ids[40000:]):
+    if prediction:  # Only append if it's not None
+        all_predictions.append(prediction)
 
 
 # Connect to database and insert/update data
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 cursor = conn.cursor()
 
 # Batch insert/update predictions
@@ -1,27 +1,18 @@
-import sqlite3
-import httpx
 import pandas as pd
-import concurrent.futures
 import json
-import threading
-
-# Thread-local storage for httpx clients
-_thread_local = threading.local()
-
-def get_client():
-    """Get or create a thread-local httpx client"""
-    if not hasattr(_thread_local, 'client'):
-        _thread_local.client = httpx.Client(timeout=30.0)
-    return _thread_local.client
+from db import connect
+from espn_client import espn
+from migrate import apply_migrations
+from search_index import sync_search_index
 
 ## Get current teams
 
-def get_current_teams():
+async def get_current_teams():
     url = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/teams"
     params = {
         "limit": 1000
     }
-    response = get_client().get(url, params=params)
+    response = await espn.get(url, params=params)
     response.raise_for_status()
     data = response.json()
     
@@ -47,9 +38,9 @@ def get_current_teams():
         all_teams.append(team_dict)
     return all_teams
 
-current_teams = get_current_teams()
+current_teams = espn.run(get_current_teams())
 
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 cursor = conn.cursor()
 cursor.execute('SELECT year FROM seasons ORDER BY year DESC')
 years = [row[0] for row in cursor.fetchall()]
@@ -57,14 +48,14 @@ conn.close()
 
 
 # Get conferences per year AKA groups
-def get_conference_urls_per_year(year):
+async def get_conference_urls_per_year(year):
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{year}/types/2/groups/50/children"
     params = {
         "lang": "en",
         "region": "us",
         'limit' : 100
     }
-    response = get_client().get(url, params=params)
+    response = await espn.get(url, params=params)
     data = response.json()
     urls = data.get('items',[])
     urls = [url.get('$ref') for url in urls]
@@ -73,16 +64,13 @@ def get_conference_urls_per_year(year):
 
 all_conference_urls = []
 
-# Using ThreadPoolExecutor to fetch conference URLs in parallel
-with concurrent.futures.ThreadPoolExecutor() as executor:
-    results = executor.map(get_conference_urls_per_year, years)
-    
-    for urls in results:
-        all_conference_urls.extend(urls)
+# Fetch conference URLs in parallel through the shared ESPN client
+for urls in espn.map(get_conference_urls_per_year, years):
+    all_conference_urls.extend(urls)
 
 
-def get_conference_data(conference_url):
-    response = httpx.get(conference_url)
+async def get_conference_data(conference_url):
+    response = await espn.get(conference_url)
     response.raise_for_status()
     data = response.json()
 
@@ -108,17 +96,15 @@ def get_conference_data(conference_url):
 
 
 all_conferences = []
-with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-    results = executor.map(get_conference_data, all_conference_urls)
-    for conference in results:
-        all_conferences.append(conference)
+for conference in espn.map(get_conference_data, all_conference_urls):
+    all_conferences.append(conference)
 
 
-def add_child_conferences(conf):
+async def add_child_conferences(conf):
     season = conf['season']
     parent = conf['id']
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{season}/types/2/groups/{parent}/children?lang=en&region=us"
-    response = get_client().get(url)
+    response = await espn.get(url)
     response.raise_for_status()
 
     data = response.json()
@@ -126,8 +112,8 @@ def add_child_conferences(conf):
     child_urls = [x['$ref'] for x in data.get('items',[])]
 
     # Helper function to fetch individual child conference
-    def fetch_child_conference(child_url):
-        response = get_client().get(child_url)
+    async def fetch_child_conference(child_url):
+        response = await espn.get(child_url)
         response.raise_for_status()
         data = response.json()
 
@@ -153,21 +139,16 @@ def add_child_conferences(conf):
 
     # Parallelize child conference fetching
     child_confs = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        results = executor.map(fetch_child_conference, child_urls)
-        child_confs.extend(results)
+    child_confs.extend(await espn.gather(fetch_child_conference, child_urls))
 
     return child_confs
 
 # Filter conferences that have children
 has_children = [conf for conf in all_conferences if conf['has_children']]
 
-# Multithreaded execution
-with concurrent.futures.ThreadPoolExecutor() as executor:
-    results = executor.map(add_child_conferences, has_children)
-
-    for child_list in results:
-        all_conferences.extend(child_list)
+# Parallel execution through the shared ESPN client
+for child_list in espn.map(add_child_conferences, has_children):
+    all_conferences.extend(child_list)
 
 # Sort all_conferences by season_id to ensure consistent ordering across runs
 all_conferences.sort(key=lambda x: x['season_id'])
@@ -175,7 +156,7 @@ all_conferences.sort(key=lambda x: x['season_id'])
 
 
 
-def get_teams_per_conference_per_season(conf_row):
+async def get_teams_per_conference_per_season(conf_row):
     season = conf_row['season']
     conference_id = conf_row['id']
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{season}/types/2/groups/{conference_id}/teams?lang=en&region=us"
@@ -185,7 +166,7 @@ def get_teams_per_conference_per_season(conf_row):
         'lang' : 'en'
     }
 
-    response = get_client().get(url, params=params)
+    response = await espn.get(url, params=params)
     response.raise_for_status()
 
     data = response.json()
@@ -194,8 +175,8 @@ def get_teams_per_conference_per_season(conf_row):
     
     
     # Helper to fetch individual team details
-    def get_team_details(team_url):
-        team_response = get_client().get(team_url)
+    async def get_team_details(team_url):
+        team_response = await espn.get(team_url)
         team_response.raise_for_status()
         
         team_data = team_response.json()
@@ -221,10 +202,8 @@ def get_teams_per_conference_per_season(conf_row):
         }
 
     teams_list = []
-    # Using ThreadPoolExecutor specifically for parsing the team details
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        results = executor.map(get_team_details, team_urls)
-        teams_list.extend(results)
+    # Fetch the team details in parallel
+    teams_list.extend(await espn.gather(get_team_details, team_urls))
 
     return teams_list
 
@@ -234,20 +213,19 @@ all_teams_list = []
 
 
 
-# Multithreaded execution across conferences
-with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-    # Map the function over the conferences and convert to list to ensure all threads complete
-    conference_results = list(executor.map(get_teams_per_conference_per_season, all_conferences[900:]))
+# Parallel execution across conferences
+# Convert to list to ensure every fetch completes before inserting
+conference_results = list(espn.map(get_teams_per_conference_per_season, all_conferences[900:]))
 
-    for conference_teams in conference_results:
-        if conference_teams:
-            # display(pd.DataFrame(conference_teams))
-            # Accumulate all teams into the main teams_list
-            all_teams_list.extend(conference_teams)
+for conference_teams in conference_results:
+    if conference_teams:
+        # display(pd.DataFrame(conference_teams))
+        # Accumulate all teams into the main teams_list
+        all_teams_list.extend(conference_teams)
 
 
 # Connect to database and insert/update data
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 cursor = conn.cursor()
 
 # Batch insert/update current teams
@@ -288,6 +266,10 @@ cursor.executemany('''
     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 ''', team_seasons_data)
 
+# Keep team name search current
+apply_migrations(cursor)
+sync_search_index(cursor, team_ids=[team['id'] for team in current_teams])
+
 conn.commit()
 conn.close()
 
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Indexes behind the API's queries, one per query pattern in backend/api/routes.
+
+Each entry names the routes it serves; backend/benchmarks/check_query_plans.py
+runs EXPLAIN QUERY PLAN over every route's SQL and fails on a full table
+scan, so a route that needs an index missing here shows up there.
+
+Indexes other modules create with their tables (ingest_state, odds_snapshots,
+team_season_records) and the player_boxscores stats index from migration 2
+are not repeated here.
+
+The planner only prefers the narrow composites (e.g. a team's games in a
+season over every game in the season) once ANALYZE has recorded how
+selective each index is, so update_daily.py refreshes the statistics after
+every run.
+
+Usage:
+    python3 data/indexes.py    # create any missing indexes, refresh statistics
+"""
+
+from db import connect
+
+# Rows ANALYZE samples per index
+ANALYSIS_LIMIT = 1000
+
+# (index name, table, columns, routes served)
+ROUTE_INDEXES = [
+    # /games (cursor walk, ?date=), /games/today, /betting/lines, /live, betting-edges
+    ('idx_games_date', 'games', ['date'], 'date ranges'),
+    ('idx_games_date_id', 'games', ['date', 'id'], '/games keyset pages'),
+    # /games?season=, season records, power rankings as of a week, standings head-to-head
+    ('idx_games_season_completed', 'games', ['season_year', 'event_status_completed'],
+     'season aggregates'),
+    # /teams/{id}/schedule and /games?team_id=: one index per side of the OR
+    ('idx_games_home_team_season', 'games', ['home_team_id', 'season_year'], 'team schedule'),
+    ('idx_games_away_team_season', 'games', ['away_team_id', 'season_year'], 'team schedule'),
+
+    # /teams/{id}/roster, ordered by name without a sort
+    ('idx_player_seasons_team_season', 'player_seasons', ['team_id', 'season', 'displayName'],
+     'team roster'),
+    # /players/{id}/seasons
+    ('idx_player_seasons_player_season', 'player_seasons', ['player_id', 'season'],
+     'player seasons'),
+
+    # /games/{id}/boxscore: starters first, then points, read in index order
+    ('idx_player_boxscores_event', 'player_boxscores', ['event_id', 'athlete_starter', 'points'],
+     'game boxscore'),
+    ('idx_team_boxscores_event', 'team_boxscores', ['event_id'], 'game boxscore'),
+    # /teams/{id}/player-stats
+    ('idx_player_boxscores_team_event', 'player_boxscores', ['team_id', 'event_id'],
+     'team player stats'),
+
+    # /analytics/ap-poll: latest week and that week's poll for a season
+    ('idx_rankings_season_provider_week', 'rankings', ['season', 'ranking_provider_name', 'week'],
+     'AP poll'),
+
+    # /games/{id}/odds, /betting/compare/{id}, betting-edges joins
+    ('idx_odds_event', 'odds', ['event_id'], 'game odds'),
+    # /betting/providers: DISTINCT read from the index alone
+    ('idx_odds_provider', 'odds', ['provider_id', 'provider_name'], 'providers'),
+
+    ('idx_team_seasons_season', 'team_seasons', ['season'], 'season team lists'),
+    ('idx_conferences_season', 'conferences', ['season'], 'season conference lists'),
+]
+
+
+def create_route_indexes(cursor):
+    """
+    Create any missing route indexes.
+
+    Returns:
+        Names of indexes that did not exist before
+    """
+    existing = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    created = []
+    for name, table, columns, _ in ROUTE_INDEXES:
+        if name in existing:
+            continue
+        cursor.execute(f"CREATE INDEX {name} ON {table}({', '.join(columns)})")
+        created.append(name)
+    return created
+
+
+def refresh_statistics(cursor):
+    """
+    Re-ANALYZE the database for the query planner.
+
+    analysis_limit samples each index instead of reading all of it, so this
+    stays cheap however large the tables get.
+    """
+    cursor.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+    cursor.execute("ANALYZE")
+
+
+if __name__ == "__main__":
+    conn = connect()
+    cursor = conn.cursor()
+    created = create_route_indexes(cursor)
+    refresh_statistics(cursor)
+    conn.commit()
+    conn.close()
+    for name in created:
+        print(f"  ✓ {name}")
+    print(f"✓ {len(created)} indexes created, {len(ROUTE_INDEXES) - len(created)} already present")
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Per-event ingest checkpoints: one ingest_state row per ESPN event ID.
+
+Each row records whether the game was written (done), was fetched but not
+finished yet (incomplete) or failed (error), with the attempt count, last
+error and when it last changed. Backfills consult it to skip finished
+events and retry only the rest, so an interrupted run resumes instead of
+starting over. It replaces data/event_ids.txt (the list of events to
+fetch) and data/event_errors.log (why they failed).
+
+Usage:
+    python3 data/ingest_state.py                 # counts per status, recent errors
+    python3 data/ingest_state.py --retry-errors  # reset attempt counts of failed events
+    python3 data/ingest_state.py --import-legacy # load event_ids.txt / event_errors.log
+"""
+
+import os
+import re
+import sys
+from db import connect
+
+PENDING = 'pending'
+DONE = 'done'
+INCOMPLETE = 'incomplete'
+ERROR = 'error'
+
+# Failed events are retried until they have failed this many times
+DEFAULT_MAX_ATTEMPTS = int(os.getenv('INGEST_MAX_ATTEMPTS', 5))
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def create_ingest_state_table(cursor):
+    """Create ingest_state and its status index"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ingest_state (
+            event_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_ingest_state_status
+        ON ingest_state(status)
+    ''')
+
+
+def seed_events(cursor, event_ids):
+    """Record discovered event IDs as pending (known events are left alone)"""
+    cursor.executemany(
+        "INSERT OR IGNORE INTO ingest_state (event_id) VALUES (?)",
+        [(str(event_id),) for event_id in event_ids]
+    )
+
+
+def events_to_fetch(cursor, event_ids=None, max_attempts=None):
+    """
+    Event IDs that still need fetching: everything not done, minus errors
+    that have already used up max_attempts.
+
+    Args:
+        event_ids: Restrict to these IDs (unknown IDs are included);
+                   all tracked events if None
+        max_attempts: Give up on errored events after this many attempts
+    """
+    max_attempts = max_attempts or DEFAULT_MAX_ATTEMPTS
+    finished = {
+        row[0] for row in cursor.execute(
+            "SELECT event_id FROM ingest_state WHERE status = ? OR (status = ? AND attempts >= ?)",
+            (DONE, ERROR, max_attempts)
+        )
+    }
+    if event_ids is None:
+        event_ids = [row[0] for row in cursor.execute("SELECT event_id FROM ingest_state ORDER BY event_id")]
+    return [event_id for event_id in event_ids if str(event_id) not in finished]
+
+
+def record_status(cursor, rows):
+    """
+    Record one fetch attempt per event.
+
+    Args:
+        rows: (event_id, status, error) tuples; error is None unless status is ERROR
+    """
+    cursor.executemany('''
+        INSERT INTO ingest_state (event_id, status, attempts, last_error, updated_at)
+        VALUES (?, ?, 1, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(event_id) DO UPDATE SET
+            status = excluded.status,
+            attempts = ingest_state.attempts + 1,
+            last_error = excluded.last_error,
+            updated_at = excluded.updated_at
+    ''', [(str(event_id), status, error) for event_id, status, error in rows])
+
+
+def tracked(fetch):
+    """
+    Wrap an async fetch(event_id) so it never raises: it returns
+    (event_id, result, None) on success and (event_id, None, error) on failure,
+    ready to be recorded alongside whatever was written.
+    """
+    async def fetch_tracked(event_id):
+        try:
+            return event_id, await fetch(event_id), None
+        except Exception as e:
+            return event_id, None, str(e) or type(e).__name__
+    return fetch_tracked
+
+
+def status_counts(cursor):
+    return dict(cursor.execute("SELECT status, COUNT(*) FROM ingest_state GROUP BY status").fetchall())
+
+
+def retry_errors(cursor):
+    """Reset failed events so the next run retries them regardless of attempts"""
+    cursor.execute("UPDATE ingest_state SET attempts = 0 WHERE status = ?", (ERROR,))
+    return cursor.rowcount
+
+
+def import_legacy_files(cursor, ids_path='data/event_ids.txt', errors_path='data/event_errors.log'):
+    """Load the old event_ids.txt and event_errors.log into ingest_state"""
+    imported = 0
+    if os.path.exists(ids_path):
+        with open(ids_path) as f:
+            event_ids = [line.strip() for line in f if line.strip()]
+        seed_events(cursor, event_ids)
+        imported += len(event_ids)
+
+    if os.path.exists(errors_path):
+        errors = []
+        with open(errors_path) as f:
+            for line in f:
+                match = re.match(r"Error fetching event (\d+): (.*)", line.strip())
+                if match:
+                    errors.append((match.group(1), ERROR, match.group(2)))
+        seed_events(cursor, [event_id for event_id, _, _ in errors])
+        # One log line per failed attempt
+        cursor.executemany('''
+            UPDATE ingest_state SET status = ?, attempts = attempts + 1, last_error = ?
+            WHERE event_id = ? AND status IN ('pending', 'error')
+        ''', [(status, error, event_id) for event_id, status, error in errors])
+        imported += len(errors)
+
+    # Anything already in games is done
+    cursor.execute('''
+        UPDATE ingest_state SET status = 'done', last_error = NULL
+        WHERE status != 'done' AND event_id IN (SELECT id FROM games)
+    ''')
+    return imported
+
+
+def print_status(cursor, limit=10):
+    counts = status_counts(cursor)
+    if not counts:
+        print("No events tracked yet")
+        return
+    for status in (DONE, PENDING, INCOMPLETE, ERROR):
+        print(f"  {status:<11} {counts.get(status, 0):>8}")
+
+    errors = cursor.execute('''
+        SELECT event_id, attempts, last_error, updated_at FROM ingest_state
+        WHERE status = ? ORDER BY updated_at DESC LIMIT ?
+    ''', (ERROR, limit)).fetchall()
+    if errors:
+        print(f"\nMost recent errors:")
+        for event_id, attempts, last_error, updated_at in errors:
+            print(f"  {event_id} ({attempts} attempts, {updated_at}): {last_error}")
+
+
+if __name__ == "__main__":
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    create_ingest_state_table(cursor)
+
+    if '--import-legacy' in sys.argv:
+        print(f"✓ Imported {import_legacy_files(cursor)} legacy entries")
+    if '--retry-errors' in sys.argv:
+        print(f"✓ {retry_errors(cursor)} failed events will be retried")
+
+    conn.commit()
+    print_status(cursor)
+    conn.close()
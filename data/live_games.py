@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Live game tracking for NCAA Basketball database.
+
+Polls ESPN's scoreboard (one request per day covers every game) and writes
+the status, scores and line scores of games in progress, so /games/today is
+fresh during game windows without refetching any summaries. Only columns
+that changed since the last poll are written. When a game goes final its
+full summary and boxscores are ingested once through update_games; until
+then the game is pending in ingest_state, so a restarted tracker (or the
+daily update) still picks it up. With Redis enabled, changes are also
+published on LIVE_SCORES_CHANNEL for the API's /api/v1/live push endpoints.
+
+The poll interval adapts to what is on the scoreboard:
+    LIVE_FAST_INTERVAL  a game is in its last five minutes or overtime (default 10s)
+    LIVE_INTERVAL       games are in progress (default 30s)
+    LIVE_IDLE_INTERVAL  nothing in progress; shortened to wake up for the
+                        next tip-off (default 300s)
+
+Usage:
+    python3 data/live_games.py [--once] [--quiet]
+
+Arguments:
+    --once      Poll once and exit
+    --quiet     Suppress verbose output
+"""
+
+import os
+import sys
+import json
+import time
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from db import connect
+from espn_client import espn
+from migrate import apply_migrations
+from update_games import fetch_and_write_games
+from ingest_state import DONE, seed_events, events_to_fetch
+from cache_invalidation import game_patterns, invalidate_patterns, get_redis_client
+
+SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard"
+
+FAST_INTERVAL = int(os.getenv('LIVE_FAST_INTERVAL', 10))
+LIVE_INTERVAL = int(os.getenv('LIVE_INTERVAL', 30))
+IDLE_INTERVAL = int(os.getenv('LIVE_IDLE_INTERVAL', 300))
+
+# Channel the API's live score feed listens on (backend LIVE_SCORES_CHANNEL)
+LIVE_SCORES_CHANNEL = os.getenv('LIVE_SCORES_CHANNEL', 'live:scores')
+
+# The scoreboard's dates parameter is a US-Eastern calendar day
+SCOREBOARD_TIMEZONE = ZoneInfo('America/New_York')
+
+# Last five minutes of the second half
+CLOSE_GAME_SECONDS = 300
+
+# Columns live polling maintains; everything else comes from the summary
+LIVE_COLUMNS = [
+    'event_status_id', 'event_status_name', 'event_status_state', 'event_status_completed',
+    'event_status_description', 'event_status_detail', 'event_status_short_detail',
+    'home_team_score', 'home_linescores', 'home_team_winner',
+    'away_team_score', 'away_linescores', 'away_team_winner'
+]
+STATE_INDEX = LIVE_COLUMNS.index('event_status_state')
+
+# Fields pushed to the API's live subscribers (GameSummary names)
+PUSH_COLUMNS = [
+    'date', 'event_status_name', 'event_status_state', 'event_status_completed',
+    'event_status_detail', 'event_status_short_detail',
+    'home_team_score', 'home_team_winner', 'away_team_score', 'away_team_winner'
+]
+
+# Identity columns for games the database doesn't have yet
+TEAM_COLUMNS = [
+    'team_id', 'team_location', 'team_name', 'team_abbreviation', 'team_displayName',
+    'team_color', 'team_alternate_color', 'team_logo', 'team_logos', 'team_conference_id'
+]
+INSERT_COLUMNS = (
+    ['id', 'uid', 'season_year', 'season_type', 'date', 'is_neutral_site', 'is_conference_competition']
+    + [f'{side}_{column}' for side in ('home', 'away') for column in TEAM_COLUMNS]
+    + LIVE_COLUMNS
+)
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+async def fetch_scoreboard(day):
+    """Scoreboard events for a date (YYYYMMDD), all of Division I"""
+    params = {
+        'dates': day,
+        'groups': '50',
+        'limit': 500
+    }
+    response = await espn.get(SCOREBOARD_URL, params=params)
+    response.raise_for_status()
+    return response.json().get('events', [])
+
+
+def parse_event(event):
+    """Flatten a scoreboard event into games columns plus clock and period"""
+    competition = event.get('competitions', [{}])[0]
+    status = competition.get('status', event.get('status', {}))
+    status_type = status.get('type', {})
+
+    game = {
+        'id': event.get('id'),
+        'uid': event.get('uid'),
+        'season_year': event.get('season', {}).get('year'),
+        'season_type': event.get('season', {}).get('type'),
+        'date': competition.get('date', event.get('date')),
+        'is_neutral_site': competition.get('neutralSite'),
+        'is_conference_competition': competition.get('conferenceCompetition'),
+        'event_status_id': status_type.get('id'),
+        'event_status_name': status_type.get('name'),
+        'event_status_state': status_type.get('state'),
+        'event_status_completed': status_type.get('completed'),
+        'event_status_description': status_type.get('description'),
+        'event_status_detail': status_type.get('detail'),
+        'event_status_short_detail': status_type.get('shortDetail'),
+        'period': status.get('period') or 0,
+        'clock': status.get('clock') or 0
+    }
+
+    for competitor in competition.get('competitors', []):
+        home_away = competitor.get('homeAway')
+        team = competitor.get('team', {})
+        game.update({
+            f'{home_away}_team_id': competitor.get('id'),
+            f'{home_away}_team_score': competitor.get('score'),
+            f'{home_away}_linescores': competitor.get('linescores', []),
+            f'{home_away}_team_winner': competitor.get('winner'),
+            f'{home_away}_team_location': team.get('location'),
+            f'{home_away}_team_name': team.get('name'),
+            f'{home_away}_team_abbreviation': team.get('abbreviation'),
+            f'{home_away}_team_displayName': team.get('displayName'),
+            f'{home_away}_team_color': team.get('color'),
+            f'{home_away}_team_alternate_color': team.get('alternateColor'),
+            f'{home_away}_team_logo': team.get('logo') or next(iter(team.get('logos', [])), {}).get('href'),
+            f'{home_away}_team_logos': team.get('logos') or ([{'href': team['logo']}] if team.get('logo') else []),
+            f'{home_away}_team_conference_id': team.get('conferenceId') or team.get('groups', {}).get('id')
+        })
+    return game
+
+
+def column_value(game, column):
+    """A game value as it is stored in sqlite"""
+    value = game.get(column)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, bool):
+        return int(value)
+    if column.endswith('_score') and value not in (None, ''):
+        return int(value)
+    return value
+
+
+def live_state(game):
+    """The LIVE_COLUMNS values of a parsed game, as stored"""
+    return tuple(column_value(game, column) for column in LIVE_COLUMNS)
+
+
+def is_close(game):
+    """Last minutes of regulation or any overtime"""
+    return game['period'] > 2 or (game['period'] == 2 and game['clock'] <= CLOSE_GAME_SECONDS)
+
+
+def tipoff(game):
+    try:
+        return datetime.fromisoformat(game['date'].replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def scoreboard_day(moment):
+    """The scoreboard day (YYYYMMDD) a UTC moment falls on"""
+    return moment.astimezone(SCOREBOARD_TIMEZONE).strftime('%Y%m%d')
+
+
+def poll_interval(games, now=None):
+    """Seconds until the next poll, from the games just seen"""
+    live = [game for game in games if game['event_status_state'] == 'in']
+    if any(is_close(game) for game in live):
+        return FAST_INTERVAL
+    if live:
+        return LIVE_INTERVAL
+
+    # Idle: sleep until the next tip-off, but no longer than the idle interval
+    now = now or datetime.now(timezone.utc)
+    upcoming = [
+        start for start in (tipoff(game) for game in games if game['event_status_state'] == 'pre')
+        if start is not None and start > now
+    ]
+    if upcoming:
+        return max(LIVE_INTERVAL, min(IDLE_INTERVAL, (min(upcoming) - now).total_seconds()))
+    return IDLE_INTERVAL
+
+
+class LiveTracker:
+    def __init__(self, db_path=None, verbose=True):
+        self.db_path = db_path or get_db_path()
+        self.verbose = verbose
+        # event_id -> live_state() last written (or read back from the database)
+        self.seen = {}
+        # Days with games still in progress, besides today
+        self.days = set()
+        self.polls = 0
+        self.rows_written = 0
+        # Pushes changes to the API straight away when Redis is enabled
+        self.redis = get_redis_client()
+
+        conn = connect(self.db_path)
+        apply_migrations(conn.cursor())
+        conn.commit()
+        conn.close()
+
+    def scoreboard_days(self, now):
+        """Today plus any earlier day that still had games in progress (late tip-offs)"""
+        return sorted(self.days | {scoreboard_day(now)})
+
+    def load_seen(self, cursor, event_ids):
+        """Seed self.seen from the database for games polled for the first time"""
+        new_ids = [event_id for event_id in event_ids if event_id not in self.seen]
+        if not new_ids:
+            return
+        placeholders = ','.join('?' * len(new_ids))
+        cursor.execute(
+            f"SELECT id, {', '.join(LIVE_COLUMNS)} FROM games WHERE id IN ({placeholders})", new_ids
+        )
+        for row in cursor.fetchall():
+            self.seen[row[0]] = tuple(row[1:])
+
+    def write_changes(self, cursor, games):
+        """
+        Write the live columns of games whose state changed.
+
+        Returns:
+            The games written
+        """
+        self.load_seen(cursor, [game['id'] for game in games])
+        changed = [game for game in games if self.seen.get(game['id']) != live_state(game)]
+        if not changed:
+            return []
+
+        # Games first seen live get their identity columns; the summary fills in the rest at the final
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO games ({', '.join(INSERT_COLUMNS)}) VALUES ({', '.join('?' * len(INSERT_COLUMNS))})",
+            [tuple(column_value(game, column) for column in INSERT_COLUMNS) for game in changed]
+        )
+        cursor.executemany(
+            f"UPDATE games SET {', '.join(f'{column} = ?' for column in LIVE_COLUMNS)} WHERE id = ?",
+            [live_state(game) + (game['id'],) for game in changed]
+        )
+        # Until their final summary is ingested (see pending_finals)
+        seed_events(cursor, [game['id'] for game in changed])
+        for game in changed:
+            self.seen[game['id']] = live_state(game)
+        return changed
+
+    def pending_finals(self, cursor):
+        """
+        Games stored as final whose summary hasn't been ingested yet, minus
+        those that failed too often (see ingest_state.events_to_fetch)
+        """
+        cursor.execute('''
+            SELECT games.id FROM games
+            JOIN ingest_state ON ingest_state.event_id = games.id
+            WHERE games.event_status_state = 'post' AND ingest_state.status != ?
+            ORDER BY games.id
+        ''', (DONE,))
+        return events_to_fetch(cursor, [row[0] for row in cursor.fetchall()])
+
+    def push(self, games):
+        """Publish changed games to the API's live score subscribers"""
+        if self.redis is None:
+            return
+        rows = [{'id': game['id'], **{column: column_value(game, column) for column in PUSH_COLUMNS}}
+                for game in games]
+        try:
+            self.redis.publish(LIVE_SCORES_CHANNEL, json.dumps(rows))
+        except Exception as e:
+            print(f"  Live score publish failed: {e}")
+
+    def poll(self, now=None):
+        """
+        Fetch the scoreboard once and write what changed.
+
+        Returns:
+            (games written, seconds until the next poll)
+        """
+        now = now or datetime.now(timezone.utc)
+        days = self.scoreboard_days(now)
+        games = [
+            parse_event(event)
+            for events in espn.run(espn.gather(fetch_scoreboard, days))
+            for event in events
+        ]
+        self.polls += 1
+
+        self.days = {scoreboard_day(start) for start in
+                     (tipoff(game) for game in games if game['event_status_state'] == 'in')
+                     if start is not None}
+
+        conn = connect(self.db_path)
+        cursor = conn.cursor()
+
+        # In-progress games, plus games stored as unfinished that are now final
+        self.load_seen(cursor, [game['id'] for game in games if game['event_status_state'] in ('in', 'post')])
+        tracked = [
+            game for game in games
+            if game['event_status_state'] == 'in'
+            or (game['event_status_state'] == 'post' and game['id'] in self.seen
+                and self.seen[game['id']][STATE_INDEX] != 'post')
+        ]
+        changed = self.write_changes(cursor, tracked)
+        conn.commit()
+        finishing = self.pending_finals(cursor)
+        conn.close()
+        self.rows_written += len(changed)
+
+        if changed:
+            self.push(changed)
+            invalidate_patterns(
+                game_patterns(dates={game['date'][:10] for game in changed if game.get('date')},
+                              event_ids={game['id'] for game in changed}),
+                verbose=False
+            )
+
+        # Full summaries for finished games (retried until ESPN reports them complete)
+        awaiting = len(finishing)
+        if finishing:
+            written = fetch_and_write_games(finishing, verbose=False)
+            awaiting -= len(written['event_ids'])
+            if written['event_ids']:
+                invalidate_patterns(
+                    game_patterns(written['season_teams'], written['dates'], written['event_ids']),
+                    verbose=False
+                )
+
+        interval = poll_interval(games, now)
+        if self.verbose:
+            live = sum(1 for game in games if game['event_status_state'] == 'in')
+            close = sum(1 for game in games if game['event_status_state'] == 'in' and is_close(game))
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] {live} live ({close} close), "
+                  f"{len(changed)} updated, {awaiting} awaiting final summary; "
+                  f"next poll in {interval:.0f}s")
+        return changed, interval
+
+    def run(self, max_polls=None):
+        """Poll until interrupted (or max_polls), sleeping the adaptive interval"""
+        while max_polls is None or self.polls < max_polls:
+            try:
+                _, interval = self.poll()
+            except Exception as e:
+                # A failed poll (ESPN down, locked database) shouldn't stop tracking
+                print(f"  Poll failed: {type(e).__name__}: {e}")
+                interval = LIVE_INTERVAL
+            if max_polls is not None and self.polls >= max_polls:
+                break
+            time.sleep(interval)
+
+
+def main():
+    verbose = '--quiet' not in sys.argv
+    tracker = LiveTracker(verbose=verbose)
+
+    if verbose:
+        print("=" * 60)
+        print("NCAA Basketball Database - Live Tracking")
+        print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("=" * 60)
+
+    try:
+        tracker.run(max_polls=1 if '--once' in sys.argv else None)
+    except KeyboardInterrupt:
+        print("\n\nLive tracking stopped")
+    if verbose:
+        print(f"\n{tracker.polls} polls, {tracker.rows_written} game updates written")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Schema migrations for the NCAA Basketball database.
+
+Each migration runs once, in order, and is recorded in schema_migrations.
+Migrations are written to be safe on databases created by an up-to-date
+create_db.py too (columns and tables are only added if missing).
+
+The ingest scripts apply pending migrations before writing, so running this
+by hand is only needed to upgrade a database ahead of time.
+
+Usage:
+    python3 data/migrate.py [--status]
+"""
+
+import sys
+import os
+
+from db import connect
+from boxscore_stats import PLAYER_INT_STATS, PLAYER_SPLIT_STATS, TEAM_INT_STATS, TEAM_SPLIT_STATS
+from ingest_state import create_ingest_state_table
+from odds_history import create_odds_snapshots_table, seed_from_odds
+from search_index import create_search_tables, rebuild_search_index
+from indexes import create_route_indexes, refresh_statistics
+from ranking_state import create_ranking_weeks_table
+from team_records import rebuild_records
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def table_columns(cursor, table):
+    """Column names of a table (empty if the table doesn't exist)"""
+    return {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+
+
+def add_column(cursor, table, column, column_type):
+    """ALTER TABLE ... ADD COLUMN unless the column already exists"""
+    if column not in table_columns(cursor, table):
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+def add_game_logo_columns(cursor):
+    """Primary logo URL per side, decoded once instead of on every /games request"""
+    for side in ('home', 'away'):
+        add_column(cursor, 'games', f'{side}_team_logo', 'TEXT')
+        cursor.execute(f'''
+            UPDATE games
+            SET {side}_team_logo = json_extract({side}_team_logos, '$[0].href')
+            WHERE {side}_team_logo IS NULL AND json_valid({side}_team_logos)
+        ''')
+
+
+def int_sql(column):
+    """SQL casting a text stat to INTEGER; NULL for '--', '' or made-attempted"""
+    return f'''CASE WHEN "{column}" GLOB '[0-9]*' AND "{column}" NOT GLOB '*[^0-9]*'
+        THEN CAST("{column}" AS INTEGER) END'''
+
+
+def made_sql(column):
+    """Made half of a '5-12' stat"""
+    return f'''CASE WHEN "{column}" GLOB '[0-9]*-[0-9]*'
+        THEN CAST(substr("{column}", 1, instr("{column}", '-') - 1) AS INTEGER) END'''
+
+
+def attempted_sql(column):
+    """Attempted half of a '5-12' stat"""
+    return f'''CASE WHEN "{column}" GLOB '[0-9]*-[0-9]*'
+        THEN CAST(substr("{column}", instr("{column}", '-') + 1) AS INTEGER) END'''
+
+
+def add_boxscore_numeric_columns(cursor):
+    """Integer copies of the text boxscore stats, with made-attempted split"""
+    assignments = []
+    for label, column in PLAYER_INT_STATS.items():
+        add_column(cursor, 'player_boxscores', column, 'INTEGER')
+        assignments.append(f'{column} = {int_sql(label)}')
+    for label, (made, attempted) in PLAYER_SPLIT_STATS.items():
+        add_column(cursor, 'player_boxscores', made, 'INTEGER')
+        add_column(cursor, 'player_boxscores', attempted, 'INTEGER')
+        assignments.append(f'{made} = {made_sql(label)}')
+        assignments.append(f'{attempted} = {attempted_sql(label)}')
+    cursor.execute(f"UPDATE player_boxscores SET {', '.join(assignments)}")
+
+    assignments = []
+    for name, column in TEAM_INT_STATS.items():
+        add_column(cursor, 'team_boxscores', column, 'INTEGER')
+        assignments.append(f'{column} = {int_sql(name)}')
+    cursor.execute(f"UPDATE team_boxscores SET {', '.join(assignments)}")
+
+    # Covering index for per-player season aggregates
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_player_boxscores_athlete_stats
+        ON player_boxscores(athlete_id, event_id, points, rebounds, assists, steals, blocks, turnovers)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_player_boxscores_team_event
+        ON player_boxscores(team_id, event_id)
+    ''')
+
+
+def add_ingest_state(cursor):
+    """Per-event ingest checkpoints; games already stored count as done"""
+    create_ingest_state_table(cursor)
+    cursor.execute('''
+        INSERT OR IGNORE INTO ingest_state (event_id, status, attempts)
+        SELECT id, 'done', 1 FROM games
+    ''')
+
+
+def add_odds_snapshots(cursor):
+    """Line history table; current odds become each line's first snapshot"""
+    create_odds_snapshots_table(cursor)
+    seed_from_odds(cursor)
+
+
+def add_keyset_indexes(cursor):
+    """(sort key, id) indexes the API's cursor-paginated lists walk"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_date_id ON games(date, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_teams_name_id ON teams(displayName, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_name_id ON players(displayName, id)")
+
+
+def add_search_index(cursor):
+    """FTS5 search over player and team names, built from the current rows"""
+    create_search_tables(cursor)
+    rebuild_search_index(cursor)
+
+
+def add_route_indexes(cursor):
+    """Composite and covering indexes for the API's query patterns (see indexes.py)"""
+    create_route_indexes(cursor)
+    refresh_statistics(cursor)
+
+
+def add_ranking_weeks(cursor):
+    """Poll-week checkpoints; empty, so the first rankings update refetches the current season once"""
+    create_ranking_weeks_table(cursor)
+
+
+def add_team_season_records(cursor):
+    """Materialized per-team season records (see team_records.py), built from every season's games"""
+    rebuild_records(cursor)
+
+
+def split_combined_team_stats(cursor):
+    """
+    Made and attempted team stats from the combined "5-12" columns older
+    ingests wrote (e.g. fieldGoalsMade_fieldGoalsAttempted), which left the
+    text and integer made/attempted columns NULL
+    """
+    columns = table_columns(cursor, 'team_boxscores')
+    for name, (made, attempted) in TEAM_SPLIT_STATS.items():
+        combined = name.replace('-', '_')
+        if combined not in columns:
+            continue
+        cursor.execute(f'''
+            UPDATE team_boxscores SET
+                "{made}" = CAST({made_sql(combined)} AS TEXT),
+                "{attempted}" = CAST({attempted_sql(combined)} AS TEXT)
+            WHERE "{made}" IS NULL AND "{combined}" GLOB '[0-9]*-[0-9]*'
+        ''')
+        cursor.execute(f'''
+            UPDATE team_boxscores SET
+                {TEAM_INT_STATS[made]} = {int_sql(made)},
+                {TEAM_INT_STATS[attempted]} = {int_sql(attempted)}
+            WHERE {TEAM_INT_STATS[made]} IS NULL
+        ''')
+
+
+# (version, name, function) - append only, never renumber
+MIGRATIONS = [
+    (1, 'add_game_logo_columns', add_game_logo_columns),
+    (2, 'add_boxscore_numeric_columns', add_boxscore_numeric_columns),
+    (3, 'add_ingest_state', add_ingest_state),
+    (4, 'add_odds_snapshots', add_odds_snapshots),
+    (5, 'add_keyset_indexes', add_keyset_indexes),
+    (6, 'add_search_index', add_search_index),
+    (7, 'add_route_indexes', add_route_indexes),
+    (8, 'add_ranking_weeks', add_ranking_weeks),
+    (9, 'add_team_season_records', add_team_season_records),
+    (10, 'split_combined_team_stats', split_combined_team_stats),
+]
+
+
+def applied_versions(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT,
+            applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    return {row[0] for row in cursor.execute("SELECT version FROM schema_migrations")}
+
+
+def apply_migrations(cursor, verbose=False):
+    """
+    Apply pending migrations on an open cursor (the caller commits).
+
+    The write lock is taken before schema_migrations is read, so a second
+    process migrating the same file waits and then finds nothing pending.
+
+    Returns:
+        List of migration names applied
+    """
+    if not cursor.connection.in_transaction:
+        cursor.execute("BEGIN IMMEDIATE")
+    done = applied_versions(cursor)
+    applied = []
+    for version, name, migration in MIGRATIONS:
+        if version in done:
+            continue
+        if verbose:
+            print(f"  Applying {version:03d} {name}...")
+        migration(cursor)
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (?, ?)", (version, name)
+        )
+        applied.append(name)
+    return applied
+
+
+def migrate(verbose=True):
+    """Apply pending migrations to the database in one transaction"""
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    try:
+        applied = apply_migrations(cursor, verbose=verbose)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    if verbose:
+        if applied:
+            print(f"✓ Applied {len(applied)} migration(s)")
+        else:
+            print("✓ Database is up to date")
+    return applied
+
+
+def print_status():
+    conn = connect(get_db_path())
+    done = applied_versions(conn.cursor())
+    conn.close()
+    for version, name, _ in MIGRATIONS:
+        print(f"  {'✓' if version in done else ' '} {version:03d} {name}")
+
+
+if __name__ == "__main__":
+    if '--status' in sys.argv:
+        print_status()
+    else:
+        migrate()
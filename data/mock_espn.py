@@ -0,0 +1,710 @@
+#!/usr/bin/env python3
+"""
+Local mock of the ESPN endpoints the ingest scripts call.
+
+Serves deterministic synthetic data (the same event ID always returns the
+same game) with configurable latency and injected 429/503 errors, so the
+fetch engine can be exercised and benchmarked without touching ESPN.
+
+Point the scripts at it with ESPN_BASE_URL:
+
+    python3 data/mock_espn.py --port 8765 --latency 0.05 --error-rate 0.02
+    ESPN_BASE_URL=http://127.0.0.1:8765 python3 data/update_daily.py
+
+Endpoints (paths as on ESPN; the host is ignored):
+    /apis/site/v2/.../summary?event=ID                    game summary + boxscore
+    /apis/site/v2/.../scoreboard?dates=YYYYMMDD            live status and scores
+    /v2/.../events?dates=YYYYMM[DD]&page=N&limit=N         event $refs
+    /v2/.../events/ID/competitions/ID/predictor            matchup predictor
+    /v2/.../events/ID/competitions/ID/odds                 odds providers
+    /v2/.../seasons/YEAR/rankings                          poll $refs
+    /v2/.../seasons/YEAR/rankings/POLL                     a poll's weekly $refs
+    /v2/.../seasons/YEAR/types/2/weeks/N/rankings/POLL     one poll week
+    /v2/.../seasons/YEAR/teams/ID/athletes                 a team's roster $refs
+    /v2/.../seasons/YEAR/athletes/ID                       one athlete's season details
+    /v3/.../athletes?limit=N&page=N                        every active athlete, paged
+
+Event IDs are YYYYMMDD followed by a 3-digit game number, so discovery and
+summaries agree on dates. Games tip off around the clock (UTC) on their
+day and play out over two wall-clock hours, so at any time of day the
+summary and scoreboard endpoints show games in progress with moving scores
+and clocks.
+A season's polls publish a new week every Monday from late October (or
+--poll-weeks per poll). Every team carries ROSTER_SIZE athletes; with
+--roster-changes N the first N teams have each signed one more and changed
+their first athlete's jersey.
+Responses carry an ETag and Last-Modified and conditional requests are
+answered 304, like ESPN's CDN.
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import calendar
+import threading
+from datetime import date, datetime, timedelta, timezone
+from email.utils import formatdate
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SPORT_PATH = "/sports/basketball"
+TEAM_COUNT = 64
+CONFERENCES = ['acc', 'big-12', 'big-east', 'big-ten', 'sec', 'pac-12', 'wcc', 'mountain-west']
+PLAYER_LABELS = ['MIN', 'FG', '3PT', 'FT', 'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TO', 'PF', 'PTS']
+LIVE_MINUTES = 120  # wall-clock length of a mock game
+HALF_SECONDS = 20 * 60
+LINE_MOVE_SECONDS = 600  # betting lines move off the opener every ten minutes
+PROVIDERS = [(38, 'Caesars Sportsbook'), (58, 'ESPN BET'), (45, 'William Hill')]
+POLLS = [(1, 'AP Top 25', 'ap'), (2, 'Coaches Poll', 'usa')]
+POLL_WEEKS = 20  # preseason through final poll
+ROSTER_SIZE = 13
+CORE_BASE = "http://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball"
+
+SUMMARY_RE = re.compile(r'/summary$')
+SCOREBOARD_RE = re.compile(r'/scoreboard$')
+EVENTS_RE = re.compile(r'/events$')
+PREDICTOR_RE = re.compile(r'/events/(\d+)/competitions/\d+/predictor/?$')
+ODDS_RE = re.compile(r'/events/(\d+)/competitions/\d+/odds/?$')
+POLLS_RE = re.compile(r'/seasons/(\d+)/rankings$')
+POLL_RE = re.compile(r'/seasons/(\d+)/rankings/(\d+)$')
+POLL_WEEK_RE = re.compile(r'/seasons/(\d+)/types/\d+/weeks/(\d+)/rankings/(\d+)$')
+ROSTER_RE = re.compile(r'/seasons/(\d+)/teams/(\d+)/athletes$')
+ATHLETE_RE = re.compile(r'/seasons/(\d+)/athletes/(\d+)$')
+ATHLETES_RE = re.compile(r'^/v3/.*/athletes$')
+
+
+def event_date(event_id):
+    """Date encoded in a mock event ID, or None for IDs from elsewhere"""
+    try:
+        return datetime.strptime(str(event_id)[:8], '%Y%m%d').date()
+    except ValueError:
+        return None
+
+
+def matchup(event_id):
+    """(rng, home_team_id, away_team_id) for an event, stable across requests"""
+    rng = random.Random(int(event_id))
+    home, away = rng.sample(range(1, TEAM_COUNT + 1), 2)
+    return rng, home, away
+
+
+def team_json(team_id):
+    conference = CONFERENCES[team_id % len(CONFERENCES)]
+    return {
+        'id': str(team_id),
+        'uid': f"s:40~l:41~t:{team_id}",
+        'guid': f"mock-team-{team_id}",
+        'location': f"Mock {team_id}",
+        'name': f"Team {team_id}",
+        'abbreviation': f"M{team_id}",
+        'nickname': f"Mock {team_id}",
+        'displayName': f"Mock {team_id} Team {team_id}",
+        'color': f"{team_id * 3 % 256:02x}3366",
+        'alternateColor': 'ffffff',
+        'logos': [{'href': f"https://a.espncdn.com/i/teamlogos/ncaa/500/{team_id}.png"}],
+        'groups': {'id': str(CONFERENCES.index(conference) + 1), 'slug': conference}
+    }
+
+
+def player_lines(rng, team_id):
+    """Stats for ten players plus the team totals they add up to"""
+    athletes = []
+    totals = dict.fromkeys(['fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta', 'oreb', 'dreb',
+                            'ast', 'stl', 'blk', 'to', 'pf', 'pts'], 0)
+    for slot in range(10):
+        line = {
+            'min': rng.randint(5, 38),
+            'fg3a': rng.randint(0, 6), 'fga': rng.randint(2, 14), 'fta': rng.randint(0, 6),
+            'oreb': rng.randint(0, 3), 'dreb': rng.randint(0, 7), 'ast': rng.randint(0, 6),
+            'stl': rng.randint(0, 3), 'blk': rng.randint(0, 2), 'to': rng.randint(0, 4),
+            'pf': rng.randint(0, 4)
+        }
+        line['fg3a'] = min(line['fg3a'], line['fga'])
+        line['fgm'] = rng.randint(0, line['fga'])
+        line['fg3m'] = rng.randint(0, min(line['fg3a'], line['fgm']))
+        line['ftm'] = rng.randint(0, line['fta'])
+        line['pts'] = 2 * line['fgm'] + line['fg3m'] + line['ftm']
+        for key in totals:
+            totals[key] += line[key]
+
+        athlete_id = team_id * 100 + slot
+        athletes.append({
+            'athlete': {
+                'id': str(athlete_id),
+                'displayName': f"Player {athlete_id}",
+                'jersey': str(slot + 1),
+                'headshot': {'href': f"https://a.espncdn.com/i/headshots/mens-college-basketball/players/full/{athlete_id}.png"},
+                'position': {'name': 'Guard', 'abbreviation': 'G', 'displayName': 'Guard'}
+            },
+            'starter': slot < 5,
+            'didNotPlay': False,
+            'ejected': False,
+            'stats': [
+                str(line['min']), f"{line['fgm']}-{line['fga']}", f"{line['fg3m']}-{line['fg3a']}",
+                f"{line['ftm']}-{line['fta']}", str(line['oreb']), str(line['dreb']),
+                str(line['oreb'] + line['dreb']), str(line['ast']), str(line['stl']),
+                str(line['blk']), str(line['to']), str(line['pf']), str(line['pts'])
+            ]
+        })
+    return athletes, totals
+
+
+def team_statistics(totals):
+    def pct(made, attempted):
+        return f"{100 * made / attempted:.1f}" if attempted else "0.0"
+
+    stats = {
+        'fieldGoalsMade-fieldGoalsAttempted': f"{totals['fgm']}-{totals['fga']}",
+        'fieldGoalPct': pct(totals['fgm'], totals['fga']),
+        'threePointFieldGoalsMade-threePointFieldGoalsAttempted': f"{totals['fg3m']}-{totals['fg3a']}",
+        'threePointFieldGoalPct': pct(totals['fg3m'], totals['fg3a']),
+        'freeThrowsMade-freeThrowsAttempted': f"{totals['ftm']}-{totals['fta']}",
+        'freeThrowPct': pct(totals['ftm'], totals['fta']),
+        'totalRebounds': str(totals['oreb'] + totals['dreb']),
+        'offensiveRebounds': str(totals['oreb']),
+        'defensiveRebounds': str(totals['dreb']),
+        'assists': str(totals['ast']),
+        'steals': str(totals['stl']),
+        'blocks': str(totals['blk']),
+        'turnovers': str(totals['to']),
+        'teamTurnovers': '0',
+        'totalTurnovers': str(totals['to']),
+        'technicalFouls': '0',
+        'totalTechnicalFouls': '0',
+        'flagrantFouls': '0',
+        'fouls': str(totals['pf']),
+        'largestLead': '10'
+    }
+    return [{'name': name, 'displayValue': value} for name, value in stats.items()]
+
+
+def tipoff(event_id):
+    """Tip-off of a mock event (UTC): games are spread around the clock"""
+    game_date = event_date(event_id) or date(2025, 1, 15)
+    game = int(str(event_id)[8:] or 0) if event_date(event_id) else 0
+    start = datetime(game_date.year, game_date.month, game_date.day, tzinfo=timezone.utc)
+    return start + timedelta(minutes=(game * 37) % (24 * 60))
+
+
+def game_progress(event_id, now=None):
+    """Fraction of the game played: 0 before tip-off, 1 once it is final"""
+    elapsed = ((now or datetime.now(timezone.utc)) - tipoff(event_id)).total_seconds()
+    return min(1.0, max(0.0, elapsed / (LIVE_MINUTES * 60)))
+
+
+def status_json(progress):
+    """ESPN competition status for a game `progress` of the way through"""
+    if progress <= 0:
+        return {'clock': 0.0, 'displayClock': '0:00', 'period': 0, 'type': {
+            'id': '1', 'name': 'STATUS_SCHEDULED', 'state': 'pre', 'completed': False,
+            'description': 'Scheduled', 'detail': 'Scheduled', 'shortDetail': 'Scheduled'
+        }}
+    if progress >= 1:
+        return {'clock': 0.0, 'displayClock': '0:00', 'period': 2, 'type': {
+            'id': '3', 'name': 'STATUS_FINAL', 'state': 'post', 'completed': True,
+            'description': 'Final', 'detail': 'Final', 'shortDetail': 'Final'
+        }}
+    played = progress * 2 * HALF_SECONDS
+    period = 1 if played < HALF_SECONDS else 2
+    clock = int(period * HALF_SECONDS - played)
+    display = f"{clock // 60}:{clock % 60:02d}"
+    half = '1st Half' if period == 1 else '2nd Half'
+    return {'clock': float(clock), 'displayClock': display, 'period': period, 'type': {
+        'id': '2', 'name': 'STATUS_IN_PROGRESS', 'state': 'in', 'completed': False,
+        'description': 'In Progress', 'detail': f"{display} - {half}",
+        'shortDetail': f"{display} - {half[:3]}"
+    }}
+
+
+def final_scores(event_id):
+    """Final score per side plus each side's player lines and totals"""
+    rng, home, away = matchup(event_id)
+    lines, scores = {}, {}
+    for team_id, side in ((home, 'home'), (away, 'away')):
+        lines[side] = player_lines(rng, team_id)
+        scores[side] = lines[side][1]['pts']
+    if scores['home'] == scores['away']:
+        scores['home'] += 1
+    return scores, lines
+
+
+def linescores_at(final, progress):
+    """Per-half points scored so far by a side that finishes with `final`"""
+    first_half = final // 2
+    if progress <= 0:
+        return []
+    if progress < 0.5:
+        return [round(first_half * progress / 0.5)]
+    return [first_half, round((final - first_half) * min(1.0, (progress - 0.5) / 0.5))]
+
+
+def competition_json(event_id, progress, score_key='displayValue'):
+    """Competition header shared by the summary and scoreboard endpoints"""
+    _, home, away = matchup(event_id)
+    scores, _ = final_scores(event_id)
+    completed = progress >= 1
+    competitors = []
+    for team_id, side in ((home, 'home'), (away, 'away')):
+        other = 'away' if side == 'home' else 'home'
+        halves = linescores_at(scores[side], progress)
+        competitors.append({
+            'id': str(team_id),
+            'homeAway': side,
+            'winner': completed and scores[side] > scores[other],
+            'score': str(sum(halves)),
+            'linescores': [{score_key: str(points) if score_key == 'displayValue' else float(points)}
+                           for points in halves],
+            'record': [{'type': 'total', 'summary': '10-5'}],
+            'team': team_json(team_id)
+        })
+    return {
+        'id': str(event_id),
+        'date': tipoff(event_id).strftime('%Y-%m-%dT%H:%MZ'),
+        'neutralSite': False,
+        'conferenceCompetition': home % len(CONFERENCES) == away % len(CONFERENCES),
+        'status': status_json(progress),
+        'competitors': competitors
+    }
+
+
+def summary(event_id):
+    _, home, away = matchup(event_id)
+    rng = random.Random(int(event_id) + 1)
+    game_date = event_date(event_id) or date(2025, 1, 15)
+    progress = game_progress(event_id)
+    completed = progress >= 1
+    season = game_date.year + 1 if game_date.month >= 7 else game_date.year
+
+    _, lines = final_scores(event_id)
+    boxscore_teams, boxscore_players = [], []
+    for team_id, side in ((home, 'home'), (away, 'away')):
+        athletes, totals = lines[side]
+        boxscore_teams.append({
+            'team': {'id': str(team_id)}, 'homeAway': side, 'statistics': team_statistics(totals)
+        })
+        boxscore_players.append({
+            'team': {'id': str(team_id)},
+            'statistics': [{'labels': PLAYER_LABELS, 'athletes': athletes}]
+        })
+
+    competition = competition_json(event_id, progress)
+    del competition['id']
+    return {
+        'header': {
+            'id': str(event_id),
+            'uid': f"s:40~l:41~e:{event_id}",
+            'season': {'year': season, 'type': 2},
+            'week': None,
+            'competitions': [competition]
+        },
+        'gameInfo': {
+            'venue': {'id': str(1000 + home)},
+            'attendance': rng.randint(2000, 20000),
+            'officials': [{'displayName': 'Mock Official'}]
+        },
+        'boxscore': {
+            'teams': boxscore_teams if completed else [],
+            'players': boxscore_players if completed else []
+        }
+    }
+
+
+def scoreboard(query, games_per_day):
+    """Every event on a day with its live status, scores and line scores"""
+    day = query.get('dates', [datetime.now(timezone.utc).strftime('%Y%m%d')])[0]
+    now = datetime.now(timezone.utc)
+    events = []
+    for event_id in event_ids_for(day, games_per_day):
+        game_date = event_date(event_id)
+        competition = competition_json(event_id, game_progress(event_id, now), score_key='value')
+        events.append({
+            'id': event_id,
+            'uid': f"s:40~l:41~e:{event_id}",
+            'date': competition['date'],
+            'season': {'year': game_date.year + 1 if game_date.month >= 7 else game_date.year, 'type': 2},
+            'competitions': [competition],
+            'status': competition['status']
+        })
+    return {'events': events}
+
+
+def event_ids_for(dates, games_per_day):
+    """Mock event IDs for a YYYYMM or YYYYMMDD dates parameter"""
+    if len(dates) == 8:
+        days = [dates]
+    else:
+        year, month = int(dates[:4]), int(dates[4:6])
+        days = [f"{dates}{day:02d}" for day in range(1, calendar.monthrange(year, month)[1] + 1)]
+    return [f"{day}{game:03d}" for day in days for game in range(games_per_day)]
+
+
+def events_page(path, query, games_per_day):
+    ids = event_ids_for(query.get('dates', [date.today().strftime('%Y%m')])[0], games_per_day)
+    limit = int(query.get('limit', [25])[0])
+    page = int(query.get('page', [1])[0])
+    page_count = max(1, -(-len(ids) // limit))
+    items = ids[(page - 1) * limit:page * limit]
+    base = f"http://sports.core.api.espn.com{path}"
+    return {
+        'count': len(ids),
+        'pageIndex': page,
+        'pageSize': limit,
+        'pageCount': page_count,
+        'items': [{'$ref': f"{base}/{event_id}?lang=en&region=us"} for event_id in items]
+    }
+
+
+def predictor(event_id):
+    rng, home, away = matchup(event_id)
+    home_chance = round(rng.uniform(5, 95), 1)
+
+    def side(team_id, chance):
+        return {
+            'team': {'id': str(team_id)},
+            'gameProjection': chance,
+            'gameProjectionDisplay': f"{chance}%",
+            'teamChanceLoss': round(100 - chance, 1),
+            'teamChanceLossDisplay': f"{round(100 - chance, 1)}%"
+        }
+
+    return {
+        'name': f"Mock {away} at Mock {home}",
+        'shortName': f"M{away} @ M{home}",
+        'homeTeam': side(home, home_chance),
+        'awayTeam': side(away, round(100 - home_chance, 1))
+    }
+
+
+def line_move(event_id, provider_id):
+    """Points the line has moved off the opener; changes every LINE_MOVE_SECONDS"""
+    bucket = int(time.time() // LINE_MOVE_SECONDS)
+    return random.Random(int(event_id) * 7919 + provider_id * 31 + bucket).choice(
+        [-2.5, -1, -0.5, 0, 0, 0, 0, 0.5, 1, 2.5]
+    )
+
+
+def odds(event_id):
+    rng, home, away = matchup(event_id)
+    opener = round(rng.uniform(-15, 15) * 2) / 2
+    total = round(rng.uniform(125, 160), 1)
+    items = []
+    for provider_id, provider_name in PROVIDERS:
+        spread = opener + line_move(event_id, provider_id)
+        home_line = -round(100 + 15 * abs(spread)) if spread < 0 else round(100 + 15 * abs(spread))
+
+        def side(team_id, favorite, line):
+            return {'items': [{
+                'favorite': favorite,
+                'underdog': not favorite,
+                'moneyLine': line,
+                'spreadOdds': -110.0,
+                'spread': {'displayValue': f"{spread if team_id == home else -spread:+g}"},
+                'team': {'id': str(team_id)}
+            }]}
+
+        items.append({
+            'provider': {'id': str(provider_id), 'name': provider_name},
+            'details': f"M{home} {spread:+g}",
+            'overUnder': round(total + 2 * line_move(event_id, provider_id + 1), 1),
+            'spread': spread,
+            'overOdds': -110.0,
+            'underOdds': -110.0,
+            'homeTeamOdds': side(home, spread < 0, home_line),
+            'awayTeamOdds': side(away, spread >= 0, -home_line)
+        })
+    return {'count': len(items), 'items': items}
+
+
+def poll_weeks_published(season, override=None, today=None):
+    """Weeks of a season's polls out so far: weekly from the preseason poll in late October"""
+    if override is not None:
+        return min(override, POLL_WEEKS)
+    days = ((today or date.today()) - date(season - 1, 10, 21)).days
+    return max(0, min(days // 7 + 1, POLL_WEEKS))
+
+
+def polls_index(season):
+    return {
+        'count': len(POLLS),
+        'items': [{'$ref': f"{CORE_BASE}/seasons/{season}/rankings/{poll_id}?lang=en&region=us"}
+                  for poll_id, _, _ in POLLS]
+    }
+
+
+def poll_json(season, poll_id, weeks):
+    _, name, poll_type = next(poll for poll in POLLS if poll[0] == poll_id)
+    return {
+        'id': str(poll_id),
+        'name': name,
+        'type': poll_type,
+        'rankings': [
+            {'$ref': f"{CORE_BASE}/seasons/{season}/types/2/weeks/{week}/rankings/{poll_id}?lang=en&region=us"}
+            for week in range(1, weeks + 1)
+        ]
+    }
+
+
+def poll_week(season, week, poll_id):
+    """25 ranked teams, 5 others receiving votes and 2 that dropped out"""
+    _, name, poll_type = next(poll for poll in POLLS if poll[0] == poll_id)
+    rng = random.Random(season * 10000 + week * 10 + poll_id)
+    teams = rng.sample(range(1, TEAM_COUNT + 1), 32)
+
+    def entry(team_id, rank, points):
+        wins, losses = rng.randint(week // 2, week + 2), rng.randint(0, week // 2)
+        return {
+            'current': rank,
+            'previous': rng.randint(0, 25),
+            'points': float(points),
+            'firstPlaceVotes': rng.randint(0, 30) if rank == 1 else 0,
+            'trend': rng.choice(['-', '+1', '+3', '-2']),
+            'record': {
+                'summary': f"{wins}-{losses}",
+                'stats': [{'name': 'wins', 'value': float(wins)}, {'name': 'losses', 'value': float(losses)}]
+            },
+            'team': {'$ref': f"{CORE_BASE}/seasons/{season}/teams/{team_id}?lang=en&region=us"}
+        }
+
+    return {
+        'id': str(poll_id),
+        'name': name,
+        'shortName': name.split()[0],
+        'type': poll_type,
+        'headline': f"{season} NCAA Men's Basketball Rankings - {name} Week {week}",
+        'shortHeadline': f"{season} {name}: Week {week}",
+        'occurrence': {'number': week, 'type': 'week', 'last': week == POLL_WEEKS,
+                       'displayValue': 'Final Rankings' if week == POLL_WEEKS else f"Week {week}"},
+        'season': {'year': season, 'displayName': f"{season - 1}-{str(season)[2:]}"},
+        'ranks': [entry(team_id, rank, 1600 - rank * 60) for rank, team_id in enumerate(teams[:25], 1)],
+        'others': [entry(team_id, 0, 50 - index * 8) for index, team_id in enumerate(teams[25:30])],
+        'droppedOut': [entry(team_id, 0, 0) for team_id in teams[30:]]
+    }
+
+
+def roster_size(team_id, changes=0):
+    """Athletes on a team's roster; the first `changes` teams signed one more"""
+    return ROSTER_SIZE + (1 if team_id <= changes else 0)
+
+
+def roster_json(season, team_id, changes=0):
+    return {
+        'count': roster_size(team_id, changes),
+        'items': [{'$ref': f"{CORE_BASE}/seasons/{season}/athletes/{team_id * 100 + slot}?lang=en&region=us"}
+                  for slot in range(roster_size(team_id, changes))]
+    }
+
+
+def athlete_json(season, athlete_id, changes=0):
+    """An athlete's details, or None if no roster carries them"""
+    team_id, slot = divmod(athlete_id, 100)
+    if not 1 <= team_id <= TEAM_COUNT or slot >= roster_size(team_id, changes):
+        return None
+    # The first athlete of each changed team switched numbers
+    jersey = slot + 1 + (50 if slot == 0 and team_id <= changes else 0)
+    weight = 170 + (athlete_id * 7) % 80
+    height = 70 + (athlete_id * 3) % 16
+    years = slot % 4 + 1
+    return {
+        'id': str(athlete_id),
+        'uid': f"s:40~l:41~a:{athlete_id}",
+        'guid': f"mock-athlete-{athlete_id}",
+        'firstName': 'Player',
+        'lastName': str(athlete_id),
+        'fullName': f"Player {athlete_id}",
+        'displayName': f"Player {athlete_id}",
+        'shortName': f"P. {athlete_id}",
+        'weight': float(weight),
+        'displayWeight': f"{weight} lbs",
+        'height': float(height),
+        'displayHeight': f"{height // 12}' {height % 12}\"",
+        'birthPlace': {'city': f"Town {athlete_id % 97}", 'state': 'NC', 'country': 'USA'},
+        'slug': f"player-{athlete_id}",
+        'headshot': {'href': f"https://a.espncdn.com/i/headshots/mens-college-basketball/players/full/{athlete_id}.png"},
+        'jersey': str(jersey),
+        'hand': {'type': 'RIGHT', 'abbreviation': 'R', 'displayValue': 'Right'},
+        'position': {'id': '1', 'name': 'Guard', 'abbreviation': 'G', 'displayValue': 'Guard'},
+        'team': {'$ref': f"{CORE_BASE}/seasons/{season}/teams/{team_id}?lang=en&region=us"},
+        'experience': {'years': years, 'displayValue': ['Freshman', 'Sophomore', 'Junior', 'Senior'][years - 1],
+                       'abbreviation': ['FR', 'SO', 'JR', 'SR'][years - 1]}
+    }
+
+
+def athletes_page(query, changes=0):
+    """One page of every rostered athlete, as the v3 athletes list pages them"""
+    limit = int(query.get('limit', ['25'])[0])
+    page = int(query.get('page', ['1'])[0])
+    athlete_ids = [team_id * 100 + slot for team_id in range(1, TEAM_COUNT + 1)
+                   for slot in range(roster_size(team_id, changes))]
+    items = []
+    for athlete_id in athlete_ids[(page - 1) * limit:page * limit]:
+        athlete = athlete_json(date.today().year, athlete_id, changes)
+        del athlete['team']
+        items.append(athlete)
+    return {
+        'count': len(athlete_ids),
+        'pageIndex': page,
+        'pageSize': limit,
+        'pageCount': -(-len(athlete_ids) // limit),
+        'items': items
+    }
+
+
+class MockESPNHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; without TCP_NODELAY every
+    # keep-alive response waits on the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        if status == 200:
+            # Deterministic bodies, so a content hash is a valid ETag
+            etag = f'"{hashlib.md5(payload).hexdigest()}"'
+            headers = {'ETag': etag, 'Last-Modified': self.server.last_modified, **(headers or {})}
+            if self.not_modified(etag):
+                with self.server.lock:
+                    self.server.not_modified += 1
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def not_modified(self, etag):
+        """Conditional request whose validator still matches"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(',')]
+        return self.headers.get('If-Modified-Since') == self.server.last_modified
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        if server.latency:
+            time.sleep(random.uniform(0.5, 1.5) * server.latency)
+
+        if random.random() < server.error_rate:
+            with server.lock:
+                server.errors += 1
+            if random.random() < 0.5:
+                self.send_json(429, {'error': 'rate limited'}, {'Retry-After': '0'})
+            else:
+                self.send_json(503, {'error': 'unavailable'})
+            return
+
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/')
+        query = parse_qs(parts.query)
+
+        if SPORT_PATH not in path:
+            self.send_json(404, {'error': 'not found'})
+        elif SUMMARY_RE.search(path) and 'event' in query:
+            self.send_json(200, summary(query['event'][0]))
+        elif SCOREBOARD_RE.search(path):
+            self.send_json(200, scoreboard(query, server.games_per_day))
+        elif EVENTS_RE.search(path):
+            self.send_json(200, events_page(path, query, server.games_per_day))
+        elif match := PREDICTOR_RE.search(path):
+            self.send_json(200, predictor(match.group(1)))
+        elif match := ODDS_RE.search(path):
+            self.send_json(200, odds(match.group(1)))
+        elif match := POLLS_RE.search(path):
+            self.send_json(200, polls_index(int(match.group(1))))
+        elif match := POLL_RE.search(path):
+            season, poll_id = int(match.group(1)), int(match.group(2))
+            self.send_json(200, poll_json(season, poll_id, poll_weeks_published(season, server.poll_weeks)))
+        elif match := POLL_WEEK_RE.search(path):
+            season, week, poll_id = (int(group) for group in match.groups())
+            if week > poll_weeks_published(season, server.poll_weeks):
+                self.send_json(404, {'error': 'not found'})
+            else:
+                self.send_json(200, poll_week(season, week, poll_id))
+        elif match := ROSTER_RE.search(path):
+            self.send_json(200, roster_json(int(match.group(1)), int(match.group(2)), server.roster_changes))
+        elif match := ATHLETE_RE.search(path):
+            athlete = athlete_json(int(match.group(1)), int(match.group(2)), server.roster_changes)
+            if athlete is None:
+                self.send_json(404, {'error': 'not found'})
+            else:
+                self.send_json(200, athlete)
+        elif ATHLETES_RE.search(path):
+            self.send_json(200, athletes_page(query, server.roster_changes))
+        else:
+            self.send_json(404, {'error': 'not found'})
+
+
+class MockESPNServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, error_rate=0.0,
+                 games_per_day=20, verbose=False, poll_weeks=None, roster_changes=0):
+        super().__init__((host, port), MockESPNHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.games_per_day = games_per_day
+        # Poll weeks published per season (None: by date)
+        self.poll_weeks = poll_weeks
+        # Teams that signed an athlete and renumbered another (see roster_size)
+        self.roster_changes = roster_changes
+        self.verbose = verbose
+        self.requests = 0
+        self.errors = 0
+        self.not_modified = 0
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve from a background thread (for use inside a test or benchmark)"""
+        thread = threading.Thread(target=self.serve_forever, name='mock-espn', daemon=True)
+        thread.start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="Mean response delay in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered 429/503")
+    parser.add_argument('--games-per-day', type=int, default=20)
+    parser.add_argument('--poll-weeks', type=int, default=None, help="Poll weeks published per season (default: by date)")
+    parser.add_argument('--roster-changes', type=int, default=0, help="Teams whose roster changed (see roster_size)")
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    args = parser.parse_args()
+
+    server = MockESPNServer(args.host, args.port, args.latency, args.error_rate,
+                            args.games_per_day, args.verbose, args.poll_weeks, args.roster_changes)
+    print(f"Mock ESPN listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n{server.requests} requests ({server.errors} injected errors, "
+              f"{server.not_modified} not modified)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
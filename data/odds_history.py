@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Append-only history of betting lines: the odds_snapshots table.
+
+The odds table only holds the latest line per (event, provider); every
+odds poll also appends a snapshot keyed by (event_id, provider_id,
+captured_at) so line movement can be measured later. Snapshots are sparse:
+a row is written only when at least one tracked value changed, and it
+holds only the values that changed (the rest are NULL). The first snapshot
+of an (event, provider) pair holds every value.
+
+To read a value as of some time, take the latest non-NULL value of that
+column at or before it; the primary key makes that a short index scan.
+
+Usage:
+    python3 data/odds_history.py [EVENT_ID]   # snapshot counts, or one game's history
+"""
+
+import sys
+import os
+from datetime import datetime, timezone
+from db import connect
+from espn_mappings import ODDS
+
+# (snapshot column, odds column) pairs that are tracked for movement
+TRACKED_COLUMNS = [
+    ('spread', 'spread'),
+    ('over_under', 'over_under'),
+    ('home_moneyline', 'home_team_moneyline'),
+    ('away_moneyline', 'away_team_moneyline'),
+]
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def create_odds_snapshots_table(cursor):
+    """Create odds_snapshots and its capture-time index"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS odds_snapshots (
+            event_id TEXT NOT NULL,
+            provider_id TEXT NOT NULL,
+            captured_at TEXT NOT NULL,
+            spread REAL,
+            over_under REAL,
+            home_moneyline INTEGER,
+            away_moneyline INTEGER,
+            PRIMARY KEY (event_id, provider_id, captured_at)
+        ) WITHOUT ROWID
+    ''')
+    # Finds the pairs whose lines changed within a window
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_odds_snapshots_captured
+        ON odds_snapshots(captured_at)
+    ''')
+
+
+def capture_time():
+    """Current UTC time in SQLite's CURRENT_TIMESTAMP format"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def record_odds_snapshots(cursor, odds_data, captured_at=None):
+    """
+    Append a snapshot for every line in odds_data that changed.
+
+    Must run before the same lines are written to the odds table, which is
+    what new values are compared against (the caller commits).
+
+    Args:
+        odds_data: Odds rows (espn_mappings.ODDS) as built by update_odds.fetch_odds
+        captured_at: Snapshot time (default: now, UTC)
+
+    Returns:
+        Number of snapshots written
+    """
+    if not odds_data:
+        return 0
+    captured_at = captured_at or capture_time()
+    odds_columns = ', '.join(column for _, column in TRACKED_COLUMNS)
+
+    event_at, provider_at = ODDS.index('event_id'), ODDS.index('provider_id')
+    tracked_at = [ODDS.index(column) for _, column in TRACKED_COLUMNS]
+
+    current = {}
+    event_ids = sorted({o[event_at] for o in odds_data})
+    for start in range(0, len(event_ids), 500):
+        batch = event_ids[start:start + 500]
+        cursor.execute(f'''
+            SELECT event_id, provider_id, {odds_columns} FROM odds
+            WHERE event_id IN ({','.join('?' * len(batch))})
+        ''', batch)
+        for row in cursor.fetchall():
+            current[(row[0], str(row[1]))] = row[2:]
+
+    snapshots = []
+    for o in odds_data:
+        if o[provider_at] is None:
+            continue
+        new = tuple(o[position] for position in tracked_at)
+        old = current.get((o[event_at], str(o[provider_at])))
+        if old is None:
+            changed = new
+        else:
+            changed = tuple(value if value != before else None for value, before in zip(new, old))
+        if all(value is None for value in changed):
+            continue
+        snapshots.append((o[event_at], str(o[provider_at]), captured_at, *changed))
+
+    cursor.executemany(f'''
+        INSERT OR REPLACE INTO odds_snapshots (event_id, provider_id, captured_at,
+            {', '.join(column for column, _ in TRACKED_COLUMNS)})
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', snapshots)
+    return len(snapshots)
+
+
+def seed_from_odds(cursor):
+    """Give every line already in the odds table its first snapshot"""
+    cursor.execute(f'''
+        INSERT OR IGNORE INTO odds_snapshots (event_id, provider_id, captured_at,
+            {', '.join(column for column, _ in TRACKED_COLUMNS)})
+        SELECT event_id, CAST(provider_id AS TEXT), CURRENT_TIMESTAMP,
+            {', '.join(column for _, column in TRACKED_COLUMNS)}
+        FROM odds
+        WHERE event_id IS NOT NULL AND provider_id IS NOT NULL
+    ''')
+
+
+def print_history(event_id):
+    conn = connect(get_db_path())
+    rows = conn.execute('''
+        SELECT provider_id, captured_at, spread, over_under, home_moneyline, away_moneyline
+        FROM odds_snapshots WHERE event_id = ?
+        ORDER BY provider_id, captured_at
+    ''', (event_id,)).fetchall()
+    conn.close()
+
+    if not rows:
+        print(f"No snapshots for event {event_id}")
+        return
+    print(f"{'Provider':<10} {'Captured (UTC)':<20} {'Spread':>7} {'Total':>7} {'Home ML':>8} {'Away ML':>8}")
+    for provider_id, captured_at, *values in rows:
+        cells = ['' if value is None else value for value in values]
+        print(f"{provider_id:<10} {captured_at:<20} {cells[0]:>7} {cells[1]:>7} {cells[2]:>8} {cells[3]:>8}")
+
+
+def print_counts():
+    conn = connect(get_db_path())
+    snapshots, pairs, first, last = conn.execute('''
+        SELECT COUNT(*), COUNT(DISTINCT event_id || '_' || provider_id),
+               MIN(captured_at), MAX(captured_at)
+        FROM odds_snapshots
+    ''').fetchone()
+    conn.close()
+    print(f"{snapshots} snapshots of {pairs} lines")
+    if snapshots:
+        print(f"  {first} to {last} UTC")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print_history(sys.argv[1])
+    else:
+        print_counts()
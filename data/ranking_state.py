@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Poll-week checkpoints for the rankings ingest: the ranking_weeks table.
+
+One row per poll week already written to rankings, keyed by the week's
+ESPN $ref (.../seasons/2025/types/2/weeks/7/rankings/1) with its season,
+provider, week number and team count. update_rankings.py lists each
+provider's weeks and fetches only the refs missing here, so a daily run
+after a new AP/Coaches poll fetches that one week per provider instead of
+the whole season.
+
+Usage:
+    python3 data/ranking_state.py   # latest stored week per season and provider
+"""
+
+import os
+from db import connect
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def create_ranking_weeks_table(cursor):
+    """Create ranking_weeks and its (season, provider, week) index"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ranking_weeks (
+            ref TEXT PRIMARY KEY,
+            season TEXT NOT NULL,
+            provider_id TEXT,
+            provider_name TEXT,
+            week INTEGER,
+            teams INTEGER NOT NULL,
+            fetched_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_ranking_weeks_season_provider
+        ON ranking_weeks(season, provider_id, week)
+    ''')
+
+
+def week_ref(url):
+    """A week's $ref without its query string, as stored in ranking_weeks"""
+    return url.split('?')[0]
+
+
+def stored_weeks(cursor, seasons):
+    """Refs of the poll weeks already written for these seasons"""
+    seasons = [str(season) for season in seasons]
+    return {
+        row[0] for row in cursor.execute(
+            f"SELECT ref FROM ranking_weeks WHERE season IN ({','.join('?' * len(seasons))})", seasons
+        )
+    }
+
+
+def latest_weeks(cursor, seasons=None):
+    """{(season, provider_id): (provider_name, latest week)} already stored"""
+    sql = '''
+        SELECT season, provider_id, MAX(provider_name), MAX(week) FROM ranking_weeks
+        {where} GROUP BY season, provider_id
+    '''
+    if seasons is None:
+        rows = cursor.execute(sql.format(where=''))
+    else:
+        seasons = [str(season) for season in seasons]
+        rows = cursor.execute(sql.format(where=f"WHERE season IN ({','.join('?' * len(seasons))})"), seasons)
+    return {(season, provider_id): (name, week) for season, provider_id, name, week in rows}
+
+
+def record_weeks(cursor, weeks):
+    """Record written poll weeks: (ref, season, provider_id, provider_name, week, teams) tuples"""
+    cursor.executemany('''
+        INSERT OR REPLACE INTO ranking_weeks (ref, season, provider_id, provider_name, week, teams)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', weeks)
+
+
+def print_latest():
+    conn = connect(get_db_path())
+    latest = latest_weeks(conn.cursor())
+    conn.close()
+    if not latest:
+        print("No poll weeks recorded yet (python3 data/update_rankings.py fetches them)")
+        return
+    print(f"{'Season':<8} {'Provider':<10} {'Name':<28} {'Latest week':>11}")
+    for (season, provider_id), (name, week) in sorted(latest.items()):
+        print(f"{season:<8} {provider_id or '':<10} {name or '':<28} {week if week is not None else '':>11}")
+
+
+if __name__ == "__main__":
+    print_latest()
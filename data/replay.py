@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Re-parse archived game summaries into the database, one process per core.
+
+Runs update_games.fetch_and_write_games() in replay mode (ESPN_REPLAY=1),
+so summaries come from the response archive (response_archive.py) instead
+of ESPN, and its parse stage spreads them over --workers processes. Use it
+after fixing a bug in get_game_stats() instead of refetching the season.
+
+Any other script replays the same way without this wrapper, on one core:
+    ESPN_REPLAY=1 python3 data/get_rankings.py
+
+Usage:
+    python3 data/replay.py [--workers N] [EVENT_ID ...]   # default: every archived summary
+"""
+
+import os
+import sys
+import time
+import argparse
+from urllib.parse import parse_qs, urlsplit
+
+# Set before update_games imports the ESPN engine
+os.environ['ESPN_REPLAY'] = '1'
+
+from response_archive import ResponseArchive, DEFAULT_ARCHIVE_PATH
+from update_games import fetch_and_write_games, SUMMARY_URL
+from migrate import migrate
+from cache_invalidation import game_patterns, invalidate_patterns
+
+
+def archived_event_ids(archive_path):
+    """Event ids of every archived game summary"""
+    archive = ResponseArchive(archive_path)
+    try:
+        keys = archive.keys(SUMMARY_URL + '?')
+    finally:
+        archive.close()
+    event_ids = []
+    for key in keys:
+        event_ids.extend(parse_qs(urlsplit(key).query).get('event', []))
+    return event_ids
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-parse archived game summaries")
+    parser.add_argument('event_ids', nargs='*', help="Events to re-parse (default: every archived summary)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Parsing processes (default: one per core)")
+    args = parser.parse_args()
+
+    archive_path = os.getenv('ESPN_ARCHIVE_PATH') or DEFAULT_ARCHIVE_PATH
+    if not os.path.exists(os.path.join(archive_path, 'index.db')):
+        sys.exit(f"No archive at {archive_path} (set ESPN_ARCHIVE_PATH while fetching to create one)")
+
+    event_ids = args.event_ids or archived_event_ids(archive_path)
+    print(f"Re-parsing {len(event_ids)} games from {archive_path} with {args.workers} workers...")
+    migrate(verbose=False)
+    start = time.time()
+    totals = fetch_and_write_games(event_ids, verbose=False, resume=False, parse_workers=args.workers)
+    duration = time.time() - start
+
+    print(f"✓ {totals['games_added']} games in {duration:.1f}s ({totals['games_added'] / max(duration, 1e-9):.0f}/s)")
+    if totals['incomplete']:
+        print(f"  ⓘ {totals['incomplete']} games not completed when archived (skipped)")
+    if totals['errors']:
+        print(f"  ⚠ {totals['errors']} not in the archive or failed to parse (see python3 data/ingest_state.py)")
+
+    invalidate_patterns(game_patterns(totals['season_teams'], totals['dates'], totals['event_ids']))
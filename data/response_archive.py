@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Archive of raw ESPN responses for offline re-parsing.
+
+With ESPN_ARCHIVE_PATH set, espn_client.py stores the body of every 200
+response it receives. Bodies are content-addressed: each is saved once
+under its SHA-256, compressed with zstd when the zstandard package is
+installed and gzip otherwise, so re-fetching an unchanged summary adds an
+index row but no new object. An index.db next to the objects maps each
+request (URL plus sorted params, the same key response_cache.py uses) to the
+digest of its latest body.
+
+    espn_archive/
+        index.db
+        objects/3f/3fa9c1....json.zst
+
+With ESPN_REPLAY=1 as well, espn_client.py answers every request from the
+archive instead of the network (a 404 for anything never archived), so any
+ingest script re-parses what it fetched before at disk speed. Objects are
+written atomically and never change, so several replaying processes can
+read the archive at once; replay.py fans a re-parse out over all cores.
+
+Usage:
+    python3 data/response_archive.py                 # request, object and byte counts
+    python3 data/response_archive.py --list PREFIX   # archived requests whose URL starts with PREFIX
+"""
+
+import os
+import sys
+import gzip
+import time
+import hashlib
+import argparse
+import tempfile
+import threading
+import importlib.util
+from urllib.parse import urlencode
+
+from db import connect
+
+DEFAULT_ARCHIVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'espn_archive')
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 6
+
+if importlib.util.find_spec('zstandard') is not None:
+    import zstandard
+else:
+    zstandard = None
+
+
+def request_key(url, params=None):
+    """URL plus its parameters in a stable order"""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+
+def compress(body):
+    """(extension, compressed bytes) with the best codec available"""
+    if zstandard is not None:
+        return 'zst', zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    return 'gz', gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def decompress(extension, data):
+    if extension == 'zst':
+        if zstandard is None:
+            raise RuntimeError("Archive object is zstd-compressed; install the zstandard package to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class ResponseArchive:
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_ARCHIVE_PATH
+        self.stored = 0
+        self.deduplicated = 0
+        self.replayed = 0
+        self.missing = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.join(self.path, 'objects'), exist_ok=True)
+            self._conn = connect(os.path.join(self.path, 'index.db'), check_same_thread=False)
+            self._conn.executescript('''
+                CREATE TABLE IF NOT EXISTS objects (
+                    digest TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS requests (
+                    key TEXT PRIMARY KEY,
+                    digest TEXT NOT NULL REFERENCES objects(digest),
+                    fetched_at REAL NOT NULL
+                );
+            ''')
+            self._conn.commit()
+        return self._conn
+
+    def _object_path(self, digest, codec):
+        return os.path.join(self.path, 'objects', digest[:2], f"{digest}.json.{codec}")
+
+    def store(self, url, params, body):
+        """Archive a response body (bytes) for a request; returns its digest"""
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            known = self._connect().execute(
+                "SELECT 1 FROM objects WHERE digest = ?", (digest,)
+            ).fetchone()
+
+        if known:
+            self.deduplicated += 1
+            codec = stored_size = None
+        else:
+            # Compress and write outside the lock; the rename makes the object appear whole
+            codec, data = compress(body)
+            stored_size = len(data)
+            path = self._object_path(digest, codec)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+            self.stored += 1
+
+        with self._lock:
+            conn = self._connect()
+            if not known:
+                conn.execute(
+                    "INSERT OR IGNORE INTO objects (digest, codec, size, stored_size) VALUES (?, ?, ?, ?)",
+                    (digest, codec, len(body), stored_size)
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO requests (key, digest, fetched_at) VALUES (?, ?, ?)",
+                (request_key(url, params), digest, time.time())
+            )
+            conn.commit()
+        return digest
+
+    def load(self, url, params=None):
+        """The latest archived body (bytes) for a request, or None"""
+        with self._lock:
+            row = self._connect().execute('''
+                SELECT o.digest, o.codec FROM requests r JOIN objects o ON o.digest = r.digest
+                WHERE r.key = ?
+            ''', (request_key(url, params),)).fetchone()
+        if row is None:
+            self.missing += 1
+            return None
+        digest, codec = row
+        with open(self._object_path(digest, codec), 'rb') as f:
+            data = f.read()
+        self.replayed += 1
+        return decompress(codec, data)
+
+    def keys(self, prefix=''):
+        """Archived request keys starting with prefix, in order"""
+        with self._lock:
+            return [row[0] for row in self._connect().execute(
+                "SELECT key FROM requests WHERE key >= ? AND key < ? ORDER BY key",
+                (prefix, prefix + '\U0010ffff')
+            )]
+
+    def summary(self):
+        """(requests, objects, raw bytes, stored bytes)"""
+        with self._lock:
+            conn = self._connect()
+            requests = conn.execute("SELECT COUNT(*) FROM requests").fetchone()[0]
+            objects, size, stored_size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM objects"
+            ).fetchone()
+        return requests, objects, size, stored_size
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def print_summary(archive):
+    requests, objects, size, stored_size = archive.summary()
+    print(f"Archive: {archive.path}")
+    print(f"  {requests} requests, {objects} distinct responses")
+    if size:
+        print(f"  {size / 1e6:.1f} MB of JSON stored in {stored_size / 1e6:.1f} MB "
+              f"({size / max(stored_size, 1):.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Raw ESPN response archive")
+    parser.add_argument('--list', metavar='PREFIX', help="List archived requests whose URL starts with PREFIX")
+    args = parser.parse_args()
+
+    archive = ResponseArchive(os.getenv('ESPN_ARCHIVE_PATH') or DEFAULT_ARCHIVE_PATH)
+    if not os.path.exists(os.path.join(archive.path, 'index.db')):
+        sys.exit(f"No archive at {archive.path} (set ESPN_ARCHIVE_PATH while fetching to create one)")
+    if args.list is not None:
+        for key in archive.keys(args.list):
+            print(key)
+    else:
+        print_summary(archive)
+    archive.close()
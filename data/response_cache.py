@@ -0,0 +1,146 @@
+"""
+Local cache of ESPN JSON responses with HTTP revalidation.
+
+Responses are kept in a small SQLite file next to the database (not in
+ncaab.db, which the API serves) together with their ETag and Last-Modified
+validators. A cached response younger than `max_age` is returned without a
+request; an older one is revalidated with If-None-Match / If-Modified-Since,
+so an unchanged resource costs a 304 instead of a full download.
+
+    from response_cache import get_json
+
+    data = await get_json(url, params=params, max_age=30 * 86400)
+
+The cache file defaults to data/espn_cache.db; set ESPN_CACHE_PATH to move
+it, or ESPN_CACHE_PATH= (empty) to disable caching.
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+from collections import Counter
+from db import connect
+from espn_client import espn
+from response_archive import request_key
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'espn_cache.db')
+
+
+class ResponseCache:
+    def __init__(self, path=None):
+        self.path = path
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = connect(self.path, check_same_thread=False)
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            ''')
+            self._conn.commit()
+        return self._conn
+
+    def lookup(self, key):
+        """(etag, last_modified, body, fetched_at) for a key, or None"""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT etag, last_modified, body, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+    def store(self, key, etag, last_modified, body):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, last_modified, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, etag, last_modified, body, time.time())
+            )
+            conn.commit()
+
+    def touch(self, key):
+        """Mark a revalidated entry as fresh again"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+
+    def counts(self):
+        """(fresh hits, 304 revalidations, full downloads) so far"""
+        return self.hits, self.revalidated, self.misses
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+async def get_json(url, params=None, max_age=0, cache=None, tally=None):
+    """
+    GET a JSON resource through the response cache.
+
+    Args:
+        max_age: Seconds a cached response is used without asking ESPN
+                 (0 to always revalidate)
+        cache: ResponseCache to use (default: the shared one; None when
+               caching is disabled)
+        tally: collections.Counter to add this request's outcome to ('fresh',
+               'revalidated' or 'downloaded'); the cache's own counts are
+               shared by every stage running in the process
+
+    Raises:
+        httpx.HTTPStatusError: on an error response
+    """
+    cache = cache or response_cache
+    tally = tally if tally is not None else Counter()
+    if cache is None:
+        response = await espn.get(url, params=params)
+        response.raise_for_status()
+        tally['downloaded'] += 1
+        return response.json()
+
+    # The cache's SQLite I/O runs in a worker thread, off the event loop
+    key = request_key(url, params)
+    cached = await asyncio.to_thread(cache.lookup, key)
+    headers = {}
+    if cached:
+        etag, last_modified, body, fetched_at = cached
+        if max_age and time.time() - fetched_at < max_age:
+            cache.hits += 1
+            tally['fresh'] += 1
+            return json.loads(body)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    response = await espn.get(url, params=params, headers=headers)
+    if response.status_code == 304 and cached:
+        cache.revalidated += 1
+        tally['revalidated'] += 1
+        await asyncio.to_thread(cache.touch, key)
+        return json.loads(cached[2])
+
+    response.raise_for_status()
+    cache.misses += 1
+    tally['downloaded'] += 1
+    await asyncio.to_thread(
+        cache.store, key, response.headers.get('ETag'), response.headers.get('Last-Modified'), response.text
+    )
+    return response.json()
+
+
+# Shared cache for the ingest scripts (None if ESPN_CACHE_PATH is set empty)
+_cache_path = os.getenv('ESPN_CACHE_PATH', DEFAULT_CACHE_PATH)
+response_cache = ResponseCache(_cache_path) if _cache_path else None
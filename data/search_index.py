@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Full-text search index for players and teams (SQLite FTS5).
+
+players_search and teams_search index names, locations and nicknames; their
+rowid is the numeric ESPN id, so a player or team is re-indexed by rowid
+without scanning. The ingest scripts call sync_search_index for the rows
+they write (INSERT OR REPLACE does not fire delete triggers, so triggers
+cannot keep an FTS table in sync here).
+
+Each also has a <table>_spelling copy of its terms under a trigram
+tokenizer; the API looks misspelled words up in it to find close terms for
+typo-tolerant search. A full re-index reloads it; syncing a few rows only
+adds and drops the terms that changed.
+
+Usage:
+    python3 data/search_index.py            # indexed row and term counts
+    python3 data/search_index.py --rebuild  # re-index every player and team
+"""
+
+import sys
+import os
+from db import connect
+
+# (source table, FTS table, indexed columns); the first column ranks highest
+SEARCH_TABLES = [
+    ('players', 'players_search', ['displayName', 'firstName', 'lastName']),
+    ('teams', 'teams_search', ['displayName', 'location', 'nickname', 'abbreviation']),
+]
+
+# Only numeric ESPN ids can be FTS rowids
+NUMERIC_ID = "id NOT GLOB '*[^0-9]*' AND id != ''"
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def create_search_tables(cursor):
+    """Create the FTS5 tables, their term views and spelling tables"""
+    for _, fts_table, columns in SEARCH_TABLES:
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                {', '.join(columns)},
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+        ''')
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}_terms
+            USING fts5vocab({fts_table}, 'row')
+        ''')
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}_spelling
+            USING fts5(term, tokenize = 'trigram')
+        ''')
+
+
+def indexed_terms(cursor, fts_table):
+    """Every term currently in an FTS table's index"""
+    return {row[0] for row in cursor.execute(f"SELECT term FROM {fts_table}_terms")}
+
+
+def refresh_spelling(cursor, fts_table, before=None):
+    """
+    Bring a spelling table in line with the terms currently indexed.
+
+    With before (the indexed_terms ahead of a partial re-index) only the
+    terms added or dropped since are written; otherwise it is reloaded.
+    """
+    if before is None:
+        cursor.execute(f"DELETE FROM {fts_table}_spelling")
+        cursor.execute(f"INSERT INTO {fts_table}_spelling (term) SELECT term FROM {fts_table}_terms")
+        return
+
+    after = indexed_terms(cursor, fts_table)
+    dropped = sorted(before - after)
+    for start in range(0, len(dropped), 500):
+        batch = dropped[start:start + 500]
+        cursor.execute(
+            f"DELETE FROM {fts_table}_spelling WHERE term IN ({','.join('?' * len(batch))})", batch
+        )
+    cursor.executemany(
+        f"INSERT INTO {fts_table}_spelling (term) VALUES (?)", [(term,) for term in sorted(after - before)]
+    )
+
+
+def index_rows(cursor, table, ids=None):
+    """
+    Re-index rows of players or teams (every row when ids is None) and
+    refresh the table's spelling terms (see refresh_spelling).
+
+    Returns:
+        Number of rows indexed
+    """
+    _, fts_table, columns = next(entry for entry in SEARCH_TABLES if entry[0] == table)
+    select = f"SELECT CAST(id AS INTEGER), {', '.join(columns)} FROM {table} WHERE {NUMERIC_ID}"
+
+    if ids is None:
+        cursor.execute(f"DELETE FROM {fts_table}")
+        cursor.execute(f"INSERT INTO {fts_table} (rowid, {', '.join(columns)}) {select}")
+        indexed = cursor.rowcount
+        refresh_spelling(cursor, fts_table)
+        return indexed
+
+    ids = [str(id_) for id_ in ids if str(id_).isdigit()]
+    if not ids:
+        return 0
+    before = indexed_terms(cursor, fts_table)
+    indexed = 0
+    for start in range(0, len(ids), 500):
+        batch = ids[start:start + 500]
+        placeholders = ','.join('?' * len(batch))
+        cursor.execute(f"DELETE FROM {fts_table} WHERE rowid IN ({placeholders})", [int(i) for i in batch])
+        cursor.execute(
+            f"INSERT INTO {fts_table} (rowid, {', '.join(columns)}) {select} AND id IN ({placeholders})",
+            batch
+        )
+        indexed += cursor.rowcount
+    refresh_spelling(cursor, fts_table, before)
+    return indexed
+
+
+def sync_search_index(cursor, team_ids=(), player_ids=()):
+    """
+    Re-index the teams and players just written (the caller commits).
+
+    Rows that no longer exist are dropped from the index.
+    """
+    if team_ids:
+        index_rows(cursor, 'teams', team_ids)
+    if player_ids:
+        index_rows(cursor, 'players', player_ids)
+
+
+def rebuild_search_index(cursor):
+    """Re-index every player and team"""
+    return {table: index_rows(cursor, table) for table, _, _ in SEARCH_TABLES}
+
+
+def print_counts():
+    conn = connect(get_db_path())
+    for table, fts_table, _ in SEARCH_TABLES:
+        rows = conn.execute(f"SELECT COUNT(*) FROM {fts_table}").fetchone()[0]
+        terms = conn.execute(f"SELECT COUNT(*) FROM {fts_table}_terms").fetchone()[0]
+        print(f"  {table:<8} {rows:>7} rows, {terms:>6} terms")
+    conn.close()
+
+
+if __name__ == "__main__":
+    if '--rebuild' in sys.argv:
+        conn = connect(get_db_path())
+        cursor = conn.cursor()
+        create_search_tables(cursor)
+        counts = rebuild_search_index(cursor)
+        conn.commit()
+        conn.close()
+        print(f"✓ Indexed {counts['players']} players and {counts['teams']} teams")
+    else:
+        print_counts()
@@ -1,25 +1,16 @@
-import sqlite3
+from db import connect
+from indexes import create_route_indexes
 
 def setup_indexes_and_logging():
     """Add database indexes for performance and create update_log table"""
-    conn = sqlite3.connect('data/ncaab.db')
+    conn = connect('data/ncaab.db')
     cursor = conn.cursor()
 
     print("Creating indexes...")
 
-    # Create indexes for common queries
-    indexes = [
-        "CREATE INDEX IF NOT EXISTS idx_games_date ON games(date)",
-        "CREATE INDEX IF NOT EXISTS idx_games_season ON games(season_year)",
-        "CREATE INDEX IF NOT EXISTS idx_team_seasons_season ON team_seasons(season)",
-        "CREATE INDEX IF NOT EXISTS idx_conferences_season ON conferences(season)",
-        "CREATE INDEX IF NOT EXISTS idx_predictions_event ON predictions(event_id)",
-        "CREATE INDEX IF NOT EXISTS idx_odds_event ON odds(event_id)",
-    ]
-
-    for index_sql in indexes:
-        cursor.execute(index_sql)
-        print(f"  ✓ {index_sql.split('idx_')[1].split(' ON')[0]}")
+    # Indexes for the API's queries (see indexes.py)
+    for name in create_route_indexes(cursor):
+        print(f"  ✓ {name}")
 
     print("\nCreating update_log table...")
 
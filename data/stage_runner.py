@@ -0,0 +1,176 @@
+"""
+Small dependency-graph runner for the update jobs.
+
+Each Stage names the stages it needs; a stage starts as soon as all of its
+dependencies have finished, so independent stages run concurrently in
+threads. They all fetch through the process-wide espn client, which keeps
+one connection pool, concurrency cap and rate limit however many stages
+are in flight.
+
+    stages = [
+        Stage('games', lambda results: update_games_daily()),
+        Stage('odds', lambda results: update_odds()),
+        Stage('report', lambda results: report(results['games']), deps=('games',)),
+    ]
+    outcomes = run_stages(stages)
+
+A stage whose dependency failed is skipped; dependencies that were not
+selected (see select_stages) are treated as satisfied. Every stage's wall
+clock time and outcome is recorded in update_log.
+"""
+
+import time
+import traceback
+import concurrent.futures
+
+from db import connect
+
+OK = 'ok'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+class Stage:
+    def __init__(self, name, func, deps=()):
+        """
+        Args:
+            name: Stage name, used by --only/--skip and in update_log
+            func: func(results) -> result, where results maps each
+                  finished dependency's name to what it returned
+            deps: Names of stages that must finish first
+        """
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+
+
+class StageOutcome:
+    def __init__(self, status, result=None, error=None, started=0.0, duration=0.0):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.started = started
+        self.duration = duration
+
+
+def select_stages(stages, only=None, skip=None):
+    """
+    Stages to run given --only/--skip name lists, in their original order.
+
+    Raises:
+        ValueError: on an unknown stage name
+    """
+    names = [stage.name for stage in stages]
+    unknown = [name for name in (only or []) + (skip or []) if name not in names]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)} (choose from {', '.join(names)})")
+    return [
+        stage for stage in stages
+        if (not only or stage.name in only) and stage.name not in (skip or [])
+    ]
+
+
+def check_graph(stages):
+    """Raise ValueError on duplicate names or a dependency cycle"""
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage: {stage.name}")
+        by_name[stage.name] = stage
+
+    visiting, done = set(), set()
+
+    def visit(name, path):
+        if name in done or name not in by_name:
+            return
+        if name in visiting:
+            raise ValueError(f"Stage dependency cycle: {' -> '.join(path + [name])}")
+        visiting.add(name)
+        for dep in by_name[name].deps:
+            visit(dep, path + [name])
+        visiting.discard(name)
+        done.add(name)
+
+    for name in by_name:
+        visit(name, [])
+
+
+def run_stages(stages, max_workers=None, db_path=None, operation='daily_stage', verbose=True):
+    """
+    Run stages as their dependencies complete.
+
+    Args:
+        stages: Stages to run; dependencies outside this list are ignored
+        max_workers: Stages run at once (default: all of them)
+        db_path: Record each stage in this database's update_log (None to skip)
+        operation: update_log operation for the stage rows
+
+    Returns:
+        Dictionary of stage name -> StageOutcome, in completion order
+    """
+    check_graph(stages)
+    selected = {stage.name for stage in stages}
+    waiting = {stage.name: stage for stage in stages}
+    outcomes = {}
+    run_start = time.time()
+
+    def run(stage, results):
+        started = time.time()
+        try:
+            result = stage.func(results)
+        except Exception as e:
+            if verbose:
+                print(f"\n✗ Stage '{stage.name}' failed: {type(e).__name__}: {e}")
+                traceback.print_exc()
+            return StageOutcome(FAILED, error=e, started=started - run_start,
+                                duration=time.time() - started)
+        return StageOutcome(OK, result=result, started=started - run_start,
+                            duration=time.time() - started)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers or max(1, len(stages)), thread_name_prefix='stage'
+    ) as executor:
+        running = {}
+        while waiting or running:
+            # Start (or skip) every stage whose dependencies have all finished
+            for name, stage in list(waiting.items()):
+                deps = [dep for dep in stage.deps if dep in selected]
+                if any(dep not in outcomes for dep in deps):
+                    continue
+                del waiting[name]
+                if any(outcomes[dep].status != OK for dep in deps):
+                    outcomes[name] = StageOutcome(SKIPPED)
+                    if verbose:
+                        print(f"\n- Stage '{name}' skipped (a dependency did not complete)")
+                    continue
+                results = {dep: outcomes[dep].result for dep in deps}
+                running[executor.submit(run, stage, results)] = name
+
+            if not running:
+                continue
+            finished, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in finished:
+                outcomes[running.pop(future)] = future.result()
+
+    if db_path:
+        log_stages(db_path, outcomes, operation)
+    return outcomes
+
+
+def log_stages(db_path, outcomes, operation):
+    """One update_log row per stage with its wall-clock duration"""
+    conn = connect(db_path)
+    cursor = conn.cursor()
+    cursor.executemany('''
+        INSERT INTO update_log (table_name, operation, records_added, records_updated,
+                                api_calls, duration_seconds, error_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', [
+        (name, f"{operation}:{outcome.status}", 0, 0, 0, outcome.duration,
+         0 if outcome.status == OK else 1)
+        for name, outcome in outcomes.items()
+    ])
+    conn.commit()
+    conn.close()
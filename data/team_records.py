@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Materialized team_season_records table: one row per (season, team).
+
+The API reads W/L, conference W/L, home/away splits and points for/against
+from this table instead of scanning games on every request.
+update_games.write_game_rows keeps it current for the seasons and teams it
+writes; run this script to backfill or rebuild it from scratch.
+
+Usage:
+    python3 data/team_records.py [SEASON ...]
+
+With no arguments every season is rebuilt.
+"""
+
+import sys
+import os
+import time
+
+from db import connect
+
+# One row per (team, game), filtered to the requested keys in both arms
+TEAM_GAMES_SQL = '''
+    SELECT season_year, home_team_id AS team_id, home_team_conference_slug AS conference_slug,
+           event_status_completed AS completed, is_conference_competition AS is_conference,
+           home_team_winner AS won, home_team_score AS score, away_team_score AS opponent_score,
+           1 AS is_home
+    FROM games WHERE {home_filter}
+    UNION ALL
+    SELECT season_year, away_team_id AS team_id, away_team_conference_slug AS conference_slug,
+           event_status_completed AS completed, is_conference_competition AS is_conference,
+           away_team_winner AS won, away_team_score AS score, home_team_score AS opponent_score,
+           0 AS is_home
+    FROM games WHERE {away_filter}
+'''
+
+REBUILD_SQL = '''
+    INSERT OR REPLACE INTO team_season_records (season, team_id, conference_slug, games, wins, losses,
+        conference_wins, conference_losses, home_wins, home_losses, away_wins, away_losses,
+        points_for, points_against, updated_at)
+    SELECT season_year, team_id, MAX(conference_slug),
+        SUM(completed = 1),
+        SUM(completed = 1 AND won = 1),
+        SUM(completed = 1 AND COALESCE(won, 0) != 1),
+        SUM(completed = 1 AND is_conference = 1 AND won = 1),
+        SUM(completed = 1 AND is_conference = 1 AND COALESCE(won, 0) != 1),
+        SUM(completed = 1 AND is_home = 1 AND won = 1),
+        SUM(completed = 1 AND is_home = 1 AND COALESCE(won, 0) != 1),
+        SUM(completed = 1 AND is_home = 0 AND won = 1),
+        SUM(completed = 1 AND is_home = 0 AND COALESCE(won, 0) != 1),
+        SUM(CASE WHEN completed = 1 THEN COALESCE(score, 0) ELSE 0 END),
+        SUM(CASE WHEN completed = 1 THEN COALESCE(opponent_score, 0) ELSE 0 END),
+        CURRENT_TIMESTAMP
+    FROM ({team_games})
+    WHERE team_id IS NOT NULL
+    GROUP BY season_year, team_id
+'''
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def create_team_season_records_table(cursor):
+    """Create team_season_records and its conference lookup index"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS team_season_records (
+            season INTEGER,
+            team_id TEXT,
+            conference_slug TEXT,
+            games INTEGER,
+            wins INTEGER,
+            losses INTEGER,
+            conference_wins INTEGER,
+            conference_losses INTEGER,
+            home_wins INTEGER,
+            home_losses INTEGER,
+            away_wins INTEGER,
+            away_losses INTEGER,
+            points_for INTEGER,
+            points_against INTEGER,
+            updated_at TEXT,
+            PRIMARY KEY (season, team_id),
+            FOREIGN KEY (season) REFERENCES seasons(year),
+            FOREIGN KEY (team_id) REFERENCES teams(id)
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_team_season_records_conference
+        ON team_season_records(season, conference_slug)
+    ''')
+
+
+def update_team_season_records(cursor, season_teams):
+    """
+    Recompute records in place for the given (season, team_id) pairs.
+
+    Called after games are written so only the touched rows change.
+    Returns the number of (season, team) rows refreshed.
+    """
+    create_team_season_records_table(cursor)
+
+    season_teams = {(season, team_id) for season, team_id in season_teams
+                    if season is not None and team_id is not None}
+    if not season_teams:
+        return 0
+
+    # Refresh one season at a time so each statement stays an indexed range scan
+    by_season = {}
+    for season, team_id in season_teams:
+        by_season.setdefault(season, set()).add(str(team_id))
+
+    for season, team_ids in by_season.items():
+        team_ids = sorted(team_ids)
+        placeholders = ', '.join('?' * len(team_ids))
+        team_games = TEAM_GAMES_SQL.format(
+            home_filter=f"season_year = ? AND home_team_id IN ({placeholders})",
+            away_filter=f"season_year = ? AND away_team_id IN ({placeholders})"
+        )
+        cursor.execute(
+            f"DELETE FROM team_season_records WHERE season = ? AND team_id IN ({placeholders})",
+            [season, *team_ids]
+        )
+        cursor.execute(
+            REBUILD_SQL.format(team_games=team_games),
+            [season, *team_ids, season, *team_ids]
+        )
+
+    return len(season_teams)
+
+
+def season_teams_for_games(games_data):
+    """(season, team_id) pairs touched by a batch of game dicts"""
+    pairs = set()
+    for g in games_data:
+        pairs.add((g.get('season_year'), g.get('home_team_id')))
+        pairs.add((g.get('season_year'), g.get('away_team_id')))
+    return pairs
+
+
+def rebuild_records(cursor, seasons=None):
+    """
+    Rebuild team_season_records from games on an open cursor (the caller
+    commits). Every season is rebuilt if seasons is None.
+
+    Returns the number of (season, team) rows written.
+    """
+    create_team_season_records_table(cursor)
+
+    if seasons:
+        placeholders = ', '.join('?' * len(seasons))
+        team_games = TEAM_GAMES_SQL.format(
+            home_filter=f"season_year IN ({placeholders})",
+            away_filter=f"season_year IN ({placeholders})"
+        )
+        cursor.execute(f"DELETE FROM team_season_records WHERE season IN ({placeholders})", seasons)
+        cursor.execute(REBUILD_SQL.format(team_games=team_games), [*seasons, *seasons])
+    else:
+        team_games = TEAM_GAMES_SQL.format(home_filter="1 = 1", away_filter="1 = 1")
+        cursor.execute("DELETE FROM team_season_records")
+        cursor.execute(REBUILD_SQL.format(team_games=team_games))
+    return cursor.rowcount
+
+
+def rebuild_team_season_records(seasons=None, verbose=True):
+    """
+    Rebuild team_season_records from games.
+
+    Args:
+        seasons: Optional list of season years; rebuilds everything if None
+        verbose: Print progress messages
+
+    Returns:
+        Number of (season, team) rows written
+    """
+    start_time = time.time()
+
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    rows = rebuild_records(cursor, seasons)
+    conn.commit()
+    conn.close()
+
+    if verbose:
+        print(f"✓ Rebuilt {rows} team-season records in {time.time() - start_time:.1f} seconds")
+
+    return rows
+
+
+if __name__ == "__main__":
+    seasons = [int(arg) for arg in sys.argv[1:]] or None
+    rebuild_team_season_records(seasons=seasons)
@@ -1,14 +1,30 @@
 #!/usr/bin/env python3
 """
 Daily update script for NCAA Basketball database.
-Runs games, predictions, and odds updates.
+Runs the games, predictions, odds, rankings and rosters stages, each of which
+then invalidates the API response cache for the seasons, dates, teams, games
+and players it changed.
+
+Stages run as a dependency graph (see stage_runner.py): predictions and odds
+only read upcoming game IDs that are already in the games table, and
+rankings and rosters only fetch poll weeks and athletes that are new or
+changed (see update_rankings.py and update_rosters.py), so all five run
+concurrently, sharing the ESPN client's connection pool and rate limit.
+The schema is migrated once before any stage starts, so concurrent stages
+never race to apply the same migration. Each stage's wall-clock time is
+recorded in update_log. Once they finish, a statistics stage re-ANALYZEs
+the database so the API's query plans keep up with the tables' growth
+(see indexes.py).
 
 Usage:
-    python3 data/update_daily.py [--days N] [--quiet]
+    python3 data/update_daily.py [--days N] [--only STAGES] [--skip STAGES] [--quiet]
 
 Arguments:
-    --days N    Number of days to look back for games (default: 7)
-    --quiet     Suppress verbose output
+    --days N         Number of days to look back for games (default: 7)
+    --only STAGES    Comma-separated stages to run (games, predictions, odds, rankings,
+                     rosters, statistics)
+    --skip STAGES    Comma-separated stages to leave out
+    --quiet          Suppress verbose output
 """
 
 import sys
@@ -17,6 +33,15 @@ from datetime import datetime
 from update_games import update_games_daily
 from update_predictions import update_predictions
 from update_odds import update_odds
+from update_rankings import update_rankings
+from update_rosters import update_rosters
+from cache_invalidation import (
+    game_patterns, odds_patterns, rankings_patterns, roster_patterns, invalidate_patterns
+)
+from stage_runner import Stage, OK, select_stages, run_stages
+from migrate import migrate
+from indexes import refresh_statistics
+from db import connect
 
 def print_header():
     """Print script header"""
@@ -25,32 +50,110 @@ def print_header():
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
 
-def print_summary(games_stats, predictions_stats, odds_stats, total_duration):
+def build_stages(days_lookback, verbose):
+    """The daily stages; each invalidates the cache entries it affected"""
+    def games(results):
+        stats = update_games_daily(days_lookback=days_lookback, verbose=verbose)
+        invalidate_patterns(
+            game_patterns(stats['season_teams'], stats['dates'], stats['event_ids']),
+            verbose=verbose
+        )
+        return stats
+
+    def predictions(results):
+        stats = update_predictions(verbose=verbose)
+        invalidate_patterns(odds_patterns(stats['event_ids']), verbose=verbose)
+        return stats
+
+    def odds(results):
+        stats = update_odds(verbose=verbose)
+        invalidate_patterns(odds_patterns(stats['event_ids']), verbose=verbose)
+        return stats
+
+    def rankings(results):
+        stats = update_rankings(verbose=verbose)
+        invalidate_patterns(rankings_patterns(stats['seasons']), verbose=verbose)
+        return stats
+
+    def rosters(results):
+        stats = update_rosters(verbose=verbose)
+        invalidate_patterns(
+            roster_patterns(stats['season'], stats['team_ids'], stats['player_ids']),
+            verbose=verbose
+        )
+        return stats
+
+    def statistics(results):
+        start = time.time()
+        conn = connect()
+        refresh_statistics(conn.cursor())
+        conn.commit()
+        conn.close()
+        return {'api_calls': 0, 'duration_seconds': time.time() - start}
+
+    return [
+        Stage('games', games),
+        Stage('predictions', predictions),
+        Stage('odds', odds),
+        Stage('rankings', rankings),
+        Stage('rosters', rosters),
+        Stage('statistics', statistics, deps=('games', 'predictions', 'odds', 'rankings', 'rosters')),
+    ]
+
+def print_summary(outcomes, total_duration):
     """Print summary of all updates"""
     print("\n" + "=" * 60)
     print("UPDATE SUMMARY")
     print("=" * 60)
 
-    print("\nGames & Boxscores:")
-    print(f"  Games added: {games_stats['games_added']}")
-    print(f"  API calls: {games_stats['api_calls']}")
-    print(f"  Duration: {games_stats['duration_seconds']:.1f}s")
-    if games_stats['errors'] > 0:
-        print(f"  Errors: {games_stats['errors']}")
-
-    print("\nPredictions:")
-    print(f"  Predictions added: {predictions_stats['predictions_added']}")
-    print(f"  API calls: {predictions_stats['api_calls']}")
-    print(f"  Duration: {predictions_stats['duration_seconds']:.1f}s")
-
-    print("\nOdds:")
-    print(f"  Odds entries added: {odds_stats['odds_added']}")
-    print(f"  API calls: {odds_stats['api_calls']}")
-    print(f"  Duration: {odds_stats['duration_seconds']:.1f}s")
-
-    total_calls = (games_stats['api_calls'] +
-                   predictions_stats['api_calls'] +
-                   odds_stats['api_calls'])
+    stats = {name: outcome.result for name, outcome in outcomes.items() if outcome.status == OK}
+
+    if 'games' in stats:
+        games_stats = stats['games']
+        print("\nGames & Boxscores:")
+        print(f"  Games added: {games_stats['games_added']}")
+        print(f"  API calls: {games_stats['api_calls']}")
+        print(f"  Duration: {games_stats['duration_seconds']:.1f}s")
+        if games_stats['errors'] > 0:
+            print(f"  Errors: {games_stats['errors']}")
+
+    if 'predictions' in stats:
+        predictions_stats = stats['predictions']
+        print("\nPredictions:")
+        print(f"  Predictions added: {predictions_stats['predictions_added']}")
+        print(f"  API calls: {predictions_stats['api_calls']}")
+        print(f"  Duration: {predictions_stats['duration_seconds']:.1f}s")
+
+    if 'odds' in stats:
+        odds_stats = stats['odds']
+        print("\nOdds:")
+        print(f"  Odds entries added: {odds_stats['odds_added']}")
+        print(f"  Line changes recorded: {odds_stats['snapshots_added']}")
+        print(f"  API calls: {odds_stats['api_calls']}")
+        print(f"  Duration: {odds_stats['duration_seconds']:.1f}s")
+
+    if 'rankings' in stats:
+        rankings_stats = stats['rankings']
+        print("\nRankings:")
+        print(f"  Poll weeks added: {rankings_stats['weeks_added']}")
+        print(f"  Rankings added: {rankings_stats['rankings_added']}")
+        print(f"  API calls: {rankings_stats['api_calls']}")
+        print(f"  Duration: {rankings_stats['duration_seconds']:.1f}s")
+
+    if 'rosters' in stats:
+        rosters_stats = stats['rosters']
+        print("\nRosters:")
+        print(f"  Player seasons added: {rosters_stats['players_added']}")
+        print(f"  Player seasons updated: {rosters_stats['players_updated']}")
+        print(f"  Players refreshed: {rosters_stats['athletes_refreshed']}")
+        print(f"  API calls: {rosters_stats['api_calls']}")
+        print(f"  Duration: {rosters_stats['duration_seconds']:.1f}s")
+
+    print("\nStages:")
+    for name, outcome in outcomes.items():
+        print(f"  {name:<12} {outcome.status:<8} started +{outcome.started:5.1f}s  took {outcome.duration:.1f}s")
+
+    total_calls = sum(stage_stats['api_calls'] for stage_stats in stats.values())
 
     print("\nTotals:")
     print(f"  Total API calls: {total_calls}")
@@ -60,6 +163,17 @@ def print_summary(games_stats, predictions_stats, odds_stats, total_duration):
     print(f"Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60 + "\n")
 
+def stage_list_arg(flag):
+    """Comma-separated stage names following a flag, or None"""
+    if flag not in sys.argv:
+        return None
+    try:
+        value = sys.argv[sys.argv.index(flag) + 1]
+    except IndexError:
+        print(f"Error: {flag} requires a comma-separated list of stages")
+        sys.exit(1)
+    return [name.strip() for name in value.split(',') if name.strip()]
+
 def main():
     """Main update function"""
     # Parse command line arguments
@@ -77,29 +191,35 @@ def main():
     if '--quiet' in sys.argv:
         verbose = False
 
+    try:
+        stages = select_stages(
+            build_stages(days_lookback, verbose),
+            only=stage_list_arg('--only'),
+            skip=stage_list_arg('--skip')
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
     start_time = time.time()
 
     if verbose:
         print_header()
+        print(f"Stages: {', '.join(stage.name for stage in stages) or '(none)'}")
 
     try:
-        # 1. Update games and boxscores
-        games_stats = update_games_daily(days_lookback=days_lookback, verbose=verbose)
-
-        # 2. Update predictions
-        predictions_stats = update_predictions(verbose=verbose)
-
-        # 3. Update odds
-        odds_stats = update_odds(verbose=verbose)
+        # The stages run concurrently, so none of them migrates the schema
+        migrate(verbose=verbose)
+        outcomes = run_stages(stages, db_path='data/ncaab.db', verbose=verbose)
 
         # Calculate total duration
         total_duration = time.time() - start_time
 
         # Print summary
         if verbose:
-            print_summary(games_stats, predictions_stats, odds_stats, total_duration)
+            print_summary(outcomes, total_duration)
 
-        return 0
+        return 0 if all(outcome.status == OK for outcome in outcomes.values()) else 1
 
     except KeyboardInterrupt:
         print("\n\nUpdate interrupted by user")
@@ -1,13 +1,11 @@
-import sqlite3
 import pandas as pd
-import httpx
-import concurrent.futures
-import threading
+from db import connect
+from espn_client import espn
 
 
 ## Get New Seasons
 # conn = sqlite3.connect('data/ncaab.db')
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 cursor = conn.cursor()
 
 # Fetch pairs of season and team_id
@@ -17,7 +15,7 @@ old_seasons = [x[0] for x in old_seasons]
 conn.close()
 
 
-def get_season_urls():
+async def get_season_urls():
     url = "https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons"
     params = {
         "limit": 1000,
@@ -25,14 +23,13 @@ def get_season_urls():
         'region' : 'us'
     }
 
-    response = httpx.get(url, params=params)
+    response = await espn.get(url, params=params)
     response.raise_for_status()
     data = response.json()
     
-    for season in data.get('items',[]):
-        yield season.get('$ref')
+    return [season.get('$ref') for season in data.get('items',[])]
 
-season_urls = list(get_season_urls())
+season_urls = espn.run(get_season_urls())
 
 new_seasons = [x.split('/')[-1].split('?')[0] for x in season_urls]
 
@@ -43,8 +40,8 @@ new_seasons = [str(x) for x in new_seasons]
 updated_seasons = list(set(new_seasons) - set(old_seasons))
 updated_season_urls = [f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{season}?lang=en&region=us" for season in updated_seasons]
 
-def get_season_data(season_url):
-    response = httpx.get(season_url)
+async def get_season_data(season_url):
+    response = await espn.get(season_url)
     response.raise_for_status()
     data = response.json()
     base_season_dict = {
@@ -67,22 +64,18 @@ def get_season_data(season_url):
         season_types.append(season_type_dict)
     return base_season_dict, season_types
 
-# Multithreaded execution
+# Parallel execution through the shared ESPN client
 all_base_seasons = []
 all_season_types = []
 
-# Adjust max_workers as needed (default is usually number of processors * 5)
-with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-    # map returns results in the same order as the input list
-    results = executor.map(get_season_data, updated_season_urls)
-    
-    for base_season_dict, season_types in results:
-        all_base_seasons.append(base_season_dict)
-        all_season_types.extend(season_types)
+# map returns results in the same order as the input list
+for base_season_dict, season_types in espn.map(get_season_data, updated_season_urls):
+    all_base_seasons.append(base_season_dict)
+    all_season_types.extend(season_types)
 
 
 # Connect to database and insert/update data
-conn = sqlite3.connect('data/ncaab.db')
+conn = connect('data/ncaab.db')
 cursor = conn.cursor()
 
 # Insert/update seasons data
@@ -1,14 +1,33 @@
-import httpx
-import sqlite3
 import json
-import concurrent.futures
-import threading
 import time
 import os
+import multiprocessing
+import concurrent.futures
+from collections import deque
+from db import connect
 from discover_completed_games import discover_new_completed_games
-
-# Thread-local storage for httpx clients
-_thread_local = threading.local()
+from team_records import update_team_season_records
+from migrate import migrate
+from boxscore_stats import add_player_numeric_stats, add_team_numeric_stats, add_team_stat
+from espn_mappings import GAME, TEAM_BOXSCORE, PLAYER_BOXSCORE
+from espn_client import espn
+from chunked_writer import ChunkedWriter
+from ingest_state import DONE, INCOMPLETE, ERROR, seed_events, events_to_fetch, record_status, tracked
+
+SUMMARY_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/summary"
+
+# Summaries are parsed in this many processes; the default leaves a core
+# for the fetch loop and the writer (0 parses inline)
+PARSE_WORKERS = int(os.getenv('INGEST_PARSE_WORKERS', max((os.cpu_count() or 1) - 1, 0)))
+# Summaries queued per parse worker before the fetch side waits
+PARSE_WINDOW = 8
+# Smaller batches (daily updates, live games going final) parse inline,
+# where starting the pool would cost more than it saves
+PARSE_POOL_MIN_EVENTS = 100
+
+# Positions in GAME rows
+GAME_ID, GAME_SEASON, GAME_DATE = GAME.index('id'), GAME.index('season_year'), GAME.index('date')
+GAME_HOME_TEAM, GAME_AWAY_TEAM = GAME.index('home_team_id'), GAME.index('away_team_id')
 
 def get_db_path():
     """Get database path that works from project root or data/ directory"""
@@ -20,238 +39,255 @@ def get_db_path():
     else:
         raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
 
-def get_client():
-    """Get or create a thread-local httpx client"""
-    if not hasattr(_thread_local, 'client'):
-        _thread_local.client = httpx.Client(timeout=30.0)
-    return _thread_local.client
-
-def get_game_stats(event_id):
+async def fetch_game_summary(event_id):
     """
-    Fetch complete game data including boxscores from ESPN API.
-    Returns (game_info_dict, team_boxscores_list, player_boxscores_list)
+    I/O stage: the raw summary JSON (bytes) for an event. Fetch errors are
+    raised (wrap with ingest_state.tracked to record them)
     """
-    url = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/summary"
     params = {
         'event': event_id,
         'limit': 250
     }
 
-    try:
-        response = get_client().get(url=url, params=params)
-        response.raise_for_status()
-        data = response.json()
-    except Exception as e:
-        with open('data/event_errors.log', 'a') as f:
-            f.write(f"Error fetching event {event_id}: {e}\n")
-        return None, None, None
+    response = await espn.get(SUMMARY_URL, params=params)
+    response.raise_for_status()
+    return response.content
 
+async def get_game_stats(event_id):
+    """
+    Fetch complete game data including boxscores from ESPN API.
+    Returns (game row, team boxscore rows, player boxscore rows), as
+    parse_game_summary() does; fetch errors are raised (wrap with
+    ingest_state.tracked to record them)
+    """
+    return game_rows_from_summary(event_id, json.loads(await fetch_game_summary(event_id)))
+
+def game_rows_from_summary(event_id, data):
+    """
+    (game row, team boxscore rows, player boxscore rows) from a parsed
+    summary, or (None, [], []) for a game that isn't complete. Rows are in
+    the column order of the espn_mappings GAME, TEAM_BOXSCORE and
+    PLAYER_BOXSCORE mappings.
+    """
     game_header = data.get('header', {})
     base_comp_info = game_header.get('competitions', [{}])[0]
 
     # Double-check completion status
     if not base_comp_info.get('status', {}).get('type', {}).get('completed'):
-        return None, None, None
-
-    # Extract game info
-    game_info_dict = {
-        'id': game_header.get('id'),
-        'uid': game_header.get('uid'),
-        'season_year': game_header.get('season', {}).get('year'),
-        'season_type': game_header.get('season', {}).get('type'),
-        'week': game_header.get('week'),
-        'game_note': game_header.get('gameNote'),
-        'timeValid': game_header.get('timeValid'),
-        'date': base_comp_info.get('date'),
-        'is_neutral_site': base_comp_info.get('neutralSite'),
-        'is_conference_competition': base_comp_info.get('conferenceCompetition'),
-        'event_status_id': base_comp_info.get('status', {}).get('type', {}).get('id'),
-        'event_status_name': base_comp_info.get('status', {}).get('type', {}).get('name'),
-        'event_status_state': base_comp_info.get('status', {}).get('type', {}).get('state'),
-        'event_status_completed': base_comp_info.get('status', {}).get('type', {}).get('completed'),
-        'event_status_description': base_comp_info.get('status', {}).get('type', {}).get('description'),
-        'event_status_detail': base_comp_info.get('status', {}).get('type', {}).get('detail'),
-        'event_status_short_detail': base_comp_info.get('status', {}).get('type', {}).get('shortDetail'),
-        'event_tournament_id': base_comp_info.get('tournamentId'),
-        'venue_id': data.get('gameInfo', {}).get('venue', {}).get('id'),
-        'attendance': data.get('gameInfo', {}).get('attendance'),
-        'officials': data.get('gameInfo', {}).get('officials')
+        return None, [], []
+
+    competitors = {
+        competitor.get('homeAway'): competitor for competitor in base_comp_info.get('competitors', [])
     }
+    game = GAME.extract(
+        game_header, base_comp_info, data.get('gameInfo'), competitors.get('home'), competitors.get('away')
+    )
+
+    # Team boxscores
+    team_rows = []
+    for team in data.get('boxscore', {}).get('teams', []):
+        stats = {}
+        for stat in team.get('statistics', []):
+            add_team_stat(stats, stat.get('name'), stat.get('displayValue'))
+        team_rows.append(TEAM_BOXSCORE.extract(event_id, team, add_team_numeric_stats(stats)))
 
-    # Extract team info from competitors
-    for competitor in base_comp_info.get('competitors', []):
-        home_away = competitor.get('homeAway')
-        game_info_dict.update({
-            f'{home_away}_team_id': competitor.get('id'),
-            f'{home_away}_team_winner': competitor.get('winner'),
-            f'{home_away}_team_score': competitor.get('score'),
-            f'{home_away}_linescores': competitor.get('linescores', []),
-            f'{home_away}_team_records': competitor.get('record', []),
-            f'{home_away}_team_guid': competitor.get('team', {}).get('guid'),
-            f'{home_away}_team_uid': competitor.get('team', {}).get('uid'),
-            f'{home_away}_team_location': competitor.get('team', {}).get('location'),
-            f'{home_away}_team_name': competitor.get('team', {}).get('name'),
-            f'{home_away}_team_abbreviation': competitor.get('team', {}).get('abbreviation'),
-            f'{home_away}_team_nickname': competitor.get('team', {}).get('nickname'),
-            f'{home_away}_team_displayName': competitor.get('team', {}).get('displayName'),
-            f'{home_away}_team_color': competitor.get('team', {}).get('color'),
-            f'{home_away}_team_alternate_color': competitor.get('team', {}).get('alternateColor'),
-            f'{home_away}_team_logos': competitor.get('team', {}).get('logos', []),
-            f'{home_away}_team_conference_id': competitor.get('team', {}).get('groups', {}).get('id'),
-            f'{home_away}_team_conference_slug': competitor.get('team', {}).get('groups', {}).get('slug')
-        })
-
-    # Extract team boxscores
-    team_boxscores = data.get('boxscore', {}).get('teams', [])
-    team_boxscores_df = []
-
-    for team in team_boxscores:
-        team_dict = {
-            'event_team_id': f"{event_id}_{team.get('team', {}).get('id')}",
-            'event_id': event_id,
-            'team_id': team.get('team', {}).get('id'),
-            'home_away': team.get('homeAway')
-        }
+    # Player boxscores: each athlete's stats line up with the team's labels
+    player_rows = []
+    for team in data.get('boxscore', {}).get('players', []):
+        team_id = team.get('team', {}).get('id')
+        statistics = team.get('statistics', [{}])[0]
+        stat_labels = statistics.get('labels', [])
 
-        for stat in team.get('statistics', []):
-            stat_key = stat.get('name').replace("-", "_")
-            team_dict.update({
-                stat_key: stat.get('displayValue')
-            })
+        for athlete in statistics.get('athletes', []):
+            stats = add_player_numeric_stats(dict(zip(stat_labels, athlete.get('stats', []))))
+            player_rows.append(PLAYER_BOXSCORE.extract(event_id, team_id, athlete, stats))
 
-        team_boxscores_df.append(team_dict)
+    return game, team_rows, player_rows
 
-    # Extract player boxscores
-    player_boxscores = data.get('boxscore', {}).get('players', [])
-    player_boxscores_df = []
+def game_status(stats, error):
+    """ingest_state status for a tracked get_game_stats() or parse_game_summary() result"""
+    if error is not None:
+        return ERROR
+    game_info, team_stats, _ = stats
+    if game_info is None or len(team_stats) == 0:
+        return INCOMPLETE
+    return DONE
 
-    for team in player_boxscores:
-        team_id = team.get('team', {}).get('id')
-        stat_labels = team.get('statistics', [{}])[0].get('labels', [])
-
-        for athlete in team.get('statistics', [{}])[0].get('athletes', []):
-            athlete_id = athlete.get('athlete', {}).get('id')
-
-            athlete_dict = {
-                'event_athlete_id': f"{event_id}_{athlete_id}",
-                'event_id': event_id,
-                'athlete_id': athlete_id,
-                'team_id': team_id,
-                'athlete_name': athlete.get('athlete', {}).get('displayName'),
-                'athlete_headshot': athlete.get('athlete', {}).get('headshot', {}).get('href'),
-                'athlete_jersey': athlete.get('athlete', {}).get('jersey'),
-                'athlete_position_name': athlete.get('athlete', {}).get('position', {}).get('name'),
-                'athlete_position_abbreviation': athlete.get('athlete', {}).get('position', {}).get('abbreviation'),
-                'athlete_position_display_name': athlete.get('athlete', {}).get('position', {}).get('displayName'),
-                'athlete_starter': athlete.get('starter'),
-                'athlete_did_not_play': athlete.get('didNotPlay'),
-                'athlete_ejected': athlete.get('ejected')
-            }
-
-            for index, stat_value in enumerate(athlete.get('stats', [])):
-                athlete_dict.update({
-                    stat_labels[index]: stat_value
-                })
-
-            player_boxscores_df.append(athlete_dict)
-
-    return game_info_dict, team_boxscores_df, player_boxscores_df
-
-def insert_game_data(games_data, team_boxscores_data, player_boxscores_data):
-    """Insert game data into database"""
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+def parse_game_summary(event_id, body):
+    """
+    CPU stage: raw summary bytes to (game row, team boxscore rows, player
+    boxscore rows), or (None, [], []) for a game that isn't complete.
+
+    Runs in a parse worker process, so it hands back flat row tuples ready
+    for executemany(), which are much cheaper to pickle back to the parent
+    than nested dicts.
+    """
+    return game_rows_from_summary(event_id, json.loads(body))
+
+def parse_tracked(event_id, body, error):
+    """parse_game_summary() for a tracked fetch result; parse errors are recorded like fetch errors"""
+    if error is not None:
+        return event_id, None, error
+    try:
+        return event_id, parse_game_summary(event_id, body), None
+    except Exception as e:
+        return event_id, None, str(e) or type(e).__name__
+
+def parse_summaries(fetched, workers=None):
+    """
+    Turn tracked (event_id, body, error) fetch results into tracked
+    (event_id, rows, error) parse results, in input order.
+
+    With workers, summaries are parsed in a process pool, so parsing is no
+    longer serialized by the GIL with the fetch loop and the writer; at most
+    PARSE_WINDOW summaries per worker are queued ahead of the consumer. With
+    0 workers they are parsed inline.
+    """
+    workers = PARSE_WORKERS if workers is None else workers
+    if not workers:
+        for event_id, body, error in fetched:
+            yield parse_tracked(event_id, body, error)
+        return
+
+    # spawn, not fork: this process is running the fetch engine's and the writer's threads
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+    ) as pool:
+        pending = deque()
+        for event_id, body, error in fetched:
+            pending.append(pool.submit(parse_tracked, event_id, body, error))
+            if len(pending) >= workers * PARSE_WINDOW:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def season_teams_for_rows(game_rows):
+    """(season, team_id) pairs touched by a batch of game rows"""
+    pairs = set()
+    for row in game_rows:
+        pairs.add((row[GAME_SEASON], row[GAME_HOME_TEAM]))
+        pairs.add((row[GAME_SEASON], row[GAME_AWAY_TEAM]))
+    return pairs
+
+def fetch_and_write_games(event_ids, chunk_size=None, verbose=True, resume=True, parse_workers=None):
+    """
+    Fetch games and stream the complete ones to the database.
+
+    The fetch engine downloads raw summaries (I/O stage, ESPN_MAX_CONCURRENCY
+    requests in flight), parse_summaries() turns them into rows
+    (CPU stage, parse_workers processes) and a ChunkedWriter commits every
+    chunk_size games, so only the IDs, dates and season/team pairs of what
+    was written are kept in memory. Every attempt is recorded in
+    ingest_state in the same transaction as the games it wrote. The schema
+    must already be migrated (update_daily.py does it before its stages).
+
+    Args:
+        resume: Skip events ingest_state already has as done (or as
+                failed too many times)
+        parse_workers: Parse processes (default INGEST_PARSE_WORKERS for
+                       batches of PARSE_POOL_MIN_EVENTS or more; 0 parses
+                       in this process)
 
-    # Insert games
-    games_tuples = [
-        (g['id'], g['uid'], g['season_year'], g['season_type'], g['week'], g.get('game_note'),
-         g.get('timeValid'), g.get('date'), g.get('is_neutral_site'), g.get('is_conference_competition'),
-         g.get('event_status_id'), g.get('event_status_name'), g.get('event_status_state'),
-         g.get('event_status_completed'), g.get('event_status_description'), g.get('event_status_detail'),
-         g.get('event_status_short_detail'), g.get('event_tournament_id'), g.get('venue_id'),
-         g.get('attendance'), json.dumps(g.get('officials')),
-         g.get('home_team_id'), g.get('home_team_winner'), g.get('home_team_score'),
-         json.dumps(g.get('home_linescores')), json.dumps(g.get('home_team_records')),
-         g.get('home_team_guid'), g.get('home_team_uid'), g.get('home_team_location'),
-         g.get('home_team_name'), g.get('home_team_abbreviation'), g.get('home_team_nickname'),
-         g.get('home_team_displayName'), g.get('home_team_color'), g.get('home_team_alternate_color'),
-         json.dumps(g.get('home_team_logos')), g.get('home_team_conference_id'), g.get('home_team_conference_slug'),
-         g.get('away_team_id'), g.get('away_team_winner'), g.get('away_team_score'),
-         json.dumps(g.get('away_linescores')), json.dumps(g.get('away_team_records')),
-         g.get('away_team_guid'), g.get('away_team_uid'), g.get('away_team_location'),
-         g.get('away_team_name'), g.get('away_team_abbreviation'), g.get('away_team_nickname'),
-         g.get('away_team_displayName'), g.get('away_team_color'), g.get('away_team_alternate_color'),
-         json.dumps(g.get('away_team_logos')), g.get('away_team_conference_id'), g.get('away_team_conference_slug'))
-        for g in games_data
-    ]
-
-    cursor.executemany('''
-        INSERT OR REPLACE INTO games (id, uid, season_year, season_type, week, game_note, timeValid, date,
-        is_neutral_site, is_conference_competition, event_status_id, event_status_name, event_status_state,
-        event_status_completed, event_status_description, event_status_detail, event_status_short_detail,
-        event_tournament_id, venue_id, attendance, officials, home_team_id, home_team_winner, home_team_score,
-        home_linescores, home_team_records, home_team_guid, home_team_uid, home_team_location, home_team_name,
-        home_team_abbreviation, home_team_nickname, home_team_displayName, home_team_color, home_team_alternate_color,
-        home_team_logos, home_team_conference_id, home_team_conference_slug, away_team_id, away_team_winner,
-        away_team_score, away_linescores, away_team_records, away_team_guid, away_team_uid, away_team_location,
-        away_team_name, away_team_abbreviation, away_team_nickname, away_team_displayName, away_team_color,
-        away_team_alternate_color, away_team_logos, away_team_conference_id, away_team_conference_slug)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', games_tuples)
-
-    # Insert team boxscores
-    team_boxscores_tuples = [
-        (tb['event_team_id'], tb['event_id'], tb['team_id'], tb.get('home_away'),
-         tb.get('fieldGoalsMade'), tb.get('fieldGoalsAttempted'), tb.get('fieldGoalPct'),
-         tb.get('threePointFieldGoalsMade'), tb.get('threePointFieldGoalsAttempted'), tb.get('threePointFieldGoalPct'),
-         tb.get('freeThrowsMade'), tb.get('freeThrowsAttempted'), tb.get('freeThrowPct'),
-         tb.get('totalRebounds'), tb.get('offensiveRebounds'), tb.get('defensiveRebounds'),
-         tb.get('assists'), tb.get('steals'), tb.get('blocks'), tb.get('turnovers'),
-         tb.get('teamTurnovers'), tb.get('totalTurnovers'), tb.get('technicalFouls'),
-         tb.get('flagrantFouls'), tb.get('fouls'), tb.get('largestLead'))
-        for tb in team_boxscores_data
-    ]
-
-    cursor.executemany('''
-        INSERT OR REPLACE INTO team_boxscores (event_team_id, event_id, team_id, home_away,
-        fieldGoalsMade, fieldGoalsAttempted, fieldGoalPct, threePointFieldGoalsMade,
-        threePointFieldGoalsAttempted, threePointFieldGoalPct, freeThrowsMade, freeThrowsAttempted,
-        freeThrowPct, totalRebounds, offensiveRebounds, defensiveRebounds, assists, steals, blocks,
-        turnovers, teamTurnovers, totalTurnovers, technicalFouls, flagrantFouls, fouls, largestLead)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', team_boxscores_tuples)
-
-    # Insert player boxscores
-    player_boxscores_tuples = [
-        (pb['event_athlete_id'], pb['event_id'], pb['athlete_id'], pb['team_id'],
-         pb.get('athlete_name'), pb.get('athlete_headshot'), pb.get('athlete_jersey'),
-         pb.get('athlete_position_name'), pb.get('athlete_position_abbreviation'),
-         pb.get('athlete_position_display_name'), pb.get('athlete_starter'),
-         pb.get('athlete_did_not_play'), pb.get('athlete_ejected'),
-         pb.get('MIN'), pb.get('FG'), pb.get('3PT'), pb.get('FT'),
-         pb.get('OREB'), pb.get('DREB'), pb.get('REB'), pb.get('AST'),
-         pb.get('STL'), pb.get('BLK'), pb.get('TO'), pb.get('PF'), pb.get('PTS'))
-        for pb in player_boxscores_data
-    ]
-
-    cursor.executemany('''
-        INSERT OR REPLACE INTO player_boxscores (event_athlete_id, event_id, athlete_id, team_id,
-        athlete_name, athlete_headshot, athlete_jersey, athlete_position_name, athlete_position_abbreviation,
-        athlete_position_display_name, athlete_starter, athlete_did_not_play, athlete_ejected, MIN, FG, "3PT",
-        FT, OREB, DREB, REB, AST, STL, BLK, "TO", PF, PTS)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', player_boxscores_tuples)
+    Returns:
+        Dictionary with counts and the written event IDs, dates and
+        (season, team_id) pairs
+    """
+    written = {
+        'games_added': 0,
+        'team_boxscores': 0,
+        'player_boxscores': 0,
+        'fetched': 0,
+        'skipped': 0,
+        'errors': 0,
+        'incomplete': 0,
+        'season_teams': set(),
+        'dates': set(),
+        'event_ids': set()
+    }
 
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    seed_events(cursor, event_ids)
+    to_fetch = events_to_fetch(cursor, event_ids) if resume else list(event_ids)
     conn.commit()
     conn.close()
 
-def update_games(event_ids, verbose=True):
+    written['skipped'] = len(event_ids) - len(to_fetch)
+    written['fetched'] = len(to_fetch)
+    if verbose and written['skipped']:
+        print(f"  ↻ Skipping {written['skipped']} events already ingested (or failed too often)")
+
+    if parse_workers is None and len(to_fetch) < PARSE_POOL_MIN_EVENTS:
+        parse_workers = 0
+    fetched = espn.map(tracked(fetch_game_summary), to_fetch)
+    with ChunkedWriter(get_db_path(), write_game_chunk, chunk_size=chunk_size) as writer:
+        for event_id, rows, error in parse_summaries(fetched, parse_workers):
+            writer.put((event_id, rows, error))
+
+            status = game_status(rows, error)
+            if status == ERROR:
+                written['errors'] += 1
+            elif status == INCOMPLETE:
+                # Skip incomplete games
+                written['incomplete'] += 1
+            else:
+                game, team_rows, player_rows = rows
+                written['games_added'] += 1
+                written['team_boxscores'] += len(team_rows)
+                written['player_boxscores'] += len(player_rows)
+                written['season_teams'] |= season_teams_for_rows([game])
+                if game[GAME_DATE]:
+                    written['dates'].add(game[GAME_DATE][:10])
+                written['event_ids'].add(game[GAME_ID])
+
+    if verbose:
+        print(f"\n✓ Fetched {written['games_added']} complete games")
+        if written['incomplete'] > 0:
+            print(f"  ⓘ {written['incomplete']} games not yet completed (skipped)")
+        if written['errors'] > 0:
+            print(f"  ⚠ {written['errors']} errors (see python3 data/ingest_state.py)")
+        if written['games_added']:
+            print(f"\nWrote to database in {writer.chunks_written} chunk(s) of up to {writer.chunk_size} events")
+            print(f"  ✓ {written['games_added']} games")
+            print(f"  ✓ {written['team_boxscores']} team boxscores")
+            print(f"  ✓ {written['player_boxscores']} player boxscores")
+
+    return written
+
+def write_game_chunk(cursor, results):
+    """
+    ChunkedWriter callback: results are tracked (event_id, rows, error)
+    tuples from parse_summaries(). Complete games are written and every
+    attempt is recorded.
+    """
+    complete = [rows for _, rows, error in results if game_status(rows, error) == DONE]
+    write_game_rows(
+        cursor,
+        [game for game, _, _ in complete],
+        [team for _, team_rows, _ in complete for team in team_rows],
+        [player for _, _, player_rows in complete for player in player_rows]
+    )
+    record_status(cursor, [
+        (event_id, game_status(rows, error), error) for event_id, rows, error in results
+    ])
+
+def write_game_rows(cursor, game_rows, team_boxscore_rows, player_boxscore_rows):
+    """Write game and boxscore rows on an open cursor (the caller commits)"""
+    cursor.executemany(GAME.insert_sql, game_rows)
+    cursor.executemany(TEAM_BOXSCORE.insert_sql, team_boxscore_rows)
+    cursor.executemany(PLAYER_BOXSCORE.insert_sql, player_boxscore_rows)
+
+    # Keep materialized team records in step with the games just written
+    update_team_season_records(cursor, season_teams_for_rows(game_rows))
+
+def update_games(event_ids, verbose=True, chunk_size=None):
     """
     Fetch and insert games for a specific list of event IDs.
 
     Args:
         event_ids: List of ESPN event IDs to fetch
         verbose: Print progress messages
+        chunk_size: Games committed per transaction (default INGEST_CHUNK_SIZE)
 
     Returns:
         Dictionary with update statistics
@@ -265,59 +301,27 @@ def update_games(event_ids, verbose=True):
             'games_added': 0,
             'api_calls': 0,
             'duration_seconds': 0,
-            'errors': 0
+            'errors': 0,
+            'season_teams': set(),
+            'dates': set(),
+            'event_ids': set()
         }
 
     if verbose:
         print(f"\nFetching game data for {len(event_ids)} games...")
 
-    all_games = []
-    all_team_boxscores = []
-    all_player_boxscores = []
-    error_count = 0
-
-    incomplete_count = 0
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        results = executor.map(get_game_stats, event_ids)
-
-        for game_info, team_stats, player_stats in results:
-            if game_info is None:
-                error_count += 1
-            elif len(team_stats) == 0:
-                # Skip incomplete games
-                incomplete_count += 1
-            else:
-                all_games.append(game_info)
-                all_team_boxscores.extend(team_stats)
-                all_player_boxscores.extend(player_stats)
-
-    if verbose:
-        print(f"\n✓ Fetched {len(all_games)} complete games")
-        if incomplete_count > 0:
-            print(f"  ⓘ {incomplete_count} games not yet completed (skipped)")
-        if error_count > 0:
-            print(f"  ⚠ {error_count} errors (see data/event_errors.log)")
-
-    # Insert into database
-    if all_games:
-        if verbose:
-            print(f"\nInserting into database...")
-        insert_game_data(all_games, all_team_boxscores, all_player_boxscores)
-        if verbose:
-            print(f"  ✓ {len(all_games)} games")
-            print(f"  ✓ {len(all_team_boxscores)} team boxscores")
-            print(f"  ✓ {len(all_player_boxscores)} player boxscores")
+    written = fetch_and_write_games(event_ids, chunk_size=chunk_size, verbose=verbose)
 
     duration = time.time() - start_time
 
     # Log the update
-    conn = sqlite3.connect(get_db_path())
+    conn = connect(get_db_path())
     cursor = conn.cursor()
     cursor.execute('''
         INSERT INTO update_log (table_name, operation, records_added, records_updated,
                                 api_calls, duration_seconds, error_count)
         VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', ('games', 'backfill', len(all_games), 0, len(event_ids), duration, error_count))
+    ''', ('games', 'backfill', written['games_added'], 0, written['fetched'], duration, written['errors']))
     conn.commit()
     conn.close()
 
@@ -325,19 +329,24 @@ def update_games(event_ids, verbose=True):
         print(f"\n✓ Games update complete in {duration:.1f} seconds")
 
     return {
-        'games_added': len(all_games),
-        'api_calls': len(event_ids),
+        'games_added': written['games_added'],
+        'api_calls': written['fetched'],
         'duration_seconds': duration,
-        'errors': error_count
+        'errors': written['errors'],
+        # What was written, so callers can invalidate exactly those cache keys
+        'season_teams': written['season_teams'],
+        'dates': written['dates'],
+        'event_ids': written['event_ids']
     }
 
-def update_games_daily(days_lookback=7, verbose=True):
+def update_games_daily(days_lookback=7, verbose=True, chunk_size=None):
     """
     Main function to update games table with new completed games.
 
     Args:
         days_lookback: Number of days to look back for new games
         verbose: Print progress messages
+        chunk_size: Games committed per transaction (default INGEST_CHUNK_SIZE)
 
     Returns:
         Dictionary with update statistics
@@ -357,60 +366,28 @@ def update_games_daily(days_lookback=7, verbose=True):
             'games_added': 0,
             'api_calls': 0,
             'duration_seconds': time.time() - start_time,
-            'errors': 0
+            'errors': 0,
+            'season_teams': set(),
+            'dates': set(),
+            'event_ids': set()
         }
 
-    # 2. Fetch game data in parallel
+    # 2. Fetch game data in parallel, streaming it to the database
     if verbose:
         print(f"\nFetching game data for {len(new_game_ids)} games...")
 
-    all_games = []
-    all_team_boxscores = []
-    all_player_boxscores = []
-    error_count = 0
-
-    incomplete_count = 0
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        results = executor.map(get_game_stats, new_game_ids)
-
-        for game_info, team_stats, player_stats in results:
-            if game_info is None:
-                error_count += 1
-            elif len(team_stats) == 0:
-                # Skip incomplete games
-                incomplete_count += 1
-            else:
-                all_games.append(game_info)
-                all_team_boxscores.extend(team_stats)
-                all_player_boxscores.extend(player_stats)
-
-    if verbose:
-        print(f"\n✓ Fetched {len(all_games)} complete games")
-        if incomplete_count > 0:
-            print(f"  ⓘ {incomplete_count} games not yet completed (skipped)")
-        if error_count > 0:
-            print(f"  ⚠ {error_count} errors (see data/event_errors.log)")
-
-    # 3. Insert into database
-    if all_games:
-        if verbose:
-            print(f"\nInserting into database...")
-        insert_game_data(all_games, all_team_boxscores, all_player_boxscores)
-        if verbose:
-            print(f"  ✓ {len(all_games)} games")
-            print(f"  ✓ {len(all_team_boxscores)} team boxscores")
-            print(f"  ✓ {len(all_player_boxscores)} player boxscores")
+    written = fetch_and_write_games(new_game_ids, chunk_size=chunk_size, verbose=verbose)
 
     duration = time.time() - start_time
 
     # Log the update
-    conn = sqlite3.connect(get_db_path())
+    conn = connect(get_db_path())
     cursor = conn.cursor()
     cursor.execute('''
         INSERT INTO update_log (table_name, operation, records_added, records_updated,
                                 api_calls, duration_seconds, error_count)
         VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', ('games', 'daily_update', len(all_games), 0, len(new_game_ids), duration, error_count))
+    ''', ('games', 'daily_update', written['games_added'], 0, written['fetched'], duration, written['errors']))
     conn.commit()
     conn.close()
 
@@ -418,13 +395,18 @@ def update_games_daily(days_lookback=7, verbose=True):
         print(f"\n✓ Games update complete in {duration:.1f} seconds")
 
     return {
-        'games_added': len(all_games),
-        'api_calls': len(new_game_ids),
+        'games_added': written['games_added'],
+        'api_calls': written['fetched'],
         'duration_seconds': duration,
-        'errors': error_count
+        'errors': written['errors'],
+        # What was written, so callers can invalidate exactly those cache keys
+        'season_teams': written['season_teams'],
+        'dates': written['dates'],
+        'event_ids': written['event_ids']
     }
 
 if __name__ == "__main__":
+    migrate(verbose=False)
     # Test the update function
     stats = update_games_daily(days_lookback=7, verbose=True)
     print(f"\nUpdate Statistics:")
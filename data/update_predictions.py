@@ -1,17 +1,8 @@
 import httpx
-import sqlite3
-import concurrent.futures
-import threading
 import time
-
-# Thread-local storage for httpx clients
-_thread_local = threading.local()
-
-def get_client():
-    """Get or create a thread-local httpx client"""
-    if not hasattr(_thread_local, 'client'):
-        _thread_local.client = httpx.Client(timeout=30.0)
-    return _thread_local.client
+from db import connect
+from espn_client import espn
+from espn_mappings import PREDICTION
 
 def get_eligible_game_ids():
     """
@@ -20,7 +11,7 @@ def get_eligible_game_ids():
     - Games in last 2 days (recently completed - get final predictions)
     - That don't already have predictions
     """
-    conn = sqlite3.connect('data/ncaab.db')
+    conn = connect('data/ncaab.db')
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -34,10 +25,11 @@ def get_eligible_game_ids():
 
     return eligible_ids
 
-def fetch_prediction(event_id):
+async def fetch_prediction(event_id):
     """
     Fetch prediction data for a single event.
-    Returns prediction dict or None if not available.
+    Returns a prediction row (in the column order of espn_mappings.PREDICTION)
+    or None if not available.
     """
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/events/{event_id}/competitions/{event_id}/predictor"
     params = {
@@ -46,37 +38,11 @@ def fetch_prediction(event_id):
     }
 
     try:
-        response = get_client().get(url, params=params)
+        response = await espn.get(url, params=params)
         response.raise_for_status()
         data = response.json()
 
-        prediction_dict = {
-            'event_id': event_id,
-            'name': data.get('name'),
-            'short_name': data.get('shortName')
-        }
-
-        # Extract home team prediction
-        home_team = data.get('homeTeam', {})
-        prediction_dict.update({
-            'homeTeam_team_id': home_team.get('team', {}).get('id'),
-            'homeTeam_gameProjection': home_team.get('gameProjection'),
-            'homeTeam_gameProjection_display': home_team.get('gameProjectionDisplay'),
-            'homeTeam_teamChanceLoss': home_team.get('teamChanceLoss'),
-            'homeTeam_teamChanceLoss_display': home_team.get('teamChanceLossDisplay')
-        })
-
-        # Extract away team prediction
-        away_team = data.get('awayTeam', {})
-        prediction_dict.update({
-            'awayTeam_team_id': away_team.get('team', {}).get('id'),
-            'awayTeam_gameProjection': away_team.get('gameProjection'),
-            'awayTeam_gameProjection_display': away_team.get('gameProjectionDisplay'),
-            'awayTeam_teamChanceLoss': away_team.get('teamChanceLoss'),
-            'awayTeam_teamChanceLoss_display': away_team.get('teamChanceLossDisplay')
-        })
-
-        return prediction_dict
+        return PREDICTION.extract(event_id, data)
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
@@ -96,26 +62,10 @@ def insert_predictions(predictions_data):
     if not predictions_data:
         return
 
-    conn = sqlite3.connect('data/ncaab.db')
+    conn = connect('data/ncaab.db')
     cursor = conn.cursor()
 
-    predictions_tuples = [
-        (p['event_id'], p.get('name'), p.get('short_name'),
-         p.get('homeTeam_team_id'), p.get('homeTeam_gameProjection'),
-         p.get('homeTeam_gameProjection_display'), p.get('homeTeam_teamChanceLoss'),
-         p.get('homeTeam_teamChanceLoss_display'), p.get('awayTeam_team_id'),
-         p.get('awayTeam_gameProjection'), p.get('awayTeam_gameProjection_display'),
-         p.get('awayTeam_teamChanceLoss'), p.get('awayTeam_teamChanceLoss_display'))
-        for p in predictions_data
-    ]
-
-    cursor.executemany('''
-        INSERT OR REPLACE INTO predictions (event_id, name, short_name, homeTeam_team_id,
-        homeTeam_gameProjection, homeTeam_gameProjection_display, homeTeam_teamChanceLoss,
-        homeTeam_teamChanceLoss_display, awayTeam_team_id, awayTeam_gameProjection,
-        awayTeam_gameProjection_display, awayTeam_teamChanceLoss, awayTeam_teamChanceLoss_display)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', predictions_tuples)
+    cursor.executemany(PREDICTION.insert_sql, predictions_data)
 
     conn.commit()
     conn.close()
@@ -142,7 +92,8 @@ def update_predictions(verbose=True):
             'predictions_added': 0,
             'api_calls': 0,
             'duration_seconds': time.time() - start_time,
-            'errors': 0
+            'errors': 0,
+            'event_ids': set()
         }
 
     if verbose:
@@ -152,14 +103,11 @@ def update_predictions(verbose=True):
     all_predictions = []
     not_found_count = 0
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        results = executor.map(fetch_prediction, eligible_ids)
-
-        for prediction in results:
-            if prediction is not None:
-                all_predictions.append(prediction)
-            else:
-                not_found_count += 1
+    for prediction in espn.map(fetch_prediction, eligible_ids):
+        if prediction is not None:
+            all_predictions.append(prediction)
+        else:
+            not_found_count += 1
 
     if verbose:
         print(f"\n✓ Found {len(all_predictions)} predictions")
@@ -175,7 +123,7 @@ def update_predictions(verbose=True):
     duration = time.time() - start_time
 
     # Log the update
-    conn = sqlite3.connect('data/ncaab.db')
+    conn = connect('data/ncaab.db')
     cursor = conn.cursor()
     cursor.execute('''
         INSERT INTO update_log (table_name, operation, records_added, records_updated,
@@ -192,7 +140,8 @@ def update_predictions(verbose=True):
         'predictions_added': len(all_predictions),
         'api_calls': len(eligible_ids),
         'duration_seconds': duration,
-        'errors': 0
+        'errors': 0,
+        'event_ids': {row[PREDICTION.index('event_id')] for row in all_predictions}
     }
 
 if __name__ == "__main__":
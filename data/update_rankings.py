@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Incremental rankings ingest: only poll weeks not written yet are fetched.
+
+A season's provider index (seasons/{season}/rankings) lists its polls (AP
+Top 25, Coaches Poll, ...) and each poll's page lists its weekly $refs.
+Both list pages go through response_cache.py: the index is reused for
+PROVIDER_INDEX_MAX_AGE without a request and poll pages are revalidated
+with their ETag, so a poll with no new week costs a 304. Only the weeks
+missing from ranking_weeks (ranking_state.py) are then fetched, and each is
+recorded in the same transaction as its rows, so a failed week is simply
+retried on the next run.
+
+update_daily.py runs this for the current season; get_rankings.py
+refetches every week of every season.
+
+Usage:
+    python3 data/update_rankings.py [SEASON ...] [--full]   # default: current season
+"""
+
+import sys
+import os
+import time
+import httpx
+from functools import partial
+from collections import Counter
+from db import connect
+from espn_client import espn
+from migrate import migrate
+from ingest_state import tracked
+from response_cache import get_json
+from espn_mappings import RANKING, ref_id
+from ranking_state import week_ref, stored_weeks, latest_weeks, record_weeks
+
+RANKINGS_URL = "https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{season}/rankings"
+RANKINGS_PARAMS = {'lang': 'en', 'region': 'us'}
+
+# A season's polls are settled before it starts, so its index is reused
+# this long (seconds) without asking ESPN
+PROVIDER_INDEX_MAX_AGE = 7 * 86400
+
+# Sections of a poll week, and the ranked_type of their rows
+RANKED_SECTIONS = [('ranks', 'Ranked'), ('others', 'Others'), ('droppedOut', 'Dropped Out')]
+
+team_id_from_ref = ref_id('teams')
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def current_season(cursor):
+    """Latest season in the seasons or games table, or None for an empty database"""
+    cursor.execute('''
+        SELECT MAX(season) FROM (
+            SELECT MAX(CAST(year AS INTEGER)) AS season FROM seasons
+            UNION ALL
+            SELECT MAX(season_year) FROM games
+        )
+    ''')
+    return cursor.fetchone()[0]
+
+
+def ranking_rows(week_data):
+    """Rankings rows for every team in a poll week: ranked, receiving votes and dropped out"""
+    rows = []
+    for section, ranked_type in RANKED_SECTIONS:
+        for ranked in week_data.get(section, []):
+            team_id = team_id_from_ref(ranked.get('team', {}).get('$ref'))
+            if team_id is None:
+                continue
+            rows.append(RANKING.extract(week_data, team_id, ranked, ranked_type))
+    return rows
+
+
+async def get_season_week_refs(season, tally=None):
+    """
+    Week $refs of every poll of a season, from the (cached) list pages.
+    A season whose polls haven't started (404) has none; other errors are
+    raised.
+    """
+    try:
+        index = await get_json(
+            RANKINGS_URL.format(season=season), params=RANKINGS_PARAMS,
+            max_age=PROVIDER_INDEX_MAX_AGE, tally=tally
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return []
+        raise
+
+    poll_refs = [item['$ref'] for item in index.get('items', [])]
+    week_refs = []
+    for poll in await espn.gather(partial(get_json, tally=tally), poll_refs):
+        week_refs.extend(week['$ref'] for week in poll.get('rankings', []) if week.get('$ref'))
+    return week_refs
+
+
+async def get_week(week_url):
+    """A poll week's JSON; poll weeks never change once published, so this skips the cache"""
+    response = await espn.get(week_url)
+    response.raise_for_status()
+    return response.json()
+
+
+def update_rankings(seasons=None, full=False, verbose=True):
+    """
+    Fetch and write the poll weeks of seasons not written yet.
+
+    Args:
+        seasons: Season years to check (default: the current season)
+        full: Refetch every week, written or not
+
+    Returns:
+        Dictionary with update statistics
+    """
+    start_time = time.time()
+
+    if verbose:
+        print("\n=== Updating Rankings ===\n")
+
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    if seasons is None:
+        season = current_season(cursor)
+        seasons = [season] if season is not None else []
+    seasons = [int(season) for season in seasons]
+    written_refs = set() if full or not seasons else stored_weeks(cursor, seasons)
+    latest_before = latest_weeks(cursor, seasons) if seasons else {}
+    conn.close()
+
+    stats = {
+        'rankings_added': 0,
+        'weeks_added': 0,
+        'api_calls': 0,
+        'duration_seconds': 0,
+        'errors': 0,
+        'seasons': set()
+    }
+    if not seasons:
+        if verbose:
+            print("✓ No seasons in the database yet")
+        stats['duration_seconds'] = time.time() - start_time
+        return stats
+
+    if verbose:
+        for (season, _), (name, week) in sorted(latest_before.items()):
+            print(f"  Stored: {season} {name} through week {week}")
+
+    # 1. List every poll's weeks; unchanged list pages come back as 304s
+    lists = Counter()
+    new_weeks = []
+    for season, week_refs, error in espn.map(tracked(partial(get_season_week_refs, tally=lists)), seasons):
+        if error is not None:
+            stats['errors'] += 1
+            if verbose:
+                print(f"  ⚠ Could not list {season} polls: {error}")
+            continue
+        for url in week_refs:
+            if week_ref(url) not in written_refs:
+                written_refs.add(week_ref(url))
+                new_weeks.append((season, url))
+    stats['api_calls'] += lists['revalidated'] + lists['downloaded']
+    if verbose:
+        print(f"  Poll lists: {lists['fresh']} cached, {lists['revalidated']} unchanged (304), "
+              f"{lists['downloaded']} downloaded")
+        print(f"Fetching {len(new_weeks)} new poll weeks...")
+
+    # 2. Fetch only the weeks not written yet
+    rows, weeks = [], []
+    week_seasons = dict((url, season) for season, url in new_weeks)
+    for url, week_data, error in espn.map(tracked(get_week), [url for _, url in new_weeks]):
+        stats['api_calls'] += 1
+        if error is not None:
+            stats['errors'] += 1
+            continue
+        week_rows = ranking_rows(week_data)
+        if not week_rows:
+            # Listed before its teams were filled in; picked up next run
+            continue
+        season = week_data.get('season', {}).get('year') or week_seasons[url]
+        rows.extend(week_rows)
+        weeks.append((
+            week_ref(url), str(season), week_data.get('id'), week_data.get('name'),
+            week_data.get('occurrence', {}).get('number'), len(week_rows)
+        ))
+        stats['seasons'].add(str(season))
+
+    # 3. Write the rows and their weeks together
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    cursor.executemany(RANKING.insert_sql, rows)
+    record_weeks(cursor, weeks)
+    stats['rankings_added'] = len(rows)
+    stats['weeks_added'] = len(weeks)
+    stats['duration_seconds'] = time.time() - start_time
+    cursor.execute('''
+        INSERT INTO update_log (table_name, operation, records_added, records_updated,
+                                api_calls, duration_seconds, error_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', ('rankings', 'full_update' if full else 'daily_update', len(rows), 0,
+          stats['api_calls'], stats['duration_seconds'], stats['errors']))
+    conn.commit()
+    conn.close()
+
+    if verbose:
+        print(f"\n✓ {len(weeks)} poll weeks, {len(rows)} rankings rows")
+        if stats['errors']:
+            print(f"  ⚠ {stats['errors']} errors (retried next run)")
+        print(f"\n✓ Rankings update complete in {stats['duration_seconds']:.1f} seconds")
+
+    return stats
+
+
+if __name__ == "__main__":
+    migrate(verbose=False)
+    args = [arg for arg in sys.argv[1:] if arg != '--full']
+    stats = update_rankings(seasons=[int(season) for season in args] or None, full='--full' in sys.argv)
+    print(f"\nUpdate Statistics:")
+    print(f"  Rankings added: {stats['rankings_added']}")
+    print(f"  Poll weeks added: {stats['weeks_added']}")
+    print(f"  API calls: {stats['api_calls']}")
+    print(f"  Duration: {stats['duration_seconds']:.1f}s")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Incremental roster sync: only new, moved or changed athletes are fetched.
+
+get_players.py fetches every athlete of every team season one by one. This
+lists each team's roster for one season (the current one by default) and
+diffs it against player_seasons, so athlete details are fetched only for:
+
+    new      on a roster but not in player_seasons for the season
+    moved    in player_seasons under a different team
+    changed  the athlete's record in ESPN's active-athletes list (v3,
+             ATHLETES_PAGE_SIZE a page) differs from the players row
+             written from that list last time (current season only)
+
+The active-athletes list is also the batch refresh of the players table:
+rows whose values changed are rewritten and re-indexed for search. Roster
+and list pages go through response_cache.py, so unchanged pages come back
+as 304s. Athletes who left a roster keep their player_seasons row, as with
+get_players.py.
+
+Usage:
+    python3 data/update_rosters.py [SEASON] [--full]   # default: current season
+"""
+
+import sys
+import os
+import time
+import httpx
+from functools import partial
+from collections import Counter
+from db import connect
+from espn_client import espn
+from migrate import migrate
+from ingest_state import tracked
+from response_cache import get_json
+from search_index import sync_search_index
+from espn_mappings import PLAYER, PLAYER_SEASON, ref_id
+
+ROSTER_URL = "https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{season}/teams/{team_id}/athletes"
+ROSTER_PARAMS = {'lang': 'en', 'region': 'us', 'limit': 150}
+ATHLETES_URL = "https://sports.core.api.espn.com/v3/sports/basketball/mens-college-basketball/athletes"
+ATHLETES_PAGE_SIZE = 1000
+
+athlete_id_from_ref = ref_id('athletes')
+
+
+def get_db_path():
+    """Get database path that works from project root or data/ directory"""
+    # Prefer data/ncaab.db as it's the canonical location
+    if os.path.exists('data/ncaab.db'):
+        return 'data/ncaab.db'
+    elif os.path.exists('ncaab.db'):
+        return 'ncaab.db'
+    else:
+        raise FileNotFoundError("Database not found at data/ncaab.db or ncaab.db")
+
+
+def current_season(cursor):
+    """Latest season with teams in team_seasons, or None"""
+    cursor.execute("SELECT MAX(CAST(season AS INTEGER)) FROM team_seasons")
+    return cursor.fetchone()[0]
+
+
+def comparable(row):
+    """
+    A row's values as text, so values read back from SQLite compare equal
+    to the JSON they were written from (185 vs 185.0, 3 vs '3')
+    """
+    return tuple(
+        None if value is None
+        else str(int(value)) if isinstance(value, float) and value.is_integer()
+        else str(value)
+        for value in row
+    )
+
+
+async def get_roster(team_season, tally=None):
+    """{athlete_id: athlete $ref} of a (season, team_id) roster"""
+    season, team_id = team_season
+    data = await get_json(ROSTER_URL.format(season=season, team_id=team_id), params=ROSTER_PARAMS, tally=tally)
+    roster = {}
+    for item in data.get('items', []):
+        athlete_id = athlete_id_from_ref(item.get('$ref'))
+        if athlete_id is not None:
+            roster[athlete_id] = item['$ref']
+    return roster
+
+
+async def get_current_players(tally=None):
+    """players rows for every athlete in ESPN's active-athletes list"""
+    async def get_page(page):
+        params = {'limit': ATHLETES_PAGE_SIZE, 'active': True, 'page': page}
+        return await get_json(ATHLETES_URL, params=params, tally=tally)
+
+    first = await get_page(1)
+    pages = [first] + await espn.gather(get_page, range(2, first.get('pageCount', 1) + 1))
+    return [PLAYER.extract(player) for page in pages for player in page.get('items', [])]
+
+
+async def get_player_info(player_url):
+    response = await espn.get(player_url)
+    response.raise_for_status()
+    data = response.json()
+    season = player_url.split("seasons/")[1].split("/")[0]
+    player_id = player_url.split("athletes/")[1].split("?")[0]
+    return PLAYER_SEASON.extract(season, player_id, data)
+
+
+def update_rosters(season=None, full=False, verbose=True):
+    """
+    Sync one season's rosters into player_seasons.
+
+    Args:
+        season: Season year (default: the latest season in team_seasons)
+        full: Fetch every rostered athlete, changed or not
+
+    Returns:
+        Dictionary with update statistics
+    """
+    start_time = time.time()
+
+    if verbose:
+        print("\n=== Updating Rosters ===\n")
+
+    stats = {
+        'players_added': 0,
+        'players_updated': 0,
+        'athletes_refreshed': 0,
+        'departed': 0,
+        'api_calls': 0,
+        'duration_seconds': 0,
+        'errors': 0,
+        'season': None,
+        'team_ids': set(),
+        'player_ids': set()
+    }
+
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    latest = current_season(cursor)
+    season = str(season or latest or '')
+    stats['season'] = season or None
+    team_ids = [row[0] for row in cursor.execute(
+        "SELECT DISTINCT team_id FROM team_seasons WHERE season = ? AND team_id IS NOT NULL", (season,)
+    )]
+    stored_teams = dict(cursor.execute(
+        "SELECT player_id, team_id FROM player_seasons WHERE season = ?", (season,)
+    ).fetchall())
+    # The active-athletes list only describes the season in progress
+    use_active_list = latest is not None and season == str(latest)
+    stored_players = {}
+    if use_active_list:
+        compared = ', '.join(f'"{column}"' for column in PLAYER.columns)
+        stored_players = {row[0]: comparable(row) for row in cursor.execute(f"SELECT {compared} FROM players")}
+    conn.close()
+
+    if not team_ids:
+        if verbose:
+            print(f"✓ No teams in team_seasons for season {season or '(none)'}")
+        stats['duration_seconds'] = time.time() - start_time
+        return stats
+
+    # 1. Roster membership for every team of the season
+    lists = Counter()
+    roster = {}
+    listed_teams = set()
+    team_seasons = [(season, team_id) for team_id in team_ids]
+    for (_, team_id), team_roster, error in espn.map(tracked(partial(get_roster, tally=lists)), team_seasons):
+        if error is not None:
+            stats['errors'] += 1
+            if verbose:
+                print(f"  ⚠ Could not fetch the roster of team {team_id}: {error}")
+            continue
+        listed_teams.add(team_id)
+        for athlete_id, ref in team_roster.items():
+            roster[athlete_id] = (team_id, ref)
+
+    # 2. Current details of every active athlete; rows that differ from the
+    #    players table are the athletes whose details changed
+    changed_players = []
+    if use_active_list:
+        try:
+            current_players = espn.run(get_current_players(tally=lists))
+        except httpx.HTTPError as e:
+            stats['errors'] += 1
+            current_players = []
+            if verbose:
+                print(f"  ⚠ Could not fetch the active-athletes list: {e}")
+        changed_players = [
+            player for player in current_players
+            if player[0] is not None and stored_players.get(player[0]) != comparable(player)
+        ]
+    changed_ids = {player[0] for player in changed_players}
+
+    stats['api_calls'] += lists['revalidated'] + lists['downloaded']
+    if verbose:
+        print(f"  Roster and athlete lists: {lists['revalidated']} unchanged (304), {lists['downloaded']} downloaded")
+
+    # 3. Diff the rosters against player_seasons
+    to_fetch = []
+    for athlete_id, (team_id, ref) in roster.items():
+        if athlete_id not in stored_teams:
+            stats['players_added'] += 1
+        elif full or stored_teams[athlete_id] != team_id or athlete_id in changed_ids:
+            stats['players_updated'] += 1
+        else:
+            continue
+        to_fetch.append(ref)
+    stats['departed'] = sum(
+        1 for athlete_id, team_id in stored_teams.items()
+        if athlete_id not in roster and team_id in listed_teams
+    )
+
+    if verbose:
+        print(f"{len(roster)} rostered athletes on {len(listed_teams)} teams: "
+              f"{stats['players_added']} new, {stats['players_updated']} moved or changed, "
+              f"{stats['departed']} no longer listed")
+        print(f"Fetching {len(to_fetch)} athletes...")
+
+    # 4. Fetch only those athletes
+    player_seasons = []
+    for _, row, error in espn.map(tracked(get_player_info), to_fetch):
+        stats['api_calls'] += 1
+        if error is not None:
+            stats['errors'] += 1
+            continue
+        player_seasons.append(row)
+
+    # A changed players row is written together with the athlete's
+    # player_seasons row, or alone for an athlete on no roster this season.
+    # Athletes whose details or team roster failed keep the old row, so the
+    # change is seen (and fetched) again next run
+    fetched_ids = {row[PLAYER_SEASON.index('player_id')] for row in player_seasons}
+    changed_players = [
+        player for player in changed_players
+        if player[0] in fetched_ids or (
+            player[0] not in roster
+            and stored_teams.get(player[0]) in listed_teams | {None}
+        )
+    ]
+    # Rosters changed on the athletes' new teams and on any team they left
+    stats['team_ids'] = (
+        {row[PLAYER_SEASON.index('team_id')] for row in player_seasons}
+        | {stored_teams.get(athlete_id) for athlete_id in fetched_ids}
+    ) - {None}
+    stats['player_ids'] = fetched_ids | {player[0] for player in changed_players}
+    stats['athletes_refreshed'] = len(changed_players)
+
+    conn = connect(get_db_path())
+    cursor = conn.cursor()
+    cursor.executemany(PLAYER_SEASON.insert_sql, player_seasons)
+    cursor.executemany(PLAYER.insert_sql, changed_players)
+    sync_search_index(cursor, player_ids=[player[0] for player in changed_players])
+    stats['duration_seconds'] = time.time() - start_time
+    cursor.execute('''
+        INSERT INTO update_log (table_name, operation, records_added, records_updated,
+                                api_calls, duration_seconds, error_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', ('player_seasons', 'full_update' if full else 'daily_update', stats['players_added'],
+          stats['players_updated'], stats['api_calls'], stats['duration_seconds'], stats['errors']))
+    conn.commit()
+    conn.close()
+
+    if verbose:
+        print(f"\n✓ {len(player_seasons)} player-season rows, {len(changed_players)} players refreshed")
+        if stats['errors']:
+            print(f"  ⚠ {stats['errors']} errors (retried next run)")
+        print(f"\n✓ Roster update complete in {stats['duration_seconds']:.1f} seconds")
+
+    return stats
+
+
+if __name__ == "__main__":
+    migrate(verbose=False)
+    args = [arg for arg in sys.argv[1:] if arg != '--full']
+    stats = update_rosters(season=args[0] if args else None, full='--full' in sys.argv)
+    print(f"\nUpdate Statistics:")
+    print(f"  Player seasons added: {stats['players_added']}")
+    print(f"  Player seasons updated: {stats['players_updated']}")
+    print(f"  Players refreshed: {stats['athletes_refreshed']}")
+    print(f"  API calls: {stats['api_calls']}")
+    print(f"  Duration: {stats['duration_seconds']:.1f}s")
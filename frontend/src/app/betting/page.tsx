@@ -6,6 +6,19 @@ import { LoadingSpinner } from '@/components/ui/LoadingSpinner';
 import { ErrorMessage } from '@/components/ui/ErrorMessage';
 import { TrendingUp, AlertCircle } from 'lucide-react';
 
+function formatPrice(price: number) {
+  return `${price > 0 ? '+' : ''}${price}`;
+}
+
+// "Duke -4.5", "Over 142.5", "Duke" (moneyline)
+function betLabel(edge: any) {
+  if (edge.market === 'total') {
+    return `${edge.side === 'over' ? 'Over' : 'Under'} ${edge.line}`;
+  }
+  const team = edge.side === 'home' ? edge.home_team : edge.away_team;
+  return edge.market === 'spread' ? `${team} ${formatPrice(edge.line)}` : team;
+}
+
 export default function BettingPage() {
   const { data: edges, isLoading, error } = useQuery({
     queryKey: ['betting-edges'],
@@ -80,13 +93,13 @@ export default function BettingPage() {
                   <div className="bg-gray-800/50 rounded-lg p-4">
                     <div className="text-xs text-gray-400 mb-1">Our Prediction</div>
                     <div className="text-lg font-semibold text-white">
-                      {edge.recommended_bet === 'home' ? edge.home_team : edge.away_team} {edge.prediction_home_win_pct}%
+                      {betLabel(edge)} {edge.model_pct}%
                     </div>
                   </div>
                   <div className="bg-gray-800/50 rounded-lg p-4">
-                    <div className="text-xs text-gray-400 mb-1">Vegas Implied</div>
+                    <div className="text-xs text-gray-400 mb-1">Vegas Implied (no vig)</div>
                     <div className="text-lg font-semibold text-white">
-                      {edge.recommended_bet === 'home' ? edge.home_team : edge.away_team} {edge.implied_home_win_pct}%
+                      {betLabel(edge)} {edge.market_pct}%
                     </div>
                   </div>
                 </div>
@@ -95,13 +108,13 @@ export default function BettingPage() {
                   <div className="flex items-center justify-between text-sm">
                     <span className="text-gray-400">Recommended Bet:</span>
                     <span className="font-semibold text-green-400 uppercase">
-                      {edge.recommended_bet === 'home' ? edge.home_team : edge.away_team} ML
+                      {betLabel(edge)} {edge.market === 'moneyline' ? 'ML' : ''}
                     </span>
                   </div>
                   <div className="flex items-center justify-between text-sm mt-2">
-                    <span className="text-gray-400">Moneylines:</span>
+                    <span className="text-gray-400">Best Price:</span>
                     <span className="text-white">
-                      {edge.away_team} {edge.away_moneyline > 0 ? '+' : ''}{edge.away_moneyline} / {edge.home_team} {edge.home_moneyline > 0 ? '+' : ''}{edge.home_moneyline}
+                      {formatPrice(edge.price)} at {edge.provider}
                     </span>
                   </div>
                 </div>
@@ -2,6 +2,7 @@
 
 import { useQuery } from '@tanstack/react-query';
 import { gamesApi } from '@/lib/api';
+import { useLiveScores } from '@/lib/live';
 import { GameCard } from '@/components/games/GameCard';
 import { LoadingSpinner } from '@/components/ui/LoadingSpinner';
 import { ErrorMessage } from '@/components/ui/ErrorMessage';
@@ -11,6 +12,7 @@ export default function Home() {
     queryKey: ['games', 'today'],
     queryFn: () => gamesApi.getToday(),
   });
+  useLiveScores();
 
   return (
     <div className="space-y-8">
@@ -2,7 +2,7 @@
 
 import { useState } from 'react';
 import { useQuery } from '@tanstack/react-query';
-import { playersApi } from '@/lib/api';
+import { playersApi, type Page } from '@/lib/api';
 import { LoadingSpinner } from '@/components/ui/LoadingSpinner';
 import { ErrorMessage } from '@/components/ui/ErrorMessage';
 import { Search } from 'lucide-react';
@@ -14,6 +14,7 @@ export default function PlayersPage() {
   const { data: players, isLoading, error } = useQuery({
     queryKey: ['players', search],
     queryFn: () => playersApi.getAll({ search: search || undefined, limit: 100 }),
+    select: (page: Page<any>) => page.items,
   });
 
   return (
@@ -2,7 +2,7 @@
 
 import { useState } from 'react';
 import { useQuery } from '@tanstack/react-query';
-import { teamsApi } from '@/lib/api';
+import { teamsApi, type Page } from '@/lib/api';
 import { LoadingSpinner } from '@/components/ui/LoadingSpinner';
 import { ErrorMessage } from '@/components/ui/ErrorMessage';
 import { Search } from 'lucide-react';
@@ -14,6 +14,7 @@ export default function TeamsPage() {
   const { data: teams, isLoading, error } = useQuery({
     queryKey: ['teams', search],
     queryFn: () => teamsApi.getAll({ search: search || undefined }),
+    select: (page: Page<any>) => page.items,
   });
 
   return (
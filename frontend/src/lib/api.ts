@@ -9,6 +9,12 @@ const api = axios.create({
   },
 });
 
+// List endpoints return one page; pass next_cursor back as `cursor` for the next
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 // Games API
 export const gamesApi = {
   getAll: async (params?: {
@@ -18,7 +24,7 @@ export const gamesApi = {
     conference?: string;
     completed?: boolean;
     limit?: number;
-    offset?: number;
+    cursor?: string;
   }) => {
     const { data } = await api.get('/games', { params });
     return data;
@@ -56,7 +62,7 @@ export const teamsApi = {
     search?: string;
     conference?: string;
     limit?: number;
-    offset?: number;
+    cursor?: string;
   }) => {
     const { data } = await api.get('/teams', { params });
     return data;
@@ -101,7 +107,7 @@ export const playersApi = {
   getAll: async (params?: {
     search?: string;
     limit?: number;
-    offset?: number;
+    cursor?: string;
   }) => {
     const { data } = await api.get('/players', { params });
     return data;
@@ -208,4 +214,19 @@ export const seasonsApi = {
   },
 };
 
+// Search API
+export interface SearchSuggestion {
+  type: 'team' | 'player';
+  id: string;
+  name: string;
+  detail: string | null;
+}
+
+export const searchApi = {
+  autocomplete: async (q: string, limit = 8): Promise<SearchSuggestion[]> => {
+    const { data } = await api.get('/search/autocomplete', { params: { q, limit } });
+    return data;
+  },
+};
+
 export default api;
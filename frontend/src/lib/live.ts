@@ -0,0 +1,31 @@
+'use client';
+
+import { useEffect } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
+import { Game } from '@/lib/types';
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+
+type LiveUpdate = Partial<Game> & { id: string };
+
+// Subscribe to /live/scores and merge score and status deltas into the
+// cached ['games', 'today'] list, so it never needs refetching while open
+export function useLiveScores() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const source = new EventSource(`${API_URL}/api/v1/live/scores`);
+
+    const merge = (event: MessageEvent) => {
+      const updates: LiveUpdate[] = JSON.parse(event.data);
+      const byId = new Map(updates.map((update) => [update.id, update]));
+      queryClient.setQueryData<Game[]>(['games', 'today'], (games) =>
+        games?.map((game) => (byId.has(game.id) ? { ...game, ...byId.get(game.id) } : game))
+      );
+    };
+
+    source.addEventListener('snapshot', merge);
+    source.addEventListener('delta', merge);
+    return () => source.close();
+  }, [queryClient]);
+}